@@ -0,0 +1,154 @@
+"""
+Correctness check and timings for the conflict engine
+
+Usage:
+    python -m benchmarks.bench_conflicts --tasks 100k
+    python -m benchmarks.bench_conflicts --check-only
+
+Seeds a benchmark database, gives a share of the tasks durations of
+their own (the rest keep the default), then compares the sweep in
+storage.conflicts with a pairwise check of every person's tasks (all
+users with the same name), and the form check with a pairwise check of
+every task saved under a name.
+Exits with status 1 on any mismatch; otherwise prints how long the bulk
+report and a form check take.
+"""
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from config.database import Database
+from storage.cache import query_cache
+from storage.conflicts import check_schedule, fetch_conflicts, find_conflicts, person_key, task_span
+from benchmarks.seed import FIRST_NAMES, LAST_NAMES, add_backend_arguments, parse_scale, prepare, use_benchmark_backend
+
+
+def timed_tasks(cursor):
+    """(user_id, first, last, task_id, title, start, end) of every timed task"""
+    cursor.execute("""
+        SELECT t.user_id, u.first_name, u.last_name, t.task_id, t.task_title, t.date, t.time, t.duration
+        FROM tasks t
+        JOIN users u ON t.user_id = u.user_id
+        WHERE t.time IS NOT NULL
+    """)
+    return [(user_id, first, last, task_id, title) + task_span(day, start_time, duration)
+            for user_id, first, last, task_id, title, day, start_time, duration in cursor.fetchall()]
+
+
+def pairwise(tasks):
+    """Every overlapping pair of task ids, comparing each task with each other one"""
+    found = set()
+    for position, (task_id, start, end) in enumerate(tasks):
+        for other_id, other_start, other_end in tasks[position + 1:]:
+            if start < other_end and other_start < end:
+                found.add(frozenset((task_id, other_id)))
+    return found
+
+
+def check(cursor):
+    """Return a list of mismatch descriptions (empty when the engine is right)"""
+    failures = []
+    tasks = timed_tasks(cursor)
+    
+    by_person = {}
+    for _, first, last, task_id, _, start, end in tasks:
+        by_person.setdefault(person_key(first, last), []).append((task_id, start, end))
+    wanted = set().union(*(pairwise(spans) for spans in by_person.values()))
+    got = {frozenset((first[3], second[3]))
+           for first, second in find_conflicts((person_key(first, last), start, end, task_id)
+                                               for _, first, last, task_id, _, start, end in tasks)}
+    if got != wanted:
+        failures.append(f"sweep found {len(got)} pairs, pairwise check {len(wanted)}")
+    if len(fetch_conflicts(cursor)) != len(wanted):
+        failures.append("report rows differ from the pairwise check")
+    
+    # A form task at each hour of a busy day, for a few names
+    today = date.today()
+    for first_name, last_name in zip(FIRST_NAMES[:4], LAST_NAMES[:4]):
+        saved = [(task_id, title, start, end) for _, first, last, task_id, title, start, end in tasks
+                 if person_key(first, last) == person_key(first_name, last_name)]
+        slots = [(f"Form {hour}", (today + timedelta(days=hour % 3)).isoformat(), f"{hour:02d}:30", 90)
+                 for hour in range(7, 22)]
+        overlaps = check_schedule(cursor, first_name.upper(), last_name, slots)
+        for slot, found in zip(slots, overlaps):
+            start, end = task_span(*slot[1:])
+            expected = sorted([(s, e, title) for _, title, s, e in saved if s < end and start < e]
+                              + [task_span(*other[1:]) + (other[0],) for other in slots
+                                 if other is not slot and task_span(*other[1:])[0] < end
+                                 and start < task_span(*other[1:])[1]])
+            if found != expected:
+                failures.append(f"{first_name} {last_name} {slot}: {len(found)} overlaps, expected {len(expected)}")
+    
+    # One person saved as two schedules, with a name SQL LOWER() leaves alone on SQLite
+    day = (today + timedelta(days=400)).isoformat()
+    for first_name, last_name in (("ÉMILE", "ZOLA"), ("émile", "zola")):
+        cursor.execute("INSERT INTO users (first_name, last_name) VALUES (%s, %s)", (first_name, last_name))
+        user_id = cursor.lastrowid
+        cursor.execute("INSERT INTO activities (activity_name, category, priority, status, user_id) VALUES (%s,%s,%s,%s,%s)",
+                       ("Écrire", "Other", "Low", "Pending", user_id))
+        cursor.execute("INSERT INTO tasks (task_title, date, time, duration, user_id, activity_id) VALUES (%s,%s,%s,%s,%s,%s)",
+                       (f"Chapter {first_name}", day, "10:00", 60, user_id, cursor.lastrowid))
+    query_cache.clear()
+    if len(check_schedule(cursor, "Émile", "Zola", [("Draft", day, "10:30", 30)])[0]) != 2:
+        failures.append("form check misses tasks saved under a differently cased non-ASCII name")
+    if not any(row[1] == day and row[0].casefold() == "émile zola" for row in fetch_conflicts(cursor)):
+        failures.append("report misses the overlap of a differently cased non-ASCII name")
+    return failures
+
+
+def benchmark(cursor, repeat):
+    for name, work in (
+            ("report", lambda: fetch_conflicts(cursor)),
+            ("form check (cold)", lambda: check_schedule(cursor, "Alex", "Santos",
+                                                         [("Bench", date.today().isoformat(), "09:00", 60)])),
+    ):
+        best = None
+        for _ in range(repeat):
+            query_cache.clear()
+            started = time.perf_counter()
+            result = work()
+            elapsed = (time.perf_counter() - started) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{name:<24}{best:>10.1f} ms{len(result):>10} rows")
+    
+    # The form re-checks on every edit; after the first read the index is cached
+    check_schedule(cursor, "Alex", "Santos", [("Bench", date.today().isoformat(), "09:00", 60)])
+    started = time.perf_counter()
+    for hour in range(7, 22):
+        check_schedule(cursor, "Alex", "Santos", [("Bench", date.today().isoformat(), f"{hour:02d}:00", 60)])
+    print(f"{'form check (cached)':<24}{(time.perf_counter() - started) * 1000 / 15:>10.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", default="100k", help="Number of tasks, e.g. 10k, 100k, 1M")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--check-only", action="store_true")
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+    
+    use_benchmark_backend(args.backend, args.path, args.database)
+    try:
+        prepare(parse_scale(args.tasks))
+        conn = Database.pool().acquire()
+        try:
+            cursor = conn.cursor()
+            # Seeded tasks have no duration; give every third one 30 to 120 minutes
+            cursor.execute("UPDATE tasks SET duration = 30 + (task_id % 4) * 30 WHERE task_id % 3 = 0")
+            query_cache.clear()
+            if not args.check_only:
+                benchmark(cursor, args.repeat)
+            failures = check(cursor)
+            conn.rollback()
+        finally:
+            conn.close()
+        for failure in failures:
+            print(f"FAIL {failure}")
+        print("Conflict engine matches the pairwise check: " + ("FAILED" if failures else "ok"))
+    finally:
+        Database.close_pool()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark schedule creation: row-by-row INSERTs vs batched task inserts
+
+Usage:
+    python -m benchmarks.bench_create --activities 20 --tasks 30 --repeat 5
+
+Both paths also update the dashboard counters, report rollups and change
+feed the same way, so the difference is the task inserts alone. Each run
+writes inside a transaction that is rolled back, so planner_db is left
+untouched.
+"""
+import argparse
+import time
+from datetime import date, timedelta
+from config.database import Database
+from collections import Counter
+from config.stats import adjust_counters, adjust_task_dates, ensure_stats_tables
+from storage.changes import record_change
+from storage.repository import insert_schedule
+from storage.rollups import activity_deltas, adjust_rollups
+
+
+class CountingCursor:
+    """Cursor proxy that counts statements sent to the server"""
+    
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.round_trips = 0
+    
+    def execute(self, *args, **kwargs):
+        self.round_trips += 1
+        return self._cursor.execute(*args, **kwargs)
+    
+    def executemany(self, *args, **kwargs):
+        # mysql-connector rewrites INSERT executemany into one multi-row statement
+        self.round_trips += 1
+        return self._cursor.executemany(*args, **kwargs)
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def insert_schedule_row_by_row(cursor, user_values, schedule):
+    """
+    The original write path: one INSERT per activity and per task
+    
+    Followed by the same counter, rollup and change feed writes as
+    insert_schedule, so both paths do the same work.
+    """
+    cursor.execute("INSERT INTO users (first_name, last_name, created_at) VALUES (%s, %s, %s)",
+                  user_values)
+    user_id = cursor.lastrowid
+    activity_ids = []
+    
+    for activity_values, task_values in schedule:
+        cursor.execute("INSERT INTO activities (activity_name, category, priority, status, user_id) VALUES (%s,%s,%s,%s,%s)",
+                      activity_values + (user_id,))
+        activity_id = cursor.lastrowid
+        activity_ids.append(activity_id)
+        
+        for task in task_values:
+            cursor.execute("INSERT INTO tasks (task_title, description, date, time, duration, user_id, activity_id) VALUES (%s,%s,%s,%s,%s,%s,%s)",
+                          task + (user_id, activity_id))
+    
+    all_tasks = [task for _, task_values in schedule for task in task_values]
+    adjust_counters(cursor, users=1, activities=len(schedule), tasks=len(all_tasks))
+    adjust_task_dates(cursor, Counter(task[2] for task in all_tasks))
+    deltas = Counter()
+    for (name, category, priority, status), task_values in schedule:
+        deltas.update(activity_deltas({"status": status, "priority": priority, "category": category},
+                                      len(task_values)))
+    adjust_rollups(cursor, deltas, {user_id: (len(schedule), len(all_tasks))})
+    record_change(cursor, "create", activity_ids=activity_ids, user_ids=[user_id])
+    return user_id
+
+
+def make_schedule(activities, tasks):
+    """Build a synthetic schedule in the shape views.create collects"""
+    today = date.today()
+    user_values = ("Bench", "User", time.strftime("%Y-%m-%d %H:%M:%S"))
+    schedule = []
+    for a in range(activities):
+        activity_values = (f"Benchmark activity {a + 1}", "Other", "Medium", "Pending")
+        task_values = [(f"Task {a + 1}.{t + 1}", "benchmark row",
+                        (today + timedelta(days=t)).strftime("%Y-%m-%d"), "09:00", 60)
+                       for t in range(tasks)]
+        schedule.append((activity_values, task_values))
+    return user_values, schedule
+
+
+def run(write, user_values, schedule, repeat):
+    """Time a write path; returns (round trips, best seconds, mean seconds)"""
+    timings = []
+    round_trips = 0
+    for _ in range(repeat):
+        conn = Database.pool().acquire()
+        try:
+            cursor = CountingCursor(conn.cursor())
+            started = time.perf_counter()
+            write(cursor, user_values, schedule)
+            timings.append(time.perf_counter() - started)
+            round_trips = cursor.round_trips
+        finally:
+            conn.rollback()
+            conn.close()
+    return round_trips, min(timings), sum(timings) / len(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--activities", type=int, default=20)
+    parser.add_argument("--tasks", type=int, default=30, help="Tasks per activity")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    # Counter tables must exist before timing (their DDL would commit mid-run)
+    conn = Database.pool().acquire()
+    ensure_stats_tables(conn.cursor())
+    conn.commit()
+    conn.close()
+    
+    user_values, schedule = make_schedule(args.activities, args.tasks)
+    print(f"Schedule: {args.activities} activities x {args.tasks} tasks, best of {args.repeat}")
+    print(f"{'path':<14}{'round trips':>12}{'best ms':>10}{'mean ms':>10}")
+    
+    for name, write in (("row-by-row", insert_schedule_row_by_row), ("batched", insert_schedule)):
+        trips, best, mean = run(write, user_values, schedule, args.repeat)
+        print(f"{name:<14}{trips:>12}{best * 1000:>10.1f}{mean * 1000:>10.1f}")
+    
+    Database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
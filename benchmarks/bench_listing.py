@@ -0,0 +1,154 @@
+"""
+Correctness check and timings for the manage view's in-memory listing
+
+Usage:
+    python -m benchmarks.bench_listing --tasks 50k
+    python -m benchmarks.bench_listing --check-only
+
+Seeds a benchmark database, loads it into a ScheduleListing and checks
+every filter combination below against the server query for the same
+filters (same rows, and the same order for the sort columns whose order
+does not depend on collation). A few writes are then patched in and the
+patched listing is compared with a freshly built one. Exits with status
+1 on any mismatch; otherwise prints how long each selection takes.
+"""
+import argparse
+import sys
+import time
+from config.database import Database
+from storage.listing import ScheduleListing
+from storage.repository import build_schedule_query, fetch_schedule_listing, search_terms
+from benchmarks.seed import add_backend_arguments, parse_scale, prepare, use_benchmark_backend
+
+
+NO_FILTERS = {"Date": "Any Date", "Priority": "All", "Status": "All",
+              "Category": "All", "User": "", "Search": ""}
+
+CASES = [
+    {},
+    {"Priority": "High"},
+    {"Date": "Upcoming", "Priority": "High"},
+    {"Date": "Today"},
+    {"Date": "Past", "Status": "Done"},
+    {"User": "alex"},
+    {"User": "a", "Date": "Past"},
+    {"Category": "School", "Status": "Pending", "Priority": "Low"},
+    {"Search": "proj"},
+    {"Search": "task 12", "Category": "School"},
+]
+
+# Text columns sort by collation on the server, so only their rows are compared
+ORDERED_COLUMNS = ("ID", "Date", "Priority")
+SORT_COLUMNS = ("ID", "Task", "Date", "User", "Priority")
+
+
+def server_ids(cursor, filters, sort_column, descending):
+    query, params = build_schedule_query(filters, sort_column, descending, None, 10 ** 9)
+    cursor.execute(query, params)
+    return [row[0] for row in cursor.fetchall()]
+
+
+def row_words(row):
+    """Words of a listing row's title, description and activity name"""
+    return search_terms(f"{row[1]} {row[12] or ''} {row[4]}")
+
+
+def check(cursor, listing):
+    """Return a list of mismatch descriptions (empty when the listing is right)"""
+    failures = []
+    for case in CASES:
+        filters = dict(NO_FILTERS, **case)
+        if filters["Search"]:
+            # The server ranks searches instead; compare with a scan of every row
+            terms = search_terms(filters["Search"])
+            wanted = {task_id for task_id in server_ids(cursor, dict(filters, Search=""), "ID", False)
+                      if all(any(word.startswith(term) for word in row_words(listing.rows[task_id]))
+                             for term in terms)}
+            if set(listing.select(filters, "ID", False)) != wanted:
+                failures.append(f"{case}: search rows differ from a full scan")
+            continue
+        for sort_column in SORT_COLUMNS:
+            for descending in (False, True):
+                got = listing.select(filters, sort_column, descending)
+                wanted = server_ids(cursor, filters, sort_column, descending)
+                if sort_column in ORDERED_COLUMNS and got != wanted:
+                    failures.append(f"{case} by {sort_column}: order differs")
+                elif set(got) != set(wanted):
+                    failures.append(f"{case} by {sort_column}: {len(got)} rows, expected {len(wanted)}")
+    
+    # Rename an activity, move and retitle a task, delete one and add one
+    cursor.execute("SELECT MAX(task_id), MIN(activity_id), MIN(user_id) FROM tasks")
+    last_task, activity_id, user_id = cursor.fetchone()
+    cursor.execute("UPDATE activities SET activity_name = 'Kayak', priority = 'High' WHERE activity_id = %s",
+                   (activity_id,))
+    cursor.execute("UPDATE tasks SET task_title = 'Zebra', date = '2030-01-01' WHERE task_id = %s",
+                   (last_task - 1,))
+    cursor.execute("DELETE FROM tasks WHERE task_id = %s", (last_task,))
+    cursor.execute("""
+        INSERT INTO tasks (task_id, task_title, description, date, user_id, activity_id)
+        VALUES (%s, 'Paddle out', 'Patched in', '2030-01-02', %s, %s)
+    """, (last_task + 1, user_id, activity_id))
+    scope = {"task_ids": [last_task - 1, last_task, last_task + 1], "activity_ids": [activity_id]}
+    listing.patch(scope, fetch_schedule_listing(cursor, scope=scope))
+    
+    fresh = ScheduleListing(fetch_schedule_listing(cursor))
+    for case in CASES + [{"Search": "kayak"}, {"Search": "paddle"}]:
+        filters = dict(NO_FILTERS, **case)
+        for sort_column in SORT_COLUMNS:
+            if listing.select(filters, sort_column, True) != fresh.select(filters, sort_column, True):
+                failures.append(f"patched {case} by {sort_column}: differs from a fresh listing")
+    return failures
+
+
+def benchmark(listing, repeat):
+    print(f"{'filters':<56}{'rows':>8}{'ID ms':>10}{'User ms':>10}")
+    for case in CASES:
+        filters = dict(NO_FILTERS, **case)
+        timings = []
+        for sort_column in ("ID", "User"):
+            best = None
+            for _ in range(repeat):
+                started = time.perf_counter()
+                rows = listing.select(filters, sort_column, True)
+                elapsed = (time.perf_counter() - started) * 1000
+                best = elapsed if best is None else min(best, elapsed)
+            timings.append(best)
+        print(f"{str(case):<56}{len(rows):>8}{timings[0]:>10.2f}{timings[1]:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", default="50k", help="Number of tasks, e.g. 10k, 50k")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check-only", action="store_true")
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+    
+    use_benchmark_backend(args.backend, args.path, args.database)
+    try:
+        prepare(parse_scale(args.tasks))
+        conn = Database.pool().acquire()
+        try:
+            cursor = conn.cursor()
+            started = time.perf_counter()
+            listing = ScheduleListing(fetch_schedule_listing(cursor))
+            print(f"Loaded {len(listing)} rows in {time.perf_counter() - started:.2f} s")
+            # Sort orders are built on first use; time the steady state
+            for sort_column in SORT_COLUMNS:
+                listing.select(NO_FILTERS, sort_column, False)
+            if not args.check_only:
+                benchmark(listing, args.repeat)
+            failures = check(cursor, listing)
+            conn.rollback()
+        finally:
+            conn.close()
+        for failure in failures:
+            print(f"FAIL {failure}")
+        print("Listing matches the server: " + ("FAILED" if failures else "ok"))
+    finally:
+        Database.close_pool()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
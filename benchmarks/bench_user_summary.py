@@ -0,0 +1,180 @@
+"""
+Correctness check and scaling benchmark for the User Activity Summary report
+
+Usage:
+    python -m benchmarks.bench_user_summary --sizes 100,200,400,800
+    python -m benchmarks.bench_user_summary --check-only
+
+The check seeds a small hand-built data set plus a generated one and
+compares the report, and the per-user counting query its rollup is
+rebuilt from, with counts taken straight from the tables; it exits with
+status 1 on any mismatch. The benchmark gives a few users a growing
+number of activities (five tasks each) and times the counting query
+(storage.rollups.USER_COUNTS_QUERY) next to the old query that joined
+activities and tasks to users directly: the old query's work grows with
+activities x tasks per user, the counting query's with the row count.
+The report itself reads planner_user_rollups, one row per user, and is
+timed alongside.
+"""
+import argparse
+import sys
+from collections import Counter
+from config.database import Database
+from storage.repository import report_query
+from storage.cache import query_cache
+from storage.rollups import USER_COUNTS_QUERY, rebuild_rollups
+from benchmarks.bench_views import time_path
+from benchmarks.seed import add_backend_arguments, prepare, reset_tables, use_benchmark_backend
+
+
+REPORT = "User Activity Summary"
+
+# The query this report used before per-user pre-aggregation
+FANOUT_QUERY = """
+    SELECT u.first_name, u.last_name,
+           COUNT(DISTINCT a.activity_id) as activities,
+           COUNT(t.task_id) as tasks
+    FROM users u
+    LEFT JOIN activities a ON u.user_id = a.user_id
+    LEFT JOIN tasks t ON u.user_id = t.user_id
+    GROUP BY u.user_id, u.first_name, u.last_name
+"""
+
+HEAVY_USERS = 5       # Users carrying the growing activity count
+TASKS_PER_ACTIVITY = 5
+
+
+def expected_counts(cursor):
+    """{user_id: (activities, tasks)} counted in Python from the raw tables"""
+    cursor.execute("SELECT user_id FROM activities")
+    activities = Counter(row[0] for row in cursor.fetchall())
+    cursor.execute("SELECT user_id FROM tasks")
+    tasks = Counter(row[0] for row in cursor.fetchall())
+    cursor.execute("SELECT user_id FROM users ORDER BY user_id")
+    return {user_id: (activities[user_id], tasks[user_id]) for (user_id,) in cursor.fetchall()}
+
+
+def report_counts(cursor):
+    """[(activities, tasks)] from the report, in user order"""
+    cursor.execute(report_query(REPORT))
+    return [(int(activities), int(tasks)) for _, _, activities, tasks in cursor.fetchall()]
+
+
+def counting_query_counts(cursor):
+    """[(activities, tasks)] from the per-user counting query, in user order"""
+    cursor.execute(USER_COUNTS_QUERY + " ORDER BY u.user_id")
+    return [(int(activities), int(tasks)) for _, activities, tasks in cursor.fetchall()]
+
+
+def insert_rows(cursor, users, activities, tasks):
+    reset_tables(cursor)
+    cursor.executemany("INSERT INTO users (user_id, first_name, last_name) VALUES (%s,%s,%s)", users)
+    cursor.executemany("INSERT INTO activities (activity_id, activity_name, category, priority, status, user_id) VALUES (%s,%s,%s,%s,%s,%s)",
+                      activities)
+    cursor.executemany("INSERT INTO tasks (task_id, task_title, date, user_id, activity_id) VALUES (%s,%s,%s,%s,%s)",
+                      tasks)
+    rebuild_rollups(cursor)
+    query_cache.clear()
+
+
+def small_case(cursor):
+    """
+    Three users: one with two activities and three tasks (the case the old
+    query got wrong, reporting 6 tasks), one with an activity but no tasks,
+    and one with nothing
+    """
+    insert_rows(cursor,
+                [(1, "Ana", "Cruz"), (2, "Ben", "Reyes"), (3, "Cy", "Lopez")],
+                [(1, "Trip", "Travel", "High", "Pending", 1),
+                 (2, "Exam", "School", "Low", "Done", 1),
+                 (3, "Party", "Event", "Medium", "Pending", 2)],
+                [(1, "Pack", "2030-01-01", 1, 1),
+                 (2, "Book", "2030-01-02", 1, 1),
+                 (3, "Study", "2030-01-03", 1, 2)])
+    return [(2, 3), (1, 0), (0, 0)]
+
+
+def check():
+    """Return a list of mismatch descriptions (empty when the report is right)"""
+    failures = []
+    # A generated data set with users of every shape (this also migrates)
+    prepare(5000)
+    conn = Database.pool().acquire()
+    try:
+        cursor = conn.cursor()
+        wanted = list(expected_counts(cursor).values())
+        for name, counts in (("report", report_counts), ("counting query", counting_query_counts)):
+            got = counts(cursor)
+            if got != wanted:
+                bad = sum(1 for pair in zip(wanted, got) if pair[0] != pair[1])
+                failures.append(f"generated data, {name}: {bad} of {len(wanted)} users miscounted")
+        
+        wanted = small_case(cursor)
+        for name, counts in (("report", report_counts), ("counting query", counting_query_counts)):
+            got = counts(cursor)
+            if got != wanted:
+                failures.append(f"hand-built data, {name}: expected {wanted}, got {got}")
+        conn.rollback()
+    finally:
+        conn.close()
+    return failures
+
+
+def heavy_case(cursor, activities_per_user):
+    """HEAVY_USERS users with activities_per_user activities of TASKS_PER_ACTIVITY tasks each"""
+    users, activities, tasks = [], [], []
+    for user_id in range(1, HEAVY_USERS + 1):
+        users.append((user_id, "Heavy", f"User {user_id}"))
+        for _ in range(activities_per_user):
+            activity_id = len(activities) + 1
+            activities.append((activity_id, f"Activity {activity_id}", "Other", "Low", "Pending", user_id))
+            for _ in range(TASKS_PER_ACTIVITY):
+                tasks.append((len(tasks) + 1, "Task", "2030-01-01", user_id, activity_id))
+    insert_rows(cursor, users, activities, tasks)
+    return len(tasks)
+
+
+def benchmark(sizes, repeat):
+    print(f"{'activities/user':>16}{'tasks':>10}{'counting ms':>13}{'fan-out ms':>12}{'report ms':>12}")
+    for size in sizes:
+        conn = Database.pool().acquire()
+        try:
+            total_tasks = heavy_case(conn.cursor(), size)
+            conn.commit()
+        finally:
+            conn.close()
+        
+        def run(query):
+            def work(cursor):
+                cursor.execute(query)
+                return cursor.fetchall()
+            timings, _ = time_path(work, repeat)
+            return min(timings) * 1000
+        
+        print(f"{size:>16}{total_tasks:>10}{run(USER_COUNTS_QUERY):>13.2f}{run(FANOUT_QUERY):>12.2f}"
+              f"{run(report_query(REPORT)):>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="100,200,400,800", help="Activities per heavy user")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--check-only", action="store_true")
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+    
+    use_benchmark_backend(args.backend, args.path, args.database)
+    try:
+        failures = check()
+        for failure in failures:
+            print(f"FAIL {failure}")
+        print("User Activity Summary counts: " + ("FAILED" if failures else "ok"))
+        if not failures and not args.check_only:
+            benchmark([int(size) for size in args.sizes.split(",")], args.repeat)
+    finally:
+        Database.close_pool()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Benchmark every query and write path the views use
+
+Usage:
+    python -m benchmarks.bench_views --scales 1k,100k --repeat 5 --output results.jsonl
+    python -m benchmarks.bench_views --backend mysql --database planner_bench --scales 1k
+
+For each scale a benchmark database is seeded with synthetic data (see
+benchmarks.seed), then each path is timed with the query cache cleared
+so every run reaches the database. Writes run in a transaction that is
+rolled back, so the data set is the same for every run. Results are
+printed as a table and, with --output, appended as JSON lines.
+"""
+import argparse
+import io
+import json
+import random
+import statistics
+import time
+from contextlib import redirect_stdout
+from datetime import date, datetime
+from config.database import Database
+from storage import repository
+from storage.cache import query_cache
+from storage.conflicts import check_schedule
+from benchmarks.bench_create import make_schedule
+from benchmarks.seed import add_backend_arguments, parse_scale, prepare, use_benchmark_backend
+
+
+DEFAULT_FILTERS = {"Date": "Any Date", "Priority": "All", "Status": "All",
+                   "Category": "All", "User": ""}
+
+
+def _reads():
+    """(name, function of cursor) for every read path"""
+    reads = [
+        ("dashboard_stats", lambda cursor: repository.fetch_dashboard_stats(cursor)),
+        ("recent_tasks", lambda cursor: repository.fetch_recent_tasks(cursor)),
+    ]
+    for report_type in repository.REPORT_TYPES:
+        name = "report:" + report_type.lower().replace(" ", "_")
+        reads.append((name, lambda cursor, report_type=report_type:
+                      repository.fetch_report(cursor, report_type)))
+    reads += [
+        ("manage_page", lambda cursor: repository.fetch_schedule_page(
+            cursor, DEFAULT_FILTERS, "ID", True, None, 200)),
+        ("manage_page_sorted_by_user", lambda cursor: repository.fetch_schedule_page(
+            cursor, DEFAULT_FILTERS, "User", False, None, 200)),
+        ("manage_page_upcoming_high", lambda cursor: repository.fetch_schedule_page(
+            cursor, dict(DEFAULT_FILTERS, Date="Upcoming", Priority="High"), "Date", False, None, 200)),
+        ("manage_search_word", lambda cursor: repository.search_schedule_page(
+            cursor, DEFAULT_FILTERS, "review", 0, 200)),
+        ("manage_search_prefixes", lambda cursor: repository.search_schedule_page(
+            cursor, DEFAULT_FILTERS, "pro 12", 0, 200)),
+        ("manage_search_broad", lambda cursor: repository.search_schedule_page(
+            cursor, DEFAULT_FILTERS, "t", 0, 200)),
+        ("conflict_check", lambda cursor: check_schedule(
+            cursor, "Alex", "Santos", [("Bench", date.today().isoformat(), "09:00", 60)])),
+    ]
+    return reads
+
+
+def _writes(total_tasks, rng):
+    """(name, function of cursor) for every write path"""
+    user_values, schedule = make_schedule(5, 10)
+    
+    def update(cursor):
+        task = repository.fetch_task(cursor, rng.randint(1, total_tasks))
+        user_id, activity_id, task_id = task[0], task[3], task[8]
+        repository.update_task(cursor, ("Bench", "Update", user_id),
+                               ("Benchmark update", "Other", "Low", "Done", activity_id),
+                               ("Updated task", "", "2030-01-01", "12:00", 60, task_id))
+    
+    return [
+        ("create_schedule_5x10", lambda cursor: repository.insert_schedule(cursor, user_values, schedule)),
+        ("update_task", update),
+        ("status_change", lambda cursor: repository.set_activity_status(
+            cursor, repository.fetch_task(cursor, rng.randint(1, total_tasks))[3], "Done")),
+        ("delete_1", lambda cursor: repository.delete_tasks_with_cleanup(
+            cursor, [rng.randint(1, total_tasks)])),
+        ("delete_50", lambda cursor: repository.delete_tasks_with_cleanup(
+            cursor, rng.sample(range(1, total_tasks + 1), min(50, total_tasks)))),
+    ]
+
+
+def time_path(work, repeat):
+    """Run work(cursor) repeat times, rolling back each run; returns (seconds list, rows)"""
+    timings = []
+    rows = None
+    for _ in range(repeat):
+        query_cache.clear()
+        conn = Database.pool().acquire()
+        try:
+            cursor = conn.cursor()
+            # Keep the write paths' [DELETE]/[STATS] logging out of the table
+            with redirect_stdout(io.StringIO()):
+                started = time.perf_counter()
+                result = work(cursor)
+                timings.append(time.perf_counter() - started)
+            if isinstance(result, (list, tuple)):
+                rows = len(result)
+        finally:
+            conn.rollback()
+            conn.close()
+    return timings, rows
+
+
+def run_scale(total_tasks, repeat, seed):
+    """Seed one scale and time every path; returns result dicts"""
+    counts, seed_seconds = prepare(total_tasks, seed)
+    print(f"\nScale {total_tasks} tasks ({counts['users']} users, {counts['activities']} activities), "
+          f"seeded in {seed_seconds:.1f} s")
+    print(f"{'path':<40}{'rows':>8}{'min ms':>10}{'median ms':>11}{'mean ms':>10}")
+    
+    rng = random.Random(seed)
+    results = []
+    for kind, paths in (("read", _reads()), ("write", _writes(total_tasks, rng))):
+        for name, work in paths:
+            timings, rows = time_path(work, repeat)
+            result = {
+                "benchmark": name,
+                "kind": kind,
+                "scale": total_tasks,
+                "backend": Database.backend().name,
+                "repeat": repeat,
+                "rows": rows,
+                "min_ms": round(min(timings) * 1000, 3),
+                "median_ms": round(statistics.median(timings) * 1000, 3),
+                "mean_ms": round(statistics.mean(timings) * 1000, 3),
+            }
+            results.append(result)
+            print(f"{name:<40}{rows if rows is not None else '-':>8}{result['min_ms']:>10.2f}"
+                  f"{result['median_ms']:>11.2f}{result['mean_ms']:>10.2f}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", default="1k,100k", help="Comma-separated task counts, e.g. 1k,100k,1M")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Append results to this JSON lines file")
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+    
+    run_at = datetime.now().isoformat(timespec="seconds")
+    use_benchmark_backend(args.backend, args.path, args.database)
+    try:
+        for scale in args.scales.split(","):
+            results = run_scale(parse_scale(scale), args.repeat, args.seed)
+            if args.output:
+                with open(args.output, "a", encoding="utf-8") as f:
+                    for result in results:
+                        f.write(json.dumps(dict(result, run_at=run_at)) + "\n")
+    finally:
+        Database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Synthetic planner data for benchmarks
+
+Usage:
+    python -m benchmarks.seed --tasks 100k --backend sqlite --path bench.db
+
+Generates users with 1-6 activities each and 1-8 tasks per activity.
+Priority, status and category follow skewed distributions, and dates
+cluster around today. The tables are emptied first, so never point this
+at a database whose data you want to keep.
+"""
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+from config.database import Database
+from config.migrations import migrate
+from config.stats import rebuild_counters
+from storage.rollups import rebuild_rollups
+from storage.backends import create_backend
+from storage.cache import query_cache
+
+
+BATCH_SIZE = 5000  # Rows per executemany
+
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie",
+               "Avery", "Quinn", "Robin", "Drew", "Kai", "Rowan", "Sage", "Parker"]
+LAST_NAMES = ["Santos", "Reyes", "Cruz", "Bautista", "Garcia", "Lopez", "Mendoza",
+              "Torres", "Flores", "Ramos", "Rivera", "Castillo", "Aquino", "Villanueva"]
+ACTIVITY_WORDS = ["Project", "Review", "Trip", "Meeting", "Study", "Party", "Workshop",
+                  "Practice", "Planning", "Exam", "Outing", "Errand"]
+
+# (value, weight) pairs
+PRIORITIES = [("High", 2), ("Medium", 5), ("Low", 3)]
+STATUSES = [("Pending", 5), ("In Progress", 3), ("Done", 2)]
+CATEGORIES = [("School", 4), ("Event", 2), ("Hangout", 2), ("Travel", 1), ("Other", 1)]
+
+
+def parse_scale(text):
+    """'1k' -> 1000, '1M' -> 1000000, '2500' -> 2500"""
+    text = text.strip().lower()
+    factor = {"k": 1000, "m": 1000000}.get(text[-1:], 1)
+    return int(float(text[:-1] if factor > 1 else text) * factor)
+
+
+def _pick(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights)[0]
+
+
+def generate(total_tasks, seed=42):
+    """
+    Yield (users, activities, tasks) row batches totalling total_tasks tasks
+    
+    Rows carry explicit ids starting at 1 so tasks can reference their
+    user and activity without a round trip per row.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    now = datetime.now()
+    
+    users, activities, tasks = [], [], []
+    user_id = activity_id = task_id = 0
+    
+    while task_id < total_tasks:
+        user_id += 1
+        created_at = now - timedelta(days=rng.randint(0, 365), minutes=rng.randint(0, 1440))
+        users.append((user_id, rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+                      created_at.strftime("%Y-%m-%d %H:%M:%S")))
+        
+        for _ in range(rng.randint(1, 6)):
+            if task_id >= total_tasks:
+                break
+            activity_id += 1
+            activities.append((activity_id, f"{rng.choice(ACTIVITY_WORDS)} {activity_id}",
+                               _pick(rng, CATEGORIES), _pick(rng, PRIORITIES),
+                               _pick(rng, STATUSES), user_id))
+            
+            for _ in range(min(rng.randint(1, 8), total_tasks - task_id)):
+                task_id += 1
+                # Most tasks fall within a couple of months of today
+                day = today + timedelta(days=int(rng.gauss(0, 60)))
+                task_time = None
+                if rng.random() > 0.3:
+                    task_time = f"{rng.randint(7, 21):02d}:{rng.choice((0, 15, 30, 45)):02d}"
+                tasks.append((task_id, f"Task {task_id}", "Generated benchmark task",
+                              day.strftime("%Y-%m-%d"), task_time, user_id, activity_id))
+        
+        if len(tasks) >= BATCH_SIZE:
+            yield users, activities, tasks
+            users, activities, tasks = [], [], []
+    
+    if tasks:
+        yield users, activities, tasks
+
+
+def reset_tables(cursor):
+    """Empty the planner tables"""
+    for table in ("tasks", "activities", "users"):
+        cursor.execute(f"DELETE FROM {table}")
+
+
+def seed_database(cursor, total_tasks, seed=42):
+    """Replace the planner data with total_tasks generated tasks; returns row counts"""
+    reset_tables(cursor)
+    counts = {"users": 0, "activities": 0, "tasks": 0}
+    for users, activities, tasks in generate(total_tasks, seed):
+        cursor.executemany("INSERT INTO users (user_id, first_name, last_name, created_at) VALUES (%s,%s,%s,%s)",
+                          users)
+        cursor.executemany("INSERT INTO activities (activity_id, activity_name, category, priority, status, user_id) VALUES (%s,%s,%s,%s,%s,%s)",
+                          activities)
+        cursor.executemany("INSERT INTO tasks (task_id, task_title, description, date, time, user_id, activity_id) VALUES (%s,%s,%s,%s,%s,%s,%s)",
+                          tasks)
+        counts["users"] += len(users)
+        counts["activities"] += len(activities)
+        counts["tasks"] += len(tasks)
+    
+    rebuild_counters(cursor)
+    rebuild_rollups(cursor)
+    query_cache.clear()
+    return counts
+
+
+def use_benchmark_backend(backend, path=None, database=None):
+    """
+    Point Database at the benchmark database
+    
+    Args:
+        backend: 'sqlite' or 'mysql'
+        path: SQLite file
+        database: MySQL database name (must not be planner_db)
+    """
+    if backend == "sqlite":
+        Database.use_backend(create_backend("sqlite", sqlite_path=path))
+    else:
+        from config.database import DB_CONFIG
+        if database == DB_CONFIG["database"]:
+            raise ValueError(f"Refusing to seed {database}; pick a separate benchmark database")
+        Database.use_backend(create_backend("mysql", mysql_settings=dict(DB_CONFIG, database=database)))
+    Database.backend().create_database()
+
+
+def prepare(total_tasks, seed=42):
+    """Migrate the benchmark database and seed it; returns (row counts, seconds)"""
+    conn = Database.pool().acquire()
+    try:
+        cursor = conn.cursor()
+        migrate(cursor)
+        started = time.perf_counter()
+        counts = seed_database(cursor, total_tasks, seed)
+        conn.commit()
+        return counts, time.perf_counter() - started
+    finally:
+        conn.close()
+
+
+def add_backend_arguments(parser):
+    parser.add_argument("--backend", choices=("sqlite", "mysql"), default="sqlite",
+                        help="sqlite (local stand-in, default) or mysql")
+    parser.add_argument("--path", default="bench.db", help="SQLite file")
+    parser.add_argument("--database", default="planner_bench", help="MySQL database")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", default="1k", help="Number of tasks, e.g. 1k, 100k, 1M")
+    parser.add_argument("--seed", type=int, default=42)
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+    
+    use_benchmark_backend(args.backend, args.path, args.database)
+    counts, seconds = prepare(parse_scale(args.tasks), args.seed)
+    print(f"Seeded {counts['users']} users, {counts['activities']} activities, "
+          f"{counts['tasks']} tasks in {seconds:.1f} s")
+    Database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -48,13 +48,14 @@ class StatCard(tk.Frame):
         content_frame = tk.Frame(self, bg=BG_CARD)
         content_frame.pack(side="left", fill="both", expand=True, padx=(0, 20), pady=20)
         
-        tk.Label(
+        self.value_label = tk.Label(
             content_frame, 
             text=str(value), 
             font=("Segoe UI", 28, "bold"),
             fg=TEXT_PRIMARY, 
             bg=BG_CARD
-        ).pack(anchor="w")
+        )
+        self.value_label.pack(anchor="w")
         
         tk.Label(
             content_frame, 
@@ -62,4 +63,8 @@ class StatCard(tk.Frame):
             font=FONT_BODY,
             fg=TEXT_SECONDARY, 
             bg=BG_CARD
-        ).pack(anchor="w")
\ No newline at end of file
+        ).pack(anchor="w")
+    
+    def set_value(self, value):
+        """Show a new value without rebuilding the card"""
+        self.value_label.config(text=str(value))
@@ -0,0 +1,34 @@
+import tkinter as tk
+from config.styles import *
+from storage.conflicts import format_span, span_day
+
+
+class ConflictNotice(tk.Label):
+    """Warning under a task's time listing what it overlaps; packed only while there is any"""
+    
+    MAX_LISTED = 3
+    
+    def __init__(self, parent, bg=BG_CARD, **kwargs):
+        super().__init__(
+            parent,
+            font=FONT_SMALL,
+            fg=DANGER,
+            bg=bg,
+            justify="left",
+            wraplength=560,
+            **kwargs
+        )
+        self.overlaps = []
+    
+    def show(self, overlaps):
+        """Display (start, end, title) overlaps from storage.conflicts.check_schedule"""
+        self.overlaps = overlaps
+        if not overlaps:
+            self.pack_forget()
+            return
+        
+        listed = [f"“{title}” ({span_day(start):%b %d}, {format_span(start, end)})"
+                  for start, end, title in overlaps[:self.MAX_LISTED]]
+        more = len(overlaps) - self.MAX_LISTED
+        self.config(text="⚠️ Overlaps " + ", ".join(listed) + (f" and {more} more" if more > 0 else ""))
+        self.pack(anchor="w", pady=(8, 0))
@@ -0,0 +1,33 @@
+import tkinter as tk
+from config.styles import *
+
+
+class LoadingIndicator(tk.Label):
+    """Animated placeholder shown while a background query runs"""
+    
+    def __init__(self, parent, text="Loading", bg=BG_CARD, **kwargs):
+        super().__init__(
+            parent,
+            text=f"⏳ {text}",
+            font=FONT_BODY,
+            fg=TEXT_SECONDARY,
+            bg=bg,
+            **kwargs
+        )
+        
+        self.base_text = f"⏳ {text}"
+        self.dots = 0
+        self._after_id = None
+        self._animate()
+    
+    def _animate(self):
+        """Cycle trailing dots until the widget is destroyed"""
+        self.dots = (self.dots + 1) % 4
+        self.config(text=self.base_text + "." * self.dots)
+        self._after_id = self.after(400, self._animate)
+    
+    def destroy(self):
+        if self._after_id:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
@@ -0,0 +1,124 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from datetime import datetime
+from config.styles import *
+from config.database import Database
+from config.profiler import profiler, SLOW_QUERY_MS
+from storage.cache import query_cache
+
+
+class PerformanceOverlay(tk.Frame):
+    """Toggleable panel listing recent query and render timings"""
+    
+    REFRESH_INTERVAL = 1000  # ms between updates while visible
+    MAX_ROWS = 200           # Newest records shown
+    
+    def __init__(self, root):
+        super().__init__(root, bg=BG_CARD, highlightthickness=1,
+                         highlightbackground=BORDER_COLOR)
+        self.root = root
+        self.visible = False
+        self._after_id = None
+        self._create_widgets()
+    
+    def _create_widgets(self):
+        """Create overlay widgets"""
+        header = tk.Frame(self, bg=BG_CARD)
+        header.pack(fill="x", padx=10, pady=(10, 5))
+        
+        tk.Label(header, text="⚡ Performance", font=FONT_BODY_BOLD,
+                fg=TEXT_PRIMARY, bg=BG_CARD).pack(side="left")
+        
+        for text, command in (("✕", self.hide), ("Export", self.export), ("Clear", self.clear)):
+            tk.Button(header, text=text, command=command, font=FONT_SMALL,
+                     relief=tk.FLAT, bg=BG_CARD, fg=TEXT_SECONDARY,
+                     cursor="hand2").pack(side="right", padx=2)
+        
+        self.summary = tk.Label(self, text="", font=FONT_SMALL, fg=TEXT_SECONDARY,
+                                bg=BG_CARD, anchor="w", justify="left")
+        self.summary.pack(fill="x", padx=10)
+        
+        columns = ("Kind", "Label", "SQL", "Rows", "DB ms", "Decode ms", "Build ms")
+        widths = (60, 170, 150, 60, 70, 80, 70)
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=12)
+        for col, width in zip(columns, widths):
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width, anchor="w" if col in ("Label", "SQL") else "center")
+        self.tree.tag_configure("slow", foreground=DANGER)
+        self.tree.pack(fill="both", expand=True, padx=10, pady=(5, 10))
+    
+    def toggle(self, event=None):
+        """Show or hide the overlay (bound to F12)"""
+        if self.visible:
+            self.hide()
+        else:
+            self.show()
+    
+    def show(self):
+        self.visible = True
+        self.place(relx=1.0, rely=1.0, x=-20, y=-20, anchor="se")
+        self.lift()
+        self.refresh()
+    
+    def hide(self):
+        self.visible = False
+        if self._after_id:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        self.place_forget()
+    
+    def refresh(self):
+        """Reload the table from the profiler buffer"""
+        if self._after_id:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        if not self.visible:
+            return
+        
+        records = profiler.records()
+        queries = [r for r in records if r["kind"] == "query"]
+        renders = [r for r in records if r["kind"] == "render"]
+        
+        slowest = max(queries, key=lambda r: r["db_ms"] + r["decode_ms"], default=None)
+        pool = Database.pool_stats()
+        cache = query_cache.stats()
+        lines = [f"{len(queries)} statements, {len(renders)} renders buffered"]
+        if slowest:
+            lines[0] += (f" · slowest {slowest['label']} ({slowest['sql']}) "
+                         f"{slowest['db_ms'] + slowest['decode_ms']:.1f} ms")
+        lines.append(f"Pool {pool['in_use']}/{pool['size']} in use, avg wait {pool['avg_wait'] * 1000:.1f} ms"
+                     f" · cache {cache['entries']} entries, hit rate {cache['hit_rate']:.0%}")
+        self.summary.config(text="\n".join(lines))
+        
+        self.tree.delete(*self.tree.get_children())
+        for record in reversed(records[-self.MAX_ROWS:]):
+            if record["kind"] == "query":
+                total = record["db_ms"] + record["decode_ms"]
+                values = ("query", record["label"], record["sql"], _blank(record["rows"]),
+                          f"{record['db_ms']:.2f}", f"{record['decode_ms']:.2f}", "")
+            else:
+                total = record["build_ms"]
+                values = ("render", record["label"], "", _blank(record["rows"]),
+                          "", "", f"{record['build_ms']:.2f}")
+            self.tree.insert("", tk.END, values=values,
+                             tags=("slow",) if total >= SLOW_QUERY_MS else ())
+        
+        self._after_id = self.after(self.REFRESH_INTERVAL, self.refresh)
+    
+    def clear(self):
+        profiler.clear()
+        self.refresh()
+    
+    def export(self):
+        """Write the buffer as JSON lines next to the app"""
+        path = f"perf_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        try:
+            count = profiler.export(path)
+        except OSError as e:
+            messagebox.showerror("Export Failed", f"Could not write {path}:\n{e}")
+            return
+        messagebox.showinfo("Exported", f"{count} records written to {path}")
+
+
+def _blank(value):
+    return "" if value is None else value
@@ -2,10 +2,16 @@
 import tkinter as tk
 from tkinter import ttk
 from config.styles import *
+from config.schedule import DEFAULT_DURATION
 
 
 class TimePicker(tk.Frame):
-    """Custom time picker widget with hour, minute, and AM/PM"""
+    """
+    Custom time picker widget with hour, minute, and AM/PM
+    
+    Starts with "No time" ticked (an all-day task, stored as NULL); the
+    hour and minute only apply once it is cleared.
+    """
     
     def __init__(self, parent, **kwargs):
         super().__init__(parent, bg=BG_CARD, **kwargs)
@@ -48,9 +54,25 @@ class TimePicker(tk.Frame):
                                    values=["AM", "PM"], state="readonly",
                                    width=5, font=FONT_BODY)
         period_combo.pack()
+        
+        # No time
+        self.no_time_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(self, text="No time", variable=self.no_time_var, command=self._sync_state,
+                       font=FONT_SMALL, fg=TEXT_SECONDARY, bg=BG_CARD,
+                       activebackground=BG_CARD).pack(side="left", anchor="s", padx=(10, 0))
+        
+        self._fields = [(hour_spin, "normal"), (minute_spin, "normal"), (period_combo, "readonly")]
+        self._sync_state()
+    
+    def _sync_state(self):
+        """Grey out the time fields while "No time" is ticked"""
+        for field, enabled in self._fields:
+            field.configure(state="disabled" if self.no_time_var.get() else enabled)
     
     def get_time(self):
-        """Return time in HH:MM format (24-hour)"""
+        """Return time in HH:MM format (24-hour), or None for no time or an unreadable one"""
+        if self.no_time_var.get():
+            return None
         try:
             hour = int(self.hour_var.get())
             minute = int(self.minute_var.get())
@@ -63,11 +85,13 @@ class TimePicker(tk.Frame):
                 hour = 0
             
             return f"{hour:02d}:{minute:02d}"
-        except:
-            return "12:00"
+        except ValueError:
+            return None
     
     def set_time(self, time_str):
-        """Set time from HH:MM format (24-hour or 12-hour)"""
+        """Set time from HH:MM format (24-hour or 12-hour); an empty value means no time"""
+        self.no_time_var.set(not time_str)
+        self._sync_state()
         if not time_str:
             return
         
@@ -93,4 +117,29 @@ class TimePicker(tk.Frame):
                 
                 self.minute_var.set(f"{minute:02d}")
         except:
-            pass
\ No newline at end of file
+            pass
+    
+    def on_change(self, callback):
+        """Call callback() whenever the hour, minute, period or "No time" changes"""
+        for var in (self.hour_var, self.minute_var, self.period_var, self.no_time_var):
+            var.trace_add("write", lambda *args: callback())
+
+
+class DurationPicker(ttk.Combobox):
+    """Read-only choice of how long a task takes, in minutes"""
+    
+    CHOICES = {"15 min": 15, "30 min": 30, "45 min": 45, "1 hour": 60, "1.5 hours": 90,
+               "2 hours": 120, "3 hours": 180, "4 hours": 240, "8 hours": 480}
+    
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, values=list(self.CHOICES), state="readonly",
+                         width=10, font=FONT_BODY, **kwargs)
+        self.set_minutes(DEFAULT_DURATION)
+    
+    def get_minutes(self):
+        return self.CHOICES.get(self.get(), DEFAULT_DURATION)
+    
+    def set_minutes(self, minutes):
+        """Select the choice closest to minutes (None selects the default)"""
+        minutes = minutes or DEFAULT_DURATION
+        self.set(min(self.CHOICES, key=lambda label: abs(self.CHOICES[label] - minutes)))
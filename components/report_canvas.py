@@ -0,0 +1,176 @@
+import numbers
+import tkinter as tk
+from config.styles import *
+
+
+ROW_BG = "#f8fafc"
+PRIORITY_COLORS = {"High": DANGER, "Medium": WARNING, "Low": SUCCESS}
+STATUS_COLORS = {
+    "Pending": ("#fef3c7", "#92400e"),
+    "In Progress": ("#dbeafe", "#1e40af"),
+    "Done": ("#d1fae5", "#065f46")
+}
+
+
+class ReportCanvas(tk.Canvas):
+    """
+    Report rows drawn as Canvas items, only for the rows in view
+    
+    Every row has the same height, so the rows under the viewport follow
+    from the scroll offset. Scrolling or resizing redraws just those rows,
+    which keeps the item count (and memory) flat however many rows the
+    report has.
+    """
+    
+    ROW_HEIGHT = 56
+    ROW_GAP = 10
+    PAD_X = 20
+    
+    def __init__(self, parent, scrollbar, **kwargs):
+        super().__init__(parent, bg=BG_CARD, highlightthickness=0, **kwargs)
+        self.scrollbar = scrollbar
+        self.rows = None
+        self.draw_row = None
+        self.scale = 1
+        self._drawn = None
+        
+        self.configure(yscrollcommand=self._on_scroll)
+        self.bind("<Configure>", lambda e: self._draw_visible())
+        for sequence, units in (("<MouseWheel>", None), ("<Button-4>", -1), ("<Button-5>", 1)):
+            self.bind(sequence, lambda e, units=units: self._on_wheel(e, units))
+    
+    def show(self, rows, draw_row, keep_position=False):
+        """
+        Display rows; draw_row(canvas, row, x0, y0, x1, y1) draws one of them
+        
+        The largest number in the rows sets the scale for the bars.
+        keep_position leaves the scroll offset where it is (for refreshes).
+        """
+        self.rows = list(rows)
+        self.draw_row = draw_row
+        self.scale = max((value for row in self.rows for value in row
+                          if isinstance(value, numbers.Number) and not isinstance(value, bool)),
+                         default=0) or 1
+        self._drawn = None
+        pitch = self.ROW_HEIGHT + self.ROW_GAP
+        self.configure(scrollregion=(0, 0, 0, len(self.rows) * pitch + self.ROW_GAP))
+        if not keep_position:
+            self.yview_moveto(0)
+        self._draw_visible()
+    
+    def show_message(self, text, fg=TEXT_SECONDARY):
+        """Replace the rows with a centered message"""
+        self.rows = None
+        self.delete("all")
+        self.configure(scrollregion=(0, 0, 0, 0))
+        self.create_text(max(self.winfo_width(), 400) // 2, 80, text=text, font=FONT_BODY,
+                         fill=fg, justify="center")
+    
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._draw_visible()
+    
+    def _on_wheel(self, event, units):
+        if self.rows:
+            if units is None:
+                units = -1 if event.delta > 0 else 1
+            self.yview_scroll(units, "units")
+    
+    def _draw_visible(self):
+        if self.rows is None:
+            return
+        
+        pitch = self.ROW_HEIGHT + self.ROW_GAP
+        width = self.winfo_width()
+        top = int(self.canvasy(0))
+        first = max(0, top // pitch)
+        last = min(len(self.rows), (top + self.winfo_height()) // pitch + 1)
+        if (first, last, width) == self._drawn:
+            return
+        self._drawn = (first, last, width)
+        
+        self.delete("all")
+        x0, x1 = self.PAD_X, max(width - self.PAD_X, self.PAD_X + 300)
+        for idx in range(first, last):
+            y0 = self.ROW_GAP + idx * pitch
+            self.create_rectangle(x0, y0, x1, y0 + self.ROW_HEIGHT,
+                                  fill=ROW_BG, outline=BORDER_COLOR)
+            self.draw_row(self, self.rows[idx], x0, y0, x1, y0 + self.ROW_HEIGHT)
+    
+    def bar(self, x0, y_mid, max_width, value, color, height=8):
+        """Horizontal bar for value, scaled against the largest value shown"""
+        length = max(2, int(max_width * value / self.scale)) if value else 0
+        self.create_rectangle(x0, y_mid - height // 2, x0 + max_width, y_mid + height // 2,
+                              fill=BORDER_COLOR, outline="")
+        if length:
+            self.create_rectangle(x0, y_mid - height // 2, x0 + length, y_mid + height // 2,
+                                  fill=color, outline="")
+    
+    def badge(self, x1, y_mid, text, bg, fg):
+        """Badge right-aligned at x1; returns its left edge"""
+        label = self.create_text(x1 - 10, y_mid, text=text, font=FONT_SMALL, fill=fg, anchor="e")
+        left, top, right, bottom = self.bbox(label)
+        box = self.create_rectangle(left - 10, top - 4, right + 10, bottom + 4, fill=bg, outline="")
+        self.tag_lower(box, label)
+        return left - 10
+
+
+def draw_count_row(canvas, row, x0, y0, x1, y1, color):
+    """Label, bar and 'N tasks' for a (label, count) row"""
+    label, count = row
+    y_mid = (y0 + y1) // 2
+    canvas.create_rectangle(x0, y0, x0 + 5, y1, fill=color, outline="")
+    canvas.create_text(x0 + 25, y_mid, text=label, font=FONT_BODY_BOLD,
+                       fill=TEXT_PRIMARY, anchor="w")
+    canvas.create_text(x1 - 20, y_mid, text=f"{count} tasks", font=FONT_BODY,
+                       fill=TEXT_SECONDARY, anchor="e")
+    bar_x = x0 + 200
+    canvas.bar(bar_x, y_mid, max(x1 - 120 - bar_x, 40), count, color)
+
+
+def draw_user_row(canvas, row, x0, y0, x1, y1):
+    """Name with activity and task counts and bars"""
+    fname, lname, activities, tasks = row
+    y_mid = (y0 + y1) // 2
+    canvas.create_text(x0 + 20, y_mid, text=f"{fname} {lname}", font=FONT_BODY_BOLD,
+                       fill=TEXT_PRIMARY, anchor="w")
+    bar_x = x0 + 220
+    bar_width = max(x1 - 180 - bar_x, 40)
+    for offset, value, text, color in ((-9, activities, f"🎯 {activities} activities", INFO),
+                                       (9, tasks, f"📋 {tasks} tasks", PRIMARY)):
+        canvas.create_text(x1 - 20, y_mid + offset, text=text, font=FONT_SMALL,
+                           fill=TEXT_SECONDARY, anchor="e")
+        canvas.bar(bar_x, y_mid + offset, bar_width, value, color, height=6)
+
+
+def draw_deadline_row(canvas, row, x0, y0, x1, y1):
+    """Title, activity and date, with priority and status badges"""
+    title, date, time, activity, priority, status = row
+    y_mid = (y0 + y1) // 2
+    canvas.create_rectangle(x0, y0, x0 + 5, y1, fill=PRIORITY_COLORS.get(priority, INFO), outline="")
+    
+    info_text = f"🎯 {activity} • 📅 {date}"
+    if time:
+        info_text += f" ⏰ {time}"
+    canvas.create_text(x0 + 25, y_mid - 9, text=title, font=FONT_BODY_BOLD,
+                       fill=TEXT_PRIMARY, anchor="w")
+    canvas.create_text(x0 + 25, y_mid + 11, text=info_text, font=FONT_SMALL,
+                       fill=TEXT_SECONDARY, anchor="w")
+    
+    left = canvas.badge(x1 - 15, y_mid, priority, PRIORITY_COLORS.get(priority, INFO), "white")
+    bg, fg = STATUS_COLORS.get(status, ("#f3f4f6", TEXT_PRIMARY))
+    canvas.badge(left - 10, y_mid, status, bg, fg)
+
+
+def draw_conflict_row(canvas, row, x0, y0, x1, y1):
+    """Two overlapping tasks of one person, with their times and the overlap"""
+    name, date, first_title, first_span, second_title, second_span, overlap = row
+    y_mid = (y0 + y1) // 2
+    canvas.create_rectangle(x0, y0, x0 + 5, y1, fill=DANGER, outline="")
+    
+    canvas.create_text(x0 + 25, y_mid - 9, text=f"{first_title}  ⇄  {second_title}", font=FONT_BODY_BOLD,
+                       fill=TEXT_PRIMARY, anchor="w")
+    canvas.create_text(x0 + 25, y_mid + 11, text=f"👤 {name} • 📅 {date} • ⏰ {first_span} / {second_span}",
+                       font=FONT_SMALL, fill=TEXT_SECONDARY, anchor="w")
+    
+    canvas.badge(x1 - 15, y_mid, f"{overlap} min overlap", "#fee2e2", "#991b1b")
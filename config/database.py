@@ -1,41 +1,279 @@
 
-import mysql.connector
-from mysql.connector import Error
+import os
+import time
+import threading
 from tkinter import messagebox
+from storage.backends import create_backend
+from storage.cache import query_cache
+
+
+# Storage backend: "mysql" (MariaDB/MySQL server) or "sqlite" (embedded file)
+DB_BACKEND = os.environ.get("PLANNER_DB_BACKEND", "mysql")
+SQLITE_PATH = os.environ.get("PLANNER_DB_PATH", "planner.db")
+
+# MySQL connection settings
+DB_CONFIG = {
+    "host": "localhost",
+    "user": "root",
+    "password": "",
+    "database": "planner_db",
+    "use_pure": True
+}
+
+# Pool settings
+POOL_SIZE = 5            # Maximum number of open connections
+POOL_WAIT_TIMEOUT = 10   # Seconds to wait for a free connection
+POOL_IDLE_TIMEOUT = 300  # Seconds before an idle connection is closed
+
+
+class Error(Exception):
+    """Raised for pool and connection failures, whatever the backend"""
+
+
+class PooledConnection:
+    """Connection proxy that returns the real connection to its pool on close()"""
+    
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+    
+    def close(self):
+        """Return the connection to the pool instead of closing it"""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool.release(conn)
+    
+    def __getattr__(self, name):
+        if self._conn is None:
+            raise Error("Connection has already been returned to the pool")
+        return getattr(self._conn, name)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def __del__(self):
+        # Safety net for code paths that forget to close()
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of database connections"""
+    
+    def __init__(self, factory, size=POOL_SIZE, wait_timeout=POOL_WAIT_TIMEOUT,
+                 idle_timeout=POOL_IDLE_TIMEOUT):
+        """
+        Initialize pool
+        
+        Args:
+            factory: Callable that opens a new raw connection
+            size: Maximum number of connections (idle + in use)
+            wait_timeout: Seconds acquire() waits for a free connection
+            idle_timeout: Seconds an idle connection may sit before it is closed
+        """
+        self.factory = factory
+        self.size = size
+        self.wait_timeout = wait_timeout
+        self.idle_timeout = idle_timeout
+        
+        self._idle = []  # (connection, returned_at), most recent last
+        self._in_use = 0
+        self._cond = threading.Condition()
+        
+        self._handshakes = 0
+        self._connect_time = 0.0
+        self._checkouts = 0
+        self._discarded = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+    
+    def acquire(self):
+        """Check out a healthy connection, opening one if the pool has room"""
+        started = time.perf_counter()
+        deadline = started + self.wait_timeout
+        
+        with self._cond:
+            while True:
+                conn = self._take_idle()
+                if conn is not None:
+                    break
+                
+                if self._in_use + len(self._idle) < self.size:
+                    # Reserve the slot before the (slow) handshake
+                    self._in_use += 1
+                    try:
+                        self._cond.release()
+                        try:
+                            opened = time.perf_counter()
+                            conn = self.factory()
+                        finally:
+                            self._cond.acquire()
+                    except Exception:
+                        self._in_use -= 1
+                        self._cond.notify()
+                        raise
+                    self._handshakes += 1
+                    self._connect_time += time.perf_counter() - opened
+                    break
+                
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise Error(f"Connection pool exhausted ({self.size} connections in use)")
+                self._cond.wait(remaining)
+            
+            waited = time.perf_counter() - started
+            self._checkouts += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        
+        return PooledConnection(self, conn)
+    
+    def _take_idle(self):
+        """Pop the most recently used idle connection that passes the health check"""
+        now = time.monotonic()
+        while self._idle:
+            conn, returned_at = self._idle.pop()
+            
+            if now - returned_at > self.idle_timeout or not self._ping(conn):
+                self._discard(conn)
+                continue
+            
+            self._in_use += 1
+            return conn
+        return None
+    
+    def _ping(self, conn):
+        """Return True if the server still answers on this connection"""
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+    
+    def _discard(self, conn):
+        """Close a connection that is no longer usable"""
+        self._discarded += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+    
+    def release(self, conn):
+        """Return a checked-out connection to the pool"""
+        try:
+            # End any open transaction so the next borrower sees fresh data
+            conn.rollback()
+            healthy = True
+        except Exception:
+            healthy = False
+        
+        with self._cond:
+            self._in_use -= 1
+            if healthy:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._discard(conn)
+            self._cond.notify()
+    
+    def prune(self):
+        """Close idle connections that have passed the idle timeout"""
+        now = time.monotonic()
+        with self._cond:
+            keep = []
+            for conn, returned_at in self._idle:
+                if now - returned_at > self.idle_timeout:
+                    self._discard(conn)
+                else:
+                    keep.append((conn, returned_at))
+            self._idle = keep
+    
+    def close_all(self):
+        """Close every idle connection (in-use connections close when returned)"""
+        with self._cond:
+            for conn, _ in self._idle:
+                self._discard(conn)
+            self._idle = []
+    
+    def stats(self):
+        """Return a snapshot of pool metrics"""
+        with self._cond:
+            return {
+                "size": self.size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "handshakes": self._handshakes,
+                "connect_time": self._connect_time,
+                "checkouts": self._checkouts,
+                "discarded": self._discarded,
+                "total_wait": self._total_wait,
+                "max_wait": self._max_wait,
+                "avg_wait": self._total_wait / self._checkouts if self._checkouts else 0.0
+            }
 
 
 class Database:
     """Database connection manager"""
     
+    _backend = None
+    _pool = None
+    _pool_lock = threading.Lock()
+    
+    @staticmethod
+    def backend():
+        """Return the configured storage backend"""
+        with Database._pool_lock:
+            if Database._backend is None:
+                Database._backend = create_backend(DB_BACKEND, mysql_settings=DB_CONFIG,
+                                                   sqlite_path=SQLITE_PATH)
+            return Database._backend
+    
+    @staticmethod
+    def use_backend(backend):
+        """Switch to another backend (closes the current pool and drops cached results)"""
+        Database.close_pool()
+        with Database._pool_lock:
+            Database._backend = backend
+            Database._pool = None
+        query_cache.clear()
+    
+    @staticmethod
+    def _open_connection():
+        """Open a new raw connection through the backend"""
+        try:
+            return Database.backend().connect()
+        except Exception as e:
+            raise Error(f"Could not connect to {Database.backend().name} database: {e}") from e
+    
+    @staticmethod
+    def pool():
+        """Return the shared connection pool, creating it on first use"""
+        with Database._pool_lock:
+            if Database._pool is None:
+                Database._pool = ConnectionPool(Database._open_connection)
+            return Database._pool
+    
     @staticmethod
     def connect():
-        """Connect to MariaDB database and return the connection"""
+        """Check out a pooled connection; close() returns it to the pool"""
         try:
-            conn = mysql.connector.connect(
-            host="localhost",
-            user="root",
-            password="",
-            database="planner_db",
-            use_pure=True  
-        )
-            if conn.is_connected():
-                return conn
+            return Database.pool().acquire()
         except Error as e:
             messagebox.showerror("Database Error", f"Error connecting to database:\n{e}")
             raise e
     
     @staticmethod
-    def reset_auto_increment():
-        """Reset auto_increment counters for all tables"""
-        try:
-            conn = Database.connect()
-            cursor = conn.cursor()
-            
-            cursor.execute("ALTER TABLE users AUTO_INCREMENT = 1")
-            cursor.execute("ALTER TABLE activities AUTO_INCREMENT = 1")
-            cursor.execute("ALTER TABLE tasks AUTO_INCREMENT = 1")
-            
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"Error resetting auto_increment: {e}")
\ No newline at end of file
+    def pool_stats():
+        """Return connection pool metrics (wait time, in-use count, handshakes, connect time)"""
+        return Database.pool().stats()
+    
+    @staticmethod
+    def close_pool():
+        """Close all idle pooled connections"""
+        with Database._pool_lock:
+            if Database._pool is not None:
+                Database._pool.close_all()
@@ -0,0 +1,69 @@
+"""
+In-process data change events
+
+Mutating operations publish one event once their transaction has
+committed, and views subscribe to patch what they show instead of
+rebuilding. Edits made by other clients arrive through the change feed
+(storage.changes) as the same events with remote=True.
+
+Events (ids are lists; a local event may carry fewer of them):
+    task_created             user_ids, activity_ids; local events also carry
+                             "counts" (see below)
+    task_updated             task_ids, activity_ids, user_ids; local events also
+                             carry "values", the saved update form
+    activity_status_changed  activity_ids; local events also carry "status"
+    task_deleted             task_ids, activity_ids, user_ids; local events also
+                             carry "counts"
+    data_reset               too much changed to patch, reload everything
+
+"counts" is the change in the dashboard's (users, activities, tasks,
+upcoming) stats.
+
+Publishing and delivery both happen on the Tk thread.
+"""
+TASK_CREATED = "task_created"
+TASK_UPDATED = "task_updated"
+ACTIVITY_STATUS_CHANGED = "activity_status_changed"
+TASK_DELETED = "task_deleted"
+DATA_RESET = "data_reset"
+
+ALL_EVENTS = (TASK_CREATED, TASK_UPDATED, ACTIVITY_STATUS_CHANGED, TASK_DELETED, DATA_RESET)
+
+
+class EventBus:
+    """Publish/subscribe by event name, with subscriptions tied to widgets"""
+    
+    def __init__(self):
+        self._subscribers = {}  # event name -> [(callback, owner)]
+    
+    def subscribe(self, names, callback, owner=None):
+        """
+        Call callback(event) for every event published under one of names
+        
+        Args:
+            names: Event name or tuple of names
+            owner: Widget the subscription belongs to; it is dropped once
+                   the widget is destroyed
+        """
+        for name in (names,) if isinstance(names, str) else names:
+            self._subscribers.setdefault(name, []).append((callback, owner))
+    
+    def publish(self, name, remote=False, **payload):
+        """Deliver an event to its subscribers; returns the event dict"""
+        event = {"name": name, "remote": remote, "task_ids": [], "activity_ids": [], "user_ids": []}
+        event.update(payload)
+        
+        subscribers = self._subscribers.get(name, [])
+        for callback, owner in list(subscribers):
+            if owner is not None and not owner.winfo_exists():
+                subscribers.remove((callback, owner))
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"[ERROR] {name} handler failed: {e}")
+        return event
+
+
+# Shared by every view in the process
+events = EventBus()
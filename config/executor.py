@@ -0,0 +1,238 @@
+import time
+import queue
+import threading
+from collections import deque
+from config.database import Database
+from config.profiler import profiler
+from storage.cache import query_cache
+
+
+# Executor settings
+WORKER_COUNT = 2     # Background threads running SQL
+POLL_INTERVAL = 25   # ms between result deliveries on the UI thread
+BATCH_SIZE = 20      # Max callbacks delivered per poll
+
+
+class QueryJob:
+    """A unit of database work submitted from the UI"""
+    
+    def __init__(self, work, on_success=None, on_error=None, group=None, owner=None, label=None):
+        """
+        Initialize job
+        
+        Args:
+            work: Callable receiving a cursor; runs on a worker thread and must not touch Tk
+            on_success: Called on the UI thread with the work result
+            on_error: Called on the UI thread with the raised exception
+            group: Name used to supersede/cancel related jobs (e.g. a tab name)
+            owner: Widget the result belongs to; delivery is skipped once it is destroyed
+            label: Name for profiling records (defaults to the work function's name)
+        """
+        self.work = work
+        self.on_success = on_success
+        self.on_error = on_error
+        self.group = group
+        self.owner = owner
+        name = getattr(work, "__name__", "<lambda>")
+        self.label = label or (name if name != "<lambda>" else group or "query")
+        self.cancelled = False
+        self.result = None
+        self.error = None
+    
+    def cancel(self):
+        """Drop the job if not started yet and never deliver its result"""
+        self.cancelled = True
+
+
+class DatabaseExecutor:
+    """Runs query jobs on worker threads and delivers results through root.after"""
+    
+    def __init__(self, root, workers=WORKER_COUNT, poll_interval=POLL_INTERVAL,
+                 batch_size=BATCH_SIZE):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        
+        self._jobs = queue.Queue()
+        self._results = deque()
+        self._groups = {}
+        self._lock = threading.Lock()
+        self._outstanding = 0
+        self._polling = False
+        
+        self._threads = []
+        for idx in range(workers):
+            thread = threading.Thread(target=self._worker, name=f"db-worker-{idx}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def submit(self, work, on_success=None, on_error=None, group=None, owner=None,
+               supersede=True, label=None):
+        """
+        Queue a job (call from the UI thread)
+        
+        Args:
+            supersede: Cancel jobs of the same group that have not been delivered yet
+        
+        Returns:
+            QueryJob that can be cancelled
+        """
+        job = QueryJob(work, on_success, on_error, group, owner, label)
+        
+        with self._lock:
+            if group is not None:
+                if supersede:
+                    for old in self._groups.get(group, []):
+                        old.cancel()
+                    self._groups[group] = []
+                self._groups.setdefault(group, []).append(job)
+            self._outstanding += 1
+        
+        self._jobs.put(job)
+        self._ensure_polling()
+        return job
+    
+    def cancel_group(self, group):
+        """
+        Cancel every pending job of a group (e.g. when leaving a tab)
+        
+        Returns:
+            Number of jobs cancelled before their result was delivered
+        """
+        with self._lock:
+            jobs = self._groups.pop(group, [])
+            for job in jobs:
+                job.cancel()
+            return len(jobs)
+    
+    def _worker(self):
+        """Worker thread loop"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            
+            if not job.cancelled:
+                conn = None
+                try:
+                    conn = Database.pool().acquire()
+                    cursor = profiler.wrap_cursor(conn.cursor(), job.label)
+                    job.result = job.work(cursor)
+                    conn.commit()
+                    query_cache.committed()
+                except Exception as e:
+                    job.error = e
+                    query_cache.rolled_back()
+                    if conn:
+                        try:
+                            conn.rollback()
+                        except Exception:
+                            pass
+                finally:
+                    if conn:
+                        conn.close()
+            
+            self._results.append(job)
+    
+    def _ensure_polling(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_interval, self._poll)
+    
+    def _poll(self):
+        """Deliver a batch of finished jobs on the UI thread"""
+        delivered = 0
+        while self._results and delivered < self.batch_size:
+            job = self._results.popleft()
+            delivered += 1
+            
+            with self._lock:
+                self._outstanding -= 1
+                jobs = self._groups.get(job.group)
+                if jobs and job in jobs:
+                    jobs.remove(job)
+            
+            if job.cancelled:
+                continue
+            if job.owner is not None and not job.owner.winfo_exists():
+                continue
+            
+            try:
+                if job.error is not None:
+                    if job.on_error:
+                        job.on_error(job.error)
+                    else:
+                        print(f"[ERROR] Background query failed: {job.error}")
+                elif job.on_success:
+                    # Callback time is the Tk work of rendering the result
+                    started = time.perf_counter()
+                    job.on_success(job.result)
+                    profiler.record_render(job.label, (time.perf_counter() - started) * 1000,
+                                           len(job.result) if isinstance(job.result, list) else None)
+            except Exception as e:
+                print(f"[ERROR] Query callback failed: {e}")
+        
+        with self._lock:
+            pending = self._outstanding > 0
+        
+        if pending:
+            self.root.after(self.poll_interval, self._poll)
+        else:
+            self._polling = False
+    
+    def shutdown(self):
+        """Stop worker threads after the queued jobs finish"""
+        for _ in self._threads:
+            self._jobs.put(None)
+
+
+_executor = None
+
+
+def install_executor(root, **kwargs):
+    """Create the shared executor bound to the Tk root"""
+    global _executor
+    _executor = DatabaseExecutor(root, **kwargs)
+    return _executor
+
+
+def get_executor():
+    """Return the shared executor (None if not installed)"""
+    return _executor
+
+
+def submit_query(work, on_success=None, on_error=None, group=None, owner=None, supersede=True,
+                 label=None):
+    """
+    Run database work in the background and deliver the result on the UI thread
+    
+    Falls back to running synchronously when no executor is installed
+    (e.g. scripts that use the views without a main window).
+    """
+    if _executor is not None:
+        return _executor.submit(work, on_success, on_error, group, owner, supersede, label)
+    
+    job = QueryJob(work, on_success, on_error, group, owner, label)
+    conn = None
+    try:
+        conn = Database.pool().acquire()
+        job.result = work(profiler.wrap_cursor(conn.cursor(), job.label))
+        conn.commit()
+        query_cache.committed()
+    except Exception as e:
+        job.error = e
+        query_cache.rolled_back()
+        if conn:
+            conn.rollback()
+    finally:
+        if conn:
+            conn.close()
+    
+    if job.error is not None:
+        if on_error:
+            on_error(job.error)
+        else:
+            raise job.error
+    elif on_success:
+        on_success(job.result)
+    return job
@@ -0,0 +1,96 @@
+"""
+Offline ID maintenance for planner_db
+
+Usage:
+    python -m config.maintenance           # report ID counters and gaps
+    python -m config.maintenance --apply   # reset AUTO_INCREMENT counters
+
+Deletes never touch table DDL. On MySQL resetting counters runs ALTER
+TABLE, which takes a metadata lock (and may rebuild the table on
+MariaDB), so run it during a quiet window when no clients are writing.
+On SQLite it rewrites sqlite_sequence.
+"""
+import argparse
+from config.database import Database
+
+
+# (table, primary key) pairs with AUTO_INCREMENT ids
+ID_TABLES = (
+    ("users", "user_id"),
+    ("activities", "activity_id"),
+    ("tasks", "task_id")
+)
+
+
+def inspect_id_counters(cursor):
+    """
+    Return one dict per table with its row count, highest id,
+    next AUTO_INCREMENT value and number of id gaps
+    """
+    backend = Database.backend()
+    report = []
+    for table, key in ID_TABLES:
+        cursor.execute(f"SELECT COUNT(*), COALESCE(MAX({key}), 0) FROM {table}")
+        rows, max_id = cursor.fetchone()
+        
+        next_id = backend.next_auto_increment(cursor, table)
+        if next_id is None:
+            next_id = max_id + 1
+        
+        report.append({
+            "table": table,
+            "rows": rows,
+            "max_id": max_id,
+            "next_id": next_id,
+            "gaps": max_id - rows,
+            "reset_to": None
+        })
+    return report
+
+
+def reset_id_counters(cursor, dry_run=False):
+    """
+    Lower each AUTO_INCREMENT counter to MAX(id) + 1 where it has run ahead
+    
+    Ids already in use are never changed. Returns the inspection report
+    with reset_to filled in for the tables that were (or would be) reset.
+    """
+    report = inspect_id_counters(cursor)
+    for entry in report:
+        target = entry["max_id"] + 1
+        if entry["next_id"] > target:
+            entry["reset_to"] = target
+            if not dry_run:
+                Database.backend().set_auto_increment(cursor, entry["table"], target)
+                print(f"[MAINTENANCE] {entry['table']}: AUTO_INCREMENT {entry['next_id']} -> {target}")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report or reset planner_db id counters")
+    parser.add_argument("--apply", action="store_true",
+                        help="Reset counters (otherwise only report what would change)")
+    args = parser.parse_args()
+    
+    conn = Database.pool().acquire()
+    try:
+        report = reset_id_counters(conn.cursor(), dry_run=not args.apply)
+        conn.commit()
+    finally:
+        conn.close()
+        Database.close_pool()
+    
+    print(f"{'table':<12}{'rows':>10}{'max id':>10}{'next id':>10}{'gaps':>10}  action")
+    for entry in report:
+        if entry["reset_to"] is None:
+            action = "ok"
+        elif args.apply:
+            action = f"reset to {entry['reset_to']}"
+        else:
+            action = f"would reset to {entry['reset_to']}"
+        print(f"{entry['table']:<12}{entry['rows']:>10}{entry['max_id']:>10}"
+              f"{entry['next_id']:>10}{entry['gaps']:>10}  {action}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Versioned schema migrations for planner_db
+
+Usage:
+    python -m config.migrations            # create the database if needed and migrate
+    python -m config.migrations --status   # show applied and pending versions
+
+The applied version is recorded in schema_version, so startup only has
+to read one row to know the schema is current.
+"""
+import argparse
+import threading
+from config.database import Database
+from config.stats import rebuild_counters
+from storage.rollups import rebuild_rollups
+
+
+def _create_index(cursor, table, name, columns):
+    """Create an index unless one already starts with the same columns"""
+    existing = Database.backend().index_columns(cursor, table)
+    
+    wanted = [column.lower() for column in columns]
+    for index_columns in existing.values():
+        if index_columns[:len(wanted)] == wanted:
+            return
+    
+    cursor.execute(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})")
+    print(f"[MIGRATE] Created index {name} on {table}({', '.join(columns)})")
+
+
+def _base_schema(cursor):
+    pk = Database.backend().autoincrement_pk
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS users (
+            user_id {pk},
+            first_name VARCHAR(100) NOT NULL,
+            last_name VARCHAR(100) NOT NULL,
+            created_at DATETIME
+        )
+    """)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS activities (
+            activity_id {pk},
+            activity_name VARCHAR(255) NOT NULL,
+            category VARCHAR(50) NOT NULL,
+            priority VARCHAR(20) NOT NULL,
+            status VARCHAR(20) NOT NULL,
+            user_id INT NOT NULL
+        )
+    """)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS tasks (
+            task_id {pk},
+            task_title VARCHAR(255) NOT NULL,
+            description TEXT,
+            date DATE NOT NULL,
+            time TIME NULL,
+            user_id INT NOT NULL,
+            activity_id INT NOT NULL
+        )
+    """)
+
+
+def _dashboard_counters(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS planner_counters (
+            name VARCHAR(32) PRIMARY KEY,
+            value BIGINT NOT NULL DEFAULT 0
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS planner_task_dates (
+            date DATE PRIMARY KEY,
+            task_count INT NOT NULL DEFAULT 0
+        )
+    """)
+    rebuild_counters(cursor)
+
+
+def _performance_indexes(cursor):
+    # Upcoming/deadline queries filter and order by date then time
+    _create_index(cursor, "tasks", "idx_tasks_date_time", ["date", "time"])
+    # Joins and orphan checks by activity and by user
+    _create_index(cursor, "tasks", "idx_tasks_activity", ["activity_id"])
+    _create_index(cursor, "tasks", "idx_tasks_user", ["user_id"])
+    _create_index(cursor, "activities", "idx_activities_user", ["user_id"])
+    # Report grouping and manage view filters
+    _create_index(cursor, "activities", "idx_activities_status", ["status"])
+    _create_index(cursor, "activities", "idx_activities_priority", ["priority"])
+    _create_index(cursor, "activities", "idx_activities_category", ["category"])
+
+
+def _report_rollups(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS planner_report_rollups (
+            dimension VARCHAR(16) NOT NULL,
+            value VARCHAR(100) NOT NULL,
+            task_count BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (dimension, value)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS planner_user_rollups (
+            user_id INT PRIMARY KEY,
+            activity_count INT NOT NULL DEFAULT 0,
+            task_count INT NOT NULL DEFAULT 0
+        )
+    """)
+    rebuild_rollups(cursor)
+
+
+def _change_feed(cursor):
+    pk = Database.backend().autoincrement_pk
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS planner_changes (
+            version {pk},
+            client VARCHAR(32) NOT NULL,
+            kind VARCHAR(16) NOT NULL,
+            task_ids TEXT,
+            activity_ids TEXT,
+            user_ids TEXT,
+            changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def _search_index(cursor):
+    # MySQL FULLTEXT indexes, or an FTS5 table kept by triggers on SQLite
+    Database.backend().create_search_index(cursor)
+
+
+def _task_durations(cursor):
+    # Minutes a timed task takes; NULL uses config.schedule.DEFAULT_DURATION
+    cursor.execute("ALTER TABLE tasks ADD COLUMN duration INT NULL")
+
+
+# (version, description, function receiving a cursor), in order
+MIGRATIONS = [
+    (1, "Base users/activities/tasks tables", _base_schema),
+    (2, "Dashboard counter tables", _dashboard_counters),
+    (3, "Indexes for dashboard, report and manage queries", _performance_indexes),
+    (4, "Report rollup tables", _report_rollups),
+    (5, "Change feed for other clients' edits", _change_feed),
+    (6, "Full-text search index over tasks and activity names", _search_index),
+    (7, "Task durations for conflict checks", _task_durations),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+_verified = False
+_verify_lock = threading.Lock()
+
+
+def current_version(cursor):
+    """Return the applied schema version (0 if never migrated)"""
+    try:
+        cursor.execute("SELECT MAX(version) FROM schema_version")
+        return cursor.fetchone()[0] or 0
+    except Exception:
+        # schema_version does not exist yet
+        return 0
+
+
+def migrate(cursor, target=LATEST_VERSION):
+    """Apply every pending migration up to target; returns the versions applied"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INT PRIMARY KEY,
+            description VARCHAR(255) NOT NULL,
+            applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    applied = []
+    version = current_version(cursor)
+    for number, description, step in MIGRATIONS:
+        if number <= version or number > target:
+            continue
+        
+        print(f"[MIGRATE] Applying v{number}: {description}")
+        step(cursor)
+        cursor.execute("INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                      (number, description))
+        # Record each version as soon as it is applied
+        cursor.execute("COMMIT")
+        applied.append(number)
+    return applied
+
+
+def verify_schema(cursor):
+    """Cheap startup check: one read, and migrations only if the schema is behind"""
+    global _verified
+    if _verified:
+        return
+    
+    with _verify_lock:
+        if _verified:
+            return
+        if current_version(cursor) < LATEST_VERSION:
+            migrate(cursor)
+        _verified = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create and migrate planner_db")
+    parser.add_argument("--status", action="store_true",
+                        help="Show the applied version without migrating")
+    args = parser.parse_args()
+    
+    if not args.status:
+        Database.backend().create_database()
+    
+    conn = Database.pool().acquire()
+    try:
+        cursor = conn.cursor()
+        if args.status:
+            version = current_version(cursor)
+            pending = [number for number, _, _ in MIGRATIONS if number > version]
+            print(f"Schema version {version} (latest {LATEST_VERSION})"
+                  + (f", pending: {pending}" if pending else ", up to date"))
+        else:
+            applied = migrate(cursor)
+            conn.commit()
+            print(f"Applied {applied}" if applied else "Schema already up to date")
+    finally:
+        conn.close()
+        Database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
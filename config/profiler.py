@@ -0,0 +1,130 @@
+import re
+import json
+import time
+import threading
+from collections import deque
+
+
+# Profiler settings
+PROFILE_BUFFER_SIZE = 2000   # Records kept (oldest dropped first)
+SLOW_QUERY_MS = 100          # Statements slower than this are highlighted in the overlay
+
+_SQL_VERB = re.compile(r"^\s*(\w+)")
+_SQL_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE|TABLE)\s+(\w+)", re.IGNORECASE)
+
+
+def describe_sql(query):
+    """Short label for a statement, e.g. 'SELECT tasks'"""
+    verb = _SQL_VERB.match(query)
+    table = _SQL_TABLE.search(query)
+    return " ".join(part for part in (verb.group(1).upper() if verb else "SQL",
+                                      table.group(1) if table else "") if part)
+
+
+class Profiler:
+    """
+    Ring buffer of query and render timings
+    
+    Query records: label, sql, rows, db_ms (execute), decode_ms (fetch).
+    Render records: label, rows, build_ms (Tk widget building on the UI thread).
+    """
+    
+    def __init__(self, size=PROFILE_BUFFER_SIZE):
+        self.enabled = True
+        self._records = deque(maxlen=size)
+        self._lock = threading.Lock()
+    
+    def _add(self, record):
+        record["at"] = time.time()
+        with self._lock:
+            self._records.append(record)
+        return record
+    
+    def record_query(self, label, sql, db_ms, rows=None):
+        if not self.enabled:
+            return None
+        return self._add({"kind": "query", "label": label, "sql": describe_sql(sql),
+                          "rows": rows, "db_ms": round(db_ms, 3), "decode_ms": 0.0})
+    
+    def record_render(self, label, build_ms, rows=None):
+        if not self.enabled:
+            return None
+        return self._add({"kind": "render", "label": label, "rows": rows,
+                          "build_ms": round(build_ms, 3)})
+    
+    def wrap_cursor(self, cursor, label):
+        """Return a cursor that records every statement under label"""
+        return ProfiledCursor(cursor, self, label) if self.enabled else cursor
+    
+    def records(self):
+        """Return a copy of the buffer, oldest first"""
+        with self._lock:
+            return [dict(record) for record in self._records]
+    
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+    
+    def export(self, path):
+        """Write the buffer as JSON lines; returns the number of records written"""
+        records = self.records()
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        return len(records)
+
+
+class ProfiledCursor:
+    """Cursor proxy timing execute() as database latency and fetch*() as decode time"""
+    
+    def __init__(self, cursor, profiler, label):
+        self._cursor = cursor
+        self._profiler = profiler
+        self._label = label
+        self._last = None
+    
+    def execute(self, query, params=()):
+        started = time.perf_counter()
+        try:
+            return self._cursor.execute(query, params)
+        finally:
+            rowcount = getattr(self._cursor, "rowcount", -1)
+            self._last = self._profiler.record_query(
+                self._label, query, (time.perf_counter() - started) * 1000,
+                rowcount if rowcount is not None and rowcount >= 0 else None)
+    
+    def executemany(self, query, seq_of_params):
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(query, seq_of_params)
+        finally:
+            self._last = self._profiler.record_query(
+                self._label, query, (time.perf_counter() - started) * 1000,
+                len(seq_of_params) if hasattr(seq_of_params, "__len__") else None)
+    
+    def _fetch(self, method, *args):
+        started = time.perf_counter()
+        result = getattr(self._cursor, method)(*args)
+        if self._last is not None:
+            self._last["decode_ms"] = round(self._last["decode_ms"] + (time.perf_counter() - started) * 1000, 3)
+            if isinstance(result, list):
+                self._last["rows"] = len(result)
+            elif method == "fetchone":
+                self._last["rows"] = 0 if result is None else 1
+        return result
+    
+    def fetchall(self):
+        return self._fetch("fetchall")
+    
+    def fetchone(self):
+        return self._fetch("fetchone")
+    
+    def fetchmany(self, *args):
+        return self._fetch("fetchmany", *args)
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+# Shared by the executor and the overlay
+profiler = Profiler()
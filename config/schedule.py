@@ -0,0 +1,10 @@
+"""
+Task timing rules shared by the forms and the conflict checks
+
+A task's time is optional: without one (NULL) it is an all-day task. A
+timed task lasts its duration in minutes, or DEFAULT_DURATION when it has
+none (see storage.conflicts).
+"""
+
+# Minutes a timed task takes when it has no duration of its own
+DEFAULT_DURATION = 60
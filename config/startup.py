@@ -0,0 +1,67 @@
+import time
+import threading
+from contextlib import contextmanager
+from functools import wraps
+
+
+# Cold-start timing. main.py imports this module first, so the clock starts
+# before any other application module is loaded. The report is printed once,
+# when the dashboard first shows live data.
+
+started = time.perf_counter()
+
+_phases = {}  # phase name -> seconds
+_lock = threading.Lock()
+_reported = False
+
+
+def record(name, seconds):
+    """Add time to a phase (ignored once the report has been printed)"""
+    if _reported:
+        return
+    with _lock:
+        _phases[name] = _phases.get(name, 0.0) + seconds
+
+
+def mark(name, since=None):
+    """Record the time from since (default: process start) until now as a phase"""
+    record(name, time.perf_counter() - (started if since is None else since))
+    return time.perf_counter()
+
+
+@contextmanager
+def phase(name):
+    """Time a block as a phase"""
+    begun = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - begun)
+
+
+def timed(name, work):
+    """Wrap a background job so its run time counts towards a phase"""
+    @wraps(work)
+    def run(cursor):
+        with phase(name):
+            return work(cursor)
+    return run
+
+
+def report():
+    """Print the startup breakdown once"""
+    global _reported
+    if _reported:
+        return
+    _reported = True
+    
+    from config.database import Database
+    connect_time = Database.pool_stats()["connect_time"]
+    
+    total = time.perf_counter() - started
+    parts = [f"{name} {_phases[name] * 1000:.1f} ms"
+             for name in ("import", "window", "ui", "snapshot") if name in _phases]
+    parts.append(f"connect {connect_time * 1000:.1f} ms")
+    parts.extend(f"{name} {_phases[name] * 1000:.1f} ms"
+                 for name in ("query", "render") if name in _phases)
+    print(f"[STARTUP] {', '.join(parts)}; live dashboard after {total * 1000:.1f} ms")
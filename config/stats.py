@@ -0,0 +1,97 @@
+import threading
+from config.database import Database
+
+
+# Dashboard counters are kept in two small tables (created by the schema
+# migrations) that every write path updates inside its own transaction:
+#   planner_counters    name -> value for users, activities and tasks
+#   planner_task_dates  date -> number of tasks on that date (for "Upcoming")
+
+_ready = False
+_ready_lock = threading.Lock()
+
+
+def ensure_stats_tables(cursor):
+    """Make sure the counter tables exist (schema migration v2 creates and seeds them)"""
+    global _ready
+    if _ready:
+        return
+    
+    with _ready_lock:
+        if _ready:
+            return
+        
+        from config.migrations import verify_schema
+        verify_schema(cursor)
+        _ready = True
+
+
+def rebuild_counters(cursor):
+    """Recompute every counter from the tasks table"""
+    cursor.execute("DELETE FROM planner_counters")
+    cursor.execute("""
+        INSERT INTO planner_counters (name, value)
+        SELECT 'users', COUNT(DISTINCT user_id) FROM tasks
+        UNION ALL
+        SELECT 'activities', COUNT(DISTINCT activity_id) FROM tasks
+        UNION ALL
+        SELECT 'tasks', COUNT(*) FROM tasks
+    """)
+    
+    cursor.execute("DELETE FROM planner_task_dates")
+    cursor.execute("""
+        INSERT INTO planner_task_dates (date, task_count)
+        SELECT date, COUNT(*) FROM tasks GROUP BY date
+    """)
+    print("[STATS] Rebuilt dashboard counters")
+
+
+def fetch_dashboard_stats(cursor):
+    """
+    Return (active users, active activities, total tasks, upcoming tasks)
+    
+    One statement over the counter tables, so the cost does not grow
+    with the tasks table.
+    """
+    ensure_stats_tables(cursor)
+    
+    cursor.execute(f"""
+        SELECT
+            (SELECT value FROM planner_counters WHERE name = 'users'),
+            (SELECT value FROM planner_counters WHERE name = 'activities'),
+            (SELECT value FROM planner_counters WHERE name = 'tasks'),
+            (SELECT COALESCE(SUM(task_count), 0) FROM planner_task_dates
+             WHERE date >= {Database.backend().today})
+    """)
+    return tuple(int(value or 0) for value in cursor.fetchone())
+
+
+def adjust_counters(cursor, users=0, activities=0, tasks=0):
+    """Apply deltas to the counters (call inside the write's transaction)"""
+    ensure_stats_tables(cursor)
+    
+    for name, delta in (("users", users), ("activities", activities), ("tasks", tasks)):
+        if delta:
+            cursor.execute("UPDATE planner_counters SET value = value + %s WHERE name = %s",
+                          (delta, name))
+
+
+def adjust_task_dates(cursor, deltas):
+    """
+    Apply per-date task count deltas
+    
+    Args:
+        deltas: dict of 'YYYY-MM-DD' (or date) -> change in task count
+    """
+    ensure_stats_tables(cursor)
+    
+    upsert = Database.backend().upsert_increment("planner_task_dates", "date", "task_count")
+    for date, delta in deltas.items():
+        if not delta:
+            continue
+        # Both backends compare dates as 'YYYY-MM-DD'
+        date = str(date)
+        cursor.execute(upsert, (date, delta))
+        if delta < 0:
+            cursor.execute("DELETE FROM planner_task_dates WHERE date = %s AND task_count <= 0",
+                          (date,))
@@ -1,16 +1,34 @@
+from config import startup  # first, so the startup clock covers every import
+import importlib
 import tkinter as tk
+from collections import OrderedDict
 from config.styles import *
+from config.database import Database
+from config.executor import install_executor, submit_query
+from config.migrations import verify_schema
+from storage import changes, snapshot
+from storage.cache import query_cache
 from components.sidebar import Sidebar
-from views.dashboard import show_dashboard
-from views.create import show_create
-from views.manage import show_manage
-from views.reports import show_reports
+
+
+# View modules are imported on first navigation, so only the first tab's
+# module (and none of create/manage's tkcalendar) loads before first paint
+VIEW_BUILDERS = {
+    "dashboard": ("views.dashboard", "show_dashboard"),
+    "create": ("views.create", "show_create"),
+    "manage": ("views.manage", "show_manage"),
+    "reports": ("views.reports", "show_reports")
+}
+
+POOL_PRUNE_INTERVAL = 60000  # ms between idle connection sweeps
+MAX_LIVE_VIEWS = 4           # Tab frames kept built; the least recently shown is destroyed first
 
 
 class SchedulePlannerApp:
     """Main application class"""
     
     def __init__(self):
+        window_started = startup.mark("import")
         self.root = tk.Tk()
         self.root.title("Smart Schedule Planner")
         self.root.geometry("1400x800")
@@ -21,7 +39,17 @@ class SchedulePlannerApp:
         self.root.grid_columnconfigure(1, weight=1)
         
         self.current_tab = None
+        # tab name -> {"frame", "refresh", "versions", "stale"}, least recently shown first
+        self.views = OrderedDict()
+        self.executor = install_executor(self.root)
+        # Bring planner_db up to the current schema before any view queries it
+        submit_query(verify_schema)
+        # Other clients' edits arrive through the shared change feed
+        self.change_feed = changes.ChangeFeed()
+        
+        ui_started = startup.mark("window", since=window_started)
         self._setup_ui()
+        startup.mark("ui", since=ui_started)
     
     def _setup_ui(self):
         """Setup main UI components"""
@@ -32,37 +60,127 @@ class SchedulePlannerApp:
         self.main_content = tk.Frame(self.root, bg=BG_MAIN)
         self.main_content.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
         
+        # F12 shows query/render timings over the window
+        self.perf_overlay = None
+        self.root.bind("<F12>", self.toggle_perf_overlay)
+        
         # Show initial tab
         self.show_tab("dashboard")
     
-    def clear_content(self):
-        """Clear main content area"""
-        for widget in self.main_content.winfo_children():
-            widget.destroy()
-    
     def show_tab(self, tab_name):
         """
         Navigate to a specific tab
         
+        Each tab is built once and then hidden/shown. A tab is refreshed when
+        it is shown again only if data changed while it was hidden (or its
+        load was cancelled when it was left).
+        
         Args:
             tab_name: Name of tab to display (dashboard, create, manage, reports)
         """
+        if self.current_tab == tab_name:
+            # Clicking the current tab reloads it
+            view = self.views.get(tab_name)
+            if view and view["refresh"]:
+                view["refresh"]()
+            return
+        
+        if self.current_tab:
+            self._hide_view(self.current_tab)
+        
         self.current_tab = tab_name
-        self.clear_content()
-        
-        # Display the appropriate view
-        if tab_name == "dashboard":
-            show_dashboard(self.main_content)
-        elif tab_name == "create":
-            show_create(self.main_content)
-        elif tab_name == "manage":
-            show_manage(self.main_content)
-        elif tab_name == "reports":
-            show_reports(self.main_content)
+        view = self.views.get(tab_name)
+        if view is None:
+            self._build_view(tab_name)
+        else:
+            self.views.move_to_end(tab_name)
+            view["frame"].pack(fill="both", expand=True)
+            if view["refresh"] and (view["stale"] or view["versions"] != query_cache.versions()):
+                view["refresh"]()
+            view["stale"] = False
+        
+        self._evict_views()
+    
+    def _build_view(self, tab_name):
+        """Build a tab's frame for the first time"""
+        frame = tk.Frame(self.main_content, bg=BG_MAIN)
+        frame.pack(fill="both", expand=True)
+        
+        module_name, builder_name = VIEW_BUILDERS[tab_name]
+        builder = getattr(importlib.import_module(module_name), builder_name)
+        
+        # Builders return a refresh function (None if the view shows no data)
+        if tab_name == "create":
+            refresh = builder(frame, on_created=self._on_schedule_created)
+        else:
+            refresh = builder(frame)
+        
+        self.views[tab_name] = {"frame": frame, "refresh": refresh,
+                                "versions": None, "stale": False}
+    
+    def _hide_view(self, tab_name):
+        """Hide a tab, remembering the data versions it reflects"""
+        view = self.views.get(tab_name)
+        if view is None:
+            return
+        
+        # Results for the tab being left are no longer wanted; if a load was
+        # still running the tab must reload when shown again
+        if self.executor.cancel_group(tab_name):
+            view["stale"] = True
+        view["versions"] = query_cache.versions()
+        view["frame"].pack_forget()
+    
+    def _evict_views(self):
+        """Destroy the least recently shown tabs beyond MAX_LIVE_VIEWS"""
+        while len(self.views) > MAX_LIVE_VIEWS:
+            tab_name = next(name for name in self.views if name != self.current_tab)
+            self.executor.cancel_group(tab_name)
+            self.views.pop(tab_name)["frame"].destroy()
+    
+    def _on_schedule_created(self):
+        """Show the dashboard after a save, unless the user already navigated away"""
+        if self.current_tab == "create":
+            self.show_tab("dashboard")
+    
+    def toggle_perf_overlay(self, event=None):
+        """Show or hide the performance overlay (built on first use)"""
+        if self.perf_overlay is None:
+            from components.perf_overlay import PerformanceOverlay
+            self.perf_overlay = PerformanceOverlay(self.root)
+        self.perf_overlay.toggle()
+    
+    def _prune_pool(self):
+        """Periodically close pooled connections that sat idle too long"""
+        Database.pool().prune()
+        self.root.after(POOL_PRUNE_INTERVAL, self._prune_pool)
+    
+    def _poll_changes(self):
+        """Read other clients' changes and hand them to the views, then poll again"""
+        def on_polled(new_changes):
+            changes.publish_remote(new_changes)
+            self.root.after(changes.CHANGE_POLL_INTERVAL, self._poll_changes)
+        
+        def on_error(e):
+            print(f"[ERROR] Change feed poll failed: {e}")
+            self.root.after(changes.CHANGE_POLL_INTERVAL, self._poll_changes)
+        
+        submit_query(self.change_feed.poll, on_polled, on_error, label="change_feed")
     
     def run(self):
         """Start the application"""
-        self.root.mainloop()
+        self.root.after(POOL_PRUNE_INTERVAL, self._prune_pool)
+        self._poll_changes()
+        try:
+            self.root.mainloop()
+        finally:
+            self.executor.shutdown()
+            try:
+                # Next startup paints this right away
+                snapshot.save()
+            except Exception as e:
+                print(f"[ERROR] Could not save dashboard snapshot: {e}")
+            Database.close_pool()
 
 
 if __name__ == "__main__":
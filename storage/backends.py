@@ -0,0 +1,310 @@
+"""
+Storage backends
+
+A backend opens raw connections and supplies the few pieces of SQL that
+differ between engines. Everything else in the repository is written
+once in portable SQL with %s placeholders.
+"""
+import os
+
+
+class MySQLBackend:
+    """MariaDB/MySQL server through mysql-connector"""
+    
+    name = "mysql"
+    today = "CURDATE()"
+    autoincrement_pk = "INT AUTO_INCREMENT PRIMARY KEY"
+    
+    def __init__(self, settings):
+        self.settings = dict(settings)
+        # Identifies the data set (e.g. for files cached from it)
+        self.source = f"mysql://{self.settings.get('host')}/{self.settings.get('database')}"
+    
+    def connect(self):
+        """Open a new raw connection"""
+        import mysql.connector
+        conn = mysql.connector.connect(**self.settings)
+        if not conn.is_connected():
+            raise ConnectionError("Connection to database was not established")
+        return conn
+    
+    def create_database(self):
+        """Create the database itself if it does not exist"""
+        import mysql.connector
+        settings = dict(self.settings)
+        database = settings.pop("database")
+        conn = mysql.connector.connect(**settings)
+        try:
+            conn.cursor().execute(f"CREATE DATABASE IF NOT EXISTS `{database}`")
+        finally:
+            conn.close()
+    
+    def concat(self, *parts):
+        return f"CONCAT({', '.join(parts)})"
+    
+    def upsert_increment(self, table, key, column):
+        """
+        INSERT that adds to column when the key row already exists
+        
+        key and column may each be one name or a tuple of names; parameters
+        are the key values followed by the column deltas.
+        """
+        keys, columns = _names(key), _names(column)
+        updates = ", ".join(f"{c} = {c} + VALUES({c})" for c in columns)
+        return f"""
+            INSERT INTO {table} ({", ".join(keys + columns)}) VALUES ({_placeholders(keys + columns)})
+            ON DUPLICATE KEY UPDATE {updates}
+        """
+    
+    def index_columns(self, cursor, table):
+        """Return {index name: [column, ...]} for a table"""
+        cursor.execute("""
+            SELECT INDEX_NAME, COLUMN_NAME FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+            ORDER BY INDEX_NAME, SEQ_IN_INDEX
+        """, (table,))
+        indexes = {}
+        for index_name, column in cursor.fetchall():
+            indexes.setdefault(index_name, []).append(column.lower())
+        return indexes
+    
+    def next_auto_increment(self, cursor, table):
+        """Return the id the next INSERT would get (None if unknown)"""
+        try:
+            # MySQL 8 caches information_schema statistics; ask for live values
+            cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+        except Exception:
+            pass
+        cursor.execute("""
+            SELECT AUTO_INCREMENT FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """, (table,))
+        result = cursor.fetchone()
+        return result[0] if result else None
+    
+    def set_auto_increment(self, cursor, table, value):
+        cursor.execute(f"ALTER TABLE {table} AUTO_INCREMENT = {int(value)}")
+    
+    def create_search_index(self, cursor):
+        """Add the FULLTEXT indexes search_matches() reads"""
+        for table, name, columns in (("tasks", "ft_tasks_text", ("task_title", "description")),
+                                     ("activities", "ft_activities_name", ("activity_name",))):
+            if name not in self.index_columns(cursor, table):
+                cursor.execute(f"ALTER TABLE {table} ADD FULLTEXT INDEX {name} ({', '.join(columns)})")
+                print(f"[MIGRATE] Created full-text index {name} on {table}({', '.join(columns)})")
+    
+    def search_matches(self, terms, ranked=True):
+        """
+        Return (sql, params) selecting (task_id, relevance) for tasks matching every term
+        
+        Each term matches as a word prefix in the task's title and
+        description or in its activity name, so the words of one search may
+        be split between the two (as in the SQLite index). Higher relevance
+        is better (title/description hits weigh double); it is NULL when
+        not ranked. Terms shorter than innodb_ft_min_token_size or on the
+        stopword list match nothing.
+        """
+        hits = []
+        for position, _ in enumerate(terms):
+            hits.append(f"""
+                SELECT task_id, {position} AS term,
+                       MATCH(task_title, description) AGAINST (%s IN BOOLEAN MODE) * 2 AS score
+                FROM tasks
+                WHERE MATCH(task_title, description) AGAINST (%s IN BOOLEAN MODE)
+                UNION ALL
+                SELECT t.task_id, {position}, MATCH(a.activity_name) AGAINST (%s IN BOOLEAN MODE)
+                FROM activities a
+                JOIN tasks t ON t.activity_id = a.activity_id
+                WHERE MATCH(a.activity_name) AGAINST (%s IN BOOLEAN MODE)""")
+        union = "\n                UNION ALL".join(hits)
+        sql = f"""
+            SELECT task_id, {"SUM(score)" if ranked else "NULL"} AS relevance
+            FROM ({union}
+            ) hits
+            GROUP BY task_id
+            HAVING COUNT(DISTINCT term) = {len(terms)}
+        """
+        return sql, tuple(f"{term}*" for term in terms for _ in range(4))
+
+
+class SQLiteCursor:
+    """sqlite3 cursor that accepts the repository's %s placeholders"""
+    
+    def __init__(self, cursor):
+        self._cursor = cursor
+    
+    def execute(self, query, params=()):
+        return self._cursor.execute(query.replace("%s", "?"), tuple(params))
+    
+    def executemany(self, query, seq_of_params):
+        return self._cursor.executemany(query.replace("%s", "?"), seq_of_params)
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class SQLiteConnection:
+    """sqlite3 connection with the small part of the mysql-connector API the app uses"""
+    
+    def __init__(self, conn):
+        self._conn = conn
+    
+    def cursor(self):
+        return SQLiteCursor(self._conn.cursor())
+    
+    def ping(self, reconnect=False):
+        self._conn.execute("SELECT 1")
+    
+    def is_connected(self):
+        try:
+            self.ping()
+            return True
+        except Exception:
+            return False
+    
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class SQLiteBackend:
+    """Embedded single-file database; no server round trips"""
+    
+    name = "sqlite"
+    today = "DATE('now', 'localtime')"
+    autoincrement_pk = "INTEGER PRIMARY KEY AUTOINCREMENT"
+    
+    def __init__(self, path):
+        self.path = path
+        # Identifies the data set (e.g. for files cached from it)
+        self.source = f"sqlite://{os.path.abspath(path)}"
+    
+    def connect(self):
+        """Open a new raw connection"""
+        import sqlite3
+        # Pooled connections move between worker threads, one at a time
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return SQLiteConnection(conn)
+    
+    def create_database(self):
+        """The database file is created on first connect"""
+        self.connect().close()
+    
+    def concat(self, *parts):
+        return " || ".join(parts)
+    
+    def upsert_increment(self, table, key, column):
+        """INSERT that adds to column when the key row already exists (see MySQLBackend)"""
+        keys, columns = _names(key), _names(column)
+        updates = ", ".join(f"{c} = {c} + excluded.{c}" for c in columns)
+        return f"""
+            INSERT INTO {table} ({", ".join(keys + columns)}) VALUES ({_placeholders(keys + columns)})
+            ON CONFLICT({", ".join(keys)}) DO UPDATE SET {updates}
+        """
+    
+    def index_columns(self, cursor, table):
+        """Return {index name: [column, ...]} for a table"""
+        cursor.execute(f"PRAGMA index_list({table})")
+        names = [row[1] for row in cursor.fetchall()]
+        indexes = {}
+        for name in names:
+            cursor.execute(f"PRAGMA index_info({name})")
+            indexes[name] = [row[2].lower() for row in sorted(cursor.fetchall())]
+        return indexes
+    
+    def next_auto_increment(self, cursor, table):
+        """Return the id the next INSERT would get (None if unknown)"""
+        cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = %s", (table,))
+        result = cursor.fetchone()
+        return result[0] + 1 if result else None
+    
+    def set_auto_increment(self, cursor, table, value):
+        cursor.execute("UPDATE sqlite_sequence SET seq = %s WHERE name = %s",
+                      (int(value) - 1, table))
+    
+    def create_search_index(self, cursor):
+        """
+        Create the task_search FTS5 table that search_matches() reads
+        
+        One row per task (rowid = task_id) holds its title, description
+        and activity name; triggers keep it in step with every write to
+        tasks and activities, whichever client makes it.
+        """
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS task_search
+            USING fts5(task_title, description, activity_name, prefix='1 2 3 4')
+        """)
+        # Column weights for rank: title, description, activity name
+        cursor.execute("INSERT INTO task_search (task_search, rank) VALUES ('rank', 'bm25(3.0, 1.0, 2.0)')")
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS task_search_insert AFTER INSERT ON tasks BEGIN
+                INSERT INTO task_search (rowid, task_title, description, activity_name)
+                VALUES (new.task_id, new.task_title, new.description,
+                        (SELECT activity_name FROM activities WHERE activity_id = new.activity_id));
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS task_search_update
+            AFTER UPDATE OF task_title, description, activity_id ON tasks BEGIN
+                UPDATE task_search
+                SET task_title = new.task_title, description = new.description,
+                    activity_name = (SELECT activity_name FROM activities
+                                     WHERE activity_id = new.activity_id)
+                WHERE rowid = old.task_id;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS task_search_delete AFTER DELETE ON tasks BEGIN
+                DELETE FROM task_search WHERE rowid = old.task_id;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS task_search_activity
+            AFTER UPDATE OF activity_name ON activities BEGIN
+                UPDATE task_search SET activity_name = new.activity_name
+                WHERE rowid IN (SELECT task_id FROM tasks WHERE activity_id = new.activity_id);
+            END
+        """)
+        cursor.execute("DELETE FROM task_search")
+        cursor.execute("""
+            INSERT INTO task_search (rowid, task_title, description, activity_name)
+            SELECT t.task_id, t.task_title, t.description, a.activity_name
+            FROM tasks t
+            LEFT JOIN activities a ON t.activity_id = a.activity_id
+        """)
+        print("[MIGRATE] Created full-text table task_search")
+    
+    def search_matches(self, terms, ranked=True):
+        """
+        Return (sql, params) selecting (task_id, relevance) for tasks matching every term
+        
+        Each term matches as a word prefix anywhere in the task's title,
+        description or activity name. Higher relevance is better (bm25
+        with the column weights set in create_search_index); it is NULL
+        when not ranked, which spares computing bm25 for every match.
+        """
+        query = " ".join(f'"{term}"*' for term in terms)
+        sql = f"""
+            SELECT rowid AS task_id, {"-rank" if ranked else "NULL"} AS relevance
+            FROM task_search
+            WHERE task_search MATCH %s
+        """
+        return sql, (query,)
+
+
+def create_backend(name, mysql_settings=None, sqlite_path=None):
+    """Build a backend by name ('mysql' or 'sqlite')"""
+    if name == "mysql":
+        return MySQLBackend(mysql_settings or {})
+    if name == "sqlite":
+        return SQLiteBackend(sqlite_path)
+    raise ValueError(f"Unknown database backend: {name}")
+
+
+def _names(names):
+    return (names,) if isinstance(names, str) else tuple(names)
+
+
+def _placeholders(names):
+    return ", ".join(["%s"] * len(names))
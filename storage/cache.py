@@ -0,0 +1,144 @@
+import time
+import threading
+from collections import OrderedDict
+
+
+# Cache settings
+CACHE_MAX_ENTRIES = 256     # Result sets kept at most
+CACHE_MAX_ROWS = 50000      # Total rows kept across all entries
+CACHE_MAX_AGE = 300         # Seconds before an entry is re-read (picks up other clients' writes)
+
+# Tables a cached result can depend on
+TABLES = ("users", "activities", "tasks")
+
+
+class QueryCache:
+    """
+    LRU cache of query results with per-table versions
+    
+    Every entry records the version of each table it was read from. A write
+    bumps the versions of the tables it changed, so exactly the entries that
+    read those tables stop matching; everything else stays cached.
+    """
+    
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, max_rows=CACHE_MAX_ROWS,
+                 max_age=CACHE_MAX_AGE):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.max_age = max_age
+        
+        self._entries = OrderedDict()  # key -> (versions, stored_at, size, result)
+        self._versions = dict.fromkeys(TABLES, 0)
+        self._rows = 0
+        self._lock = threading.Lock()
+        self._pending = threading.local()
+        
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    def fetch(self, key, tables, load):
+        """
+        Return the cached result for key, or call load() and cache what it returns
+        
+        Args:
+            key: Hashable query identity (query name plus parameters)
+            tables: Tables the result is read from
+            load: Callable running the query; its result must not be mutated
+        """
+        with self._lock:
+            versions = tuple(self._versions[table] for table in tables)
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_versions, stored_at, _, result = entry
+                if stored_versions == versions and time.monotonic() - stored_at <= self.max_age:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return result
+                self._drop(key)
+            self._misses += 1
+        
+        # Versions were captured before the query ran, so a write that commits
+        # meanwhile leaves this entry already out of date
+        result = load()
+        self._store(key, versions, result)
+        return result
+    
+    def _store(self, key, versions, result):
+        size = len(result) if isinstance(result, (list, tuple)) else 1
+        if size > self.max_rows:
+            return
+        
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (versions, time.monotonic(), size, result)
+            self._rows += size
+            
+            while len(self._entries) > self.max_entries or self._rows > self.max_rows:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._evictions += 1
+    
+    def _drop(self, key):
+        _, _, size, _ = self._entries.pop(key)
+        self._rows -= size
+    
+    def invalidate(self, *tables):
+        """
+        Mark tables as changed by the current thread's transaction
+        
+        Versions are bumped now and again when the transaction commits, so
+        readers cannot cache data from between the write and its commit.
+        """
+        self._bump(tables)
+        pending = getattr(self._pending, "tables", None)
+        if pending is None:
+            pending = self._pending.tables = set()
+        pending.update(tables)
+    
+    def committed(self):
+        """Call after the current thread commits"""
+        pending = getattr(self._pending, "tables", None)
+        if pending:
+            self._bump(pending)
+        self._pending.tables = None
+    
+    def rolled_back(self):
+        """Call after the current thread rolls back"""
+        self._pending.tables = None
+    
+    def _bump(self, tables):
+        with self._lock:
+            for table in tables:
+                self._versions[table] += 1
+    
+    def versions(self, tables=TABLES):
+        """Return the current versions of tables (changes whenever one is written)"""
+        with self._lock:
+            return tuple(self._versions[table] for table in tables)
+    
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+            for table in self._versions:
+                self._versions[table] += 1
+    
+    def stats(self):
+        """Return a snapshot of cache metrics"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "rows": self._rows,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0
+            }
+
+
+# Shared by every query in the process
+query_cache = QueryCache()
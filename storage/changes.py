@@ -0,0 +1,171 @@
+"""
+Change feed shared by every client of planner_db
+
+Every write path in storage.repository appends one row to planner_changes
+(created by schema migration v5) inside its own transaction: an
+auto-increment version, the writing client, the kind of change and the
+task, activity and user ids it touched. Each client polls the rows after
+the last version it has seen, so edits made by other clients reach the
+open views as small deltas instead of full reloads (published on the
+event bus in config.events, like local edits).
+"""
+import time
+import uuid
+from config.events import (ACTIVITY_STATUS_CHANGED, DATA_RESET, TASK_CREATED, TASK_DELETED,
+                           TASK_UPDATED, events)
+from config.stats import ensure_stats_tables
+from storage.cache import TABLES, query_cache
+
+
+# Feed settings
+CHANGE_POLL_INTERVAL = 2000   # ms between polls from the main window
+CHANGE_BATCH_LIMIT = 500      # Rows read per poll; more means "reload everything"
+CHANGE_GAP_TIMEOUT = 10       # Seconds to wait for a skipped version to commit
+CHANGE_LOG_KEEP = 10000       # Newest rows kept in planner_changes
+PRUNE_EVERY = 100             # Polls between prunes
+
+# Identifies this process in planner_changes, so its own writes are skipped
+CLIENT_ID = uuid.uuid4().hex[:16]
+
+# Event published for each kind of change (see config.events)
+CHANGE_EVENTS = {
+    "create": TASK_CREATED,
+    "update": TASK_UPDATED,
+    "status": ACTIVITY_STATUS_CHANGED,
+    "delete": TASK_DELETED,
+    "reset": DATA_RESET,
+}
+
+# Tables whose cached results a change of each kind makes stale
+CHANGE_TABLES = {
+    "create": TABLES,
+    "update": TABLES,
+    "status": ("activities",),
+    "delete": TABLES,
+}
+
+
+def _ids(values):
+    return ",".join(str(int(value)) for value in sorted(set(values)))
+
+
+def _parse_ids(text):
+    return [int(value) for value in text.split(",")] if text else []
+
+
+def record_change(cursor, kind, task_ids=(), activity_ids=(), user_ids=()):
+    """Append a change row (call inside the write's transaction)"""
+    ensure_stats_tables(cursor)
+    cursor.execute("""
+        INSERT INTO planner_changes (client, kind, task_ids, activity_ids, user_ids)
+        VALUES (%s, %s, %s, %s, %s)
+    """, (CLIENT_ID, kind, _ids(task_ids), _ids(activity_ids), _ids(user_ids)))
+
+
+def latest_version(cursor):
+    """Return the newest version in the feed (0 when empty)"""
+    cursor.execute("SELECT COALESCE(MAX(version), 0) FROM planner_changes")
+    return int(cursor.fetchone()[0])
+
+
+class ChangeFeed:
+    """
+    Reads other clients' changes in version order
+    
+    Versions are auto-increment ids handed out when a transaction inserts
+    its row, so a later version can commit first. A missing version holds
+    the read position back for up to CHANGE_GAP_TIMEOUT seconds, and
+    versions already delivered past it are skipped when it is read again.
+    Rolled back transactions leave gaps that simply time out.
+    """
+    
+    def __init__(self, client_id=CLIENT_ID):
+        self.client_id = client_id
+        self.since = None       # Every version up to this one has been handled
+        self._seen = set()      # Versions above since already delivered
+        self._gaps = {}         # Missing version -> first time it was noticed
+        self._polls = 0
+    
+    def poll(self, cursor):
+        """
+        Return the changes committed by other clients since the last poll
+        
+        Each change is a dict with version, kind, task_ids, activity_ids
+        and user_ids. A single {"kind": "reset"} change means too much
+        happened to apply as deltas (reload everything). Cached results of
+        the affected tables are invalidated here, on the worker thread.
+        """
+        ensure_stats_tables(cursor)
+        if self.since is None:
+            self.since = latest_version(cursor)
+            return []
+        
+        self._polls += 1
+        if self._polls % PRUNE_EVERY == 0:
+            self.prune(cursor)
+        
+        cursor.execute(f"""
+            SELECT version, client, kind, task_ids, activity_ids, user_ids
+            FROM planner_changes
+            WHERE version > %s
+            ORDER BY version
+            LIMIT {int(CHANGE_BATCH_LIMIT)}
+        """, (self.since,))
+        rows = cursor.fetchall()
+        
+        if len(rows) == CHANGE_BATCH_LIMIT:
+            # Too far behind to patch views row by row
+            self.since = rows[-1][0]
+            self._seen.clear()
+            self._gaps.clear()
+            query_cache.invalidate(*TABLES)
+            return [{"kind": "reset"}]
+        
+        changes = []
+        for version, client, kind, task_ids, activity_ids, user_ids in rows:
+            if version in self._seen:
+                continue
+            self._seen.add(version)
+            if client == self.client_id:
+                continue
+            changes.append({
+                "version": version,
+                "kind": kind,
+                "task_ids": _parse_ids(task_ids),
+                "activity_ids": _parse_ids(activity_ids),
+                "user_ids": _parse_ids(user_ids),
+            })
+        self._advance()
+        
+        tables = {table for change in changes for table in CHANGE_TABLES.get(change["kind"], ())}
+        if tables:
+            query_cache.invalidate(*tables)
+        return changes
+    
+    def _advance(self):
+        """Move since over delivered versions and over gaps that timed out"""
+        now = time.monotonic()
+        while self._seen:
+            following = self.since + 1
+            if following in self._seen:
+                self._seen.discard(following)
+                self._gaps.pop(following, None)
+                self.since = following
+            elif now - self._gaps.setdefault(following, now) > CHANGE_GAP_TIMEOUT:
+                self._gaps.pop(following)
+                self.since = following
+            else:
+                break
+    
+    def prune(self, cursor):
+        """Drop all but the newest CHANGE_LOG_KEEP rows"""
+        cursor.execute("DELETE FROM planner_changes WHERE version <= %s",
+                       (latest_version(cursor) - CHANGE_LOG_KEEP,))
+
+
+def publish_remote(changes):
+    """Publish polled changes on the event bus with remote=True (call on the UI thread)"""
+    for change in changes:
+        change = dict(change)
+        # Kinds written by a newer client fall back to a full reload
+        events.publish(CHANGE_EVENTS.get(change.pop("kind"), DATA_RESET), remote=True, **change)
@@ -0,0 +1,278 @@
+"""
+Double-booking checks over task times
+
+A timed task occupies [start, start + duration) on its date, with the
+duration in minutes (tasks.duration, added by schema migration v7; NULL
+means DEFAULT_DURATION). Tasks without a time are all-day and never
+conflict. Two tasks of one person conflict when their spans overlap;
+spans that only touch (10:00-11:00 and 11:00-12:00) do not.
+
+    IntervalIndex     one person's spans sorted by start; a lookup is two
+                      bisects plus the spans it returns
+    check_schedule    what the Create form and update popup show while
+                      they are filled in: each task's overlaps with the
+                      person's saved tasks and with the rest of the form
+    find_conflicts    every overlapping pair from one sort and a sweep per
+                      person, O(n log n) plus the pairs reported
+
+Run directly for a text report of the whole database:
+    python -m storage.conflicts
+"""
+import argparse
+import heapq
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from operator import itemgetter
+from config.database import Database
+from config.schedule import DEFAULT_DURATION
+from storage.cache import query_cache
+
+
+MINUTES_PER_DAY = 24 * 60
+
+
+# Tasks share few distinct dates and times, so each is converted once
+@lru_cache(maxsize=4096)
+def _minute_of_day(value):
+    """Minutes after midnight of a TIME value (timedelta on MySQL, text on SQLite)"""
+    if isinstance(value, timedelta):
+        return int(value.total_seconds()) // 60
+    if isinstance(value, time):
+        return value.hour * 60 + value.minute
+    hour, minute = str(value).split(":")[:2]
+    return int(hour) * 60 + int(minute)
+
+
+@lru_cache(maxsize=4096)
+def _day_start(day):
+    """Minutes since 0001-01-01 at the start of a DATE value (date on MySQL, text on SQLite)"""
+    if not isinstance(day, date):
+        day = date.fromisoformat(str(day)[:10])
+    return day.toordinal() * MINUTES_PER_DAY
+
+
+def task_span(day, start_time, duration=None):
+    """
+    Return (start, end) in minutes since 0001-01-01 for a timed task
+    
+    Returns None for a task without a time.
+    """
+    if start_time is None or start_time == "":
+        return None
+    start = _day_start(day) + _minute_of_day(start_time)
+    return start, start + (duration or DEFAULT_DURATION)
+
+
+def span_day(start):
+    """Date a span starts on"""
+    return _ordinal_day(start // MINUTES_PER_DAY)
+
+
+@lru_cache(maxsize=4096)
+def _ordinal_day(ordinal):
+    return date.fromordinal(ordinal)
+
+
+@lru_cache(maxsize=MINUTES_PER_DAY)
+def _clock(minute_of_day):
+    return f"{minute_of_day // 60:02d}:{minute_of_day % 60:02d}"
+
+
+def format_span(start, end):
+    """'09:00–10:30' for a span (end times past midnight read as the clock shows them)"""
+    return f"{_clock(start % MINUTES_PER_DAY)}–{_clock(end % MINUTES_PER_DAY)}"
+
+
+class IntervalIndex:
+    """
+    Spans (start, end, task_id, title) of one person, sorted by start
+    
+    Spans starting at or after a lookup's end cannot overlap it, and
+    neither can spans starting more than the longest duration before its
+    start, so two bisects bound the spans that are compared at all.
+    """
+    
+    def __init__(self, spans=()):
+        self._spans = sorted(spans, key=itemgetter(0))
+        self._starts = [span[0] for span in self._spans]
+        self._longest = max((span[1] - span[0] for span in self._spans), default=0)
+    
+    def __len__(self):
+        return len(self._spans)
+    
+    def overlapping(self, start, end, exclude=None):
+        """Spans overlapping [start, end) in start order, leaving out task_id exclude"""
+        first = bisect_right(self._starts, start - self._longest)
+        last = bisect_left(self._starts, end)
+        return [span for span in self._spans[first:last]
+                if span[1] > start and (exclude is None or span[2] != exclude)]
+
+
+def person_key(first_name, last_name):
+    """
+    Identity of a person: every user with the same name, ignoring case
+    
+    Names are case-folded in Python rather than with SQL LOWER(), which
+    SQLite applies to ASCII letters only.
+    """
+    return first_name.strip().casefold(), last_name.strip().casefold()
+
+
+def people(cursor):
+    """({user_id: person key}, {person key: display name}) over all users, for the report"""
+    def load():
+        cursor.execute("SELECT user_id, first_name, last_name FROM users")
+        keys, names = {}, {}
+        for user_id, first_name, last_name in cursor.fetchall():
+            keys[user_id] = person_key(first_name, last_name)
+            names.setdefault(keys[user_id], f"{first_name} {last_name}")
+        return keys, names
+    return query_cache.fetch(("people",), ("users",), load)
+
+
+def _name_spellings(cursor):
+    """{person key: [(first_name, last_name)]} of every distinct saved name (cached until users change)"""
+    def load():
+        cursor.execute("SELECT DISTINCT first_name, last_name FROM users")
+        spellings = {}
+        for first_name, last_name in cursor.fetchall():
+            spellings.setdefault(person_key(first_name, last_name), []).append((first_name, last_name))
+        return spellings
+    return query_cache.fetch(("name_spellings",), ("users",), load)
+
+
+def _person_spans(cursor, key):
+    spellings = _name_spellings(cursor).get(key)
+    if not spellings:
+        return []
+    # Users with one of the exact spellings first, so their tasks are read
+    # through idx_tasks_user; the key is checked again in case the column
+    # collation matched more than the spellings asked for
+    names = " OR ".join(["(first_name = %s AND last_name = %s)"] * len(spellings))
+    cursor.execute(f"""
+        SELECT t.task_id, t.task_title, t.date, t.time, t.duration, u.first_name, u.last_name
+        FROM tasks t
+        JOIN users u ON t.user_id = u.user_id
+        WHERE t.time IS NOT NULL AND t.user_id IN (SELECT user_id FROM users WHERE {names})
+    """, tuple(name for spelling in spellings for name in spelling))
+    return [task_span(day, start_time, duration) + (task_id, title)
+            for task_id, title, day, start_time, duration, first_name, last_name in cursor.fetchall()
+            if person_key(first_name, last_name) == key]
+
+
+def person_index(cursor, first_name, last_name):
+    """
+    IntervalIndex of the timed tasks saved under a name (cached until users or tasks change)
+    
+    The Create form makes a new user for every schedule, so a person's
+    tasks are those of every user with the same person_key. The index is
+    shared through the cache and must not be modified.
+    """
+    key = person_key(first_name, last_name)
+    return query_cache.fetch(("intervals",) + key, ("users", "tasks"),
+                             lambda: IntervalIndex(_person_spans(cursor, key)))
+
+
+def check_schedule(cursor, first_name, last_name, tasks, exclude=None):
+    """
+    Overlaps of the tasks in a form, with saved tasks and with each other
+    
+    Args:
+        tasks: (title, 'YYYY-MM-DD', time, duration) per task of the form
+        exclude: task_id of the task being edited (the form replaces it)
+    
+    Returns:
+        One list per task of the (start, end, title) spans it overlaps
+    """
+    saved = IntervalIndex()
+    if first_name.strip() and last_name.strip():
+        saved = person_index(cursor, first_name, last_name)
+    
+    spans = [task_span(day, start_time, duration) for _, day, start_time, duration in tasks]
+    in_form = IntervalIndex(span + (position, tasks[position][0])
+                            for position, span in enumerate(spans) if span)
+    
+    overlaps = []
+    for position, span in enumerate(spans):
+        hits = []
+        if span:
+            hits = (saved.overlapping(*span, exclude=exclude)
+                    + in_form.overlapping(*span, exclude=position))
+        overlaps.append(sorted((start, end, title) for start, end, _, title in hits))
+    return overlaps
+
+
+def find_conflicts(spans):
+    """
+    Yield every overlapping pair among (owner, start, end, ...) spans
+    
+    Spans are sorted by owner and start once; the sweep then keeps a heap
+    of the spans still open, so every span is pushed and popped once and
+    each pair it overlaps costs O(1). Pairs come out as (earlier, later).
+    """
+    open_spans = []
+    owner = None
+    for sequence, span in enumerate(sorted(spans, key=itemgetter(0, 1))):
+        if span[0] != owner:
+            owner = span[0]
+            open_spans = []
+        while open_spans and open_spans[0][0] <= span[1]:
+            heapq.heappop(open_spans)
+        for _, _, earlier in open_spans:
+            yield earlier, span
+        heapq.heappush(open_spans, (span[2], sequence, span))
+
+
+def fetch_conflicts(cursor):
+    """
+    Rows of the Schedule Conflicts report, one per overlapping pair of a person's tasks
+    
+    A person is every user with the same person_key, as in
+    person_index, so tasks from separate schedules of one person are
+    compared too. Rows are (name, date, first title, first span, second
+    title, second span, minutes of overlap): upcoming conflicts first
+    (soonest first), then past ones (latest first).
+    """
+    # Same person key as the form checks
+    keys, names = people(cursor)
+    
+    cursor.execute("""
+        SELECT t.user_id, t.task_id, t.task_title, t.date, t.time, t.duration
+        FROM tasks t
+        WHERE t.time IS NOT NULL
+    """)
+    spans = [(keys[user_id],) + task_span(day, start_time, duration) + (task_id, title)
+             for user_id, task_id, title, day, start_time, duration in cursor.fetchall()
+             if user_id in keys]
+    pairs = list(find_conflicts(spans))
+    
+    clock = datetime.now()
+    now = clock.toordinal() * MINUTES_PER_DAY + clock.hour * 60 + clock.minute
+    pairs.sort(key=lambda pair: (pair[0][1] < now, abs(pair[0][1] - now)))
+    return [(names[first[0]], span_day(first[1]).isoformat(),
+             first[4], format_span(first[1], first[2]),
+             second[4], format_span(second[1], second[2]),
+             min(first[2], second[2]) - second[1])
+            for first, second in pairs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List overlapping tasks of each person")
+    parser.add_argument("--limit", type=int, default=50, help="Rows to print (0 for all)")
+    args = parser.parse_args()
+    
+    conn = Database.pool().acquire()
+    try:
+        rows = fetch_conflicts(conn.cursor())
+    finally:
+        conn.close()
+        Database.close_pool()
+    
+    for name, day, first_title, first_span, second_title, second_span, overlap in rows[:args.limit or None]:
+        print(f"{day}  {name:<24} {first_title} ({first_span}) / {second_title} ({second_span}), {overlap} min")
+    print(f"{len(rows)} conflicting pairs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+In-memory manage listing
+
+When the schedule fits in memory (LISTING_MAX_ROWS tasks), the manage
+view loads every row once and filters and sorts here instead of asking
+the database on every keystroke or heading click. Each filter has its
+own index, so narrowing touches only the matching rows:
+    Priority, Status, Category  hash map of value -> task ids
+    Date                        task ids sorted by date, cut with bisect
+    User                        user id -> task ids, matched on the name
+    Search                      word -> task ids, with a sorted vocabulary
+                                for word prefixes (title, description and
+                                activity name, like the server search)
+Data change events keep it current through patch().
+"""
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from storage.repository import search_terms
+
+
+# Largest schedule held in memory; bigger ones are filtered by the server
+LISTING_MAX_ROWS = 50000
+
+ENUM_COLUMNS = {"Priority": 5, "Status": 6, "Category": 7}
+PRIORITY_ORDER = {"High": 1, "Medium": 2, "Low": 3}
+
+# Sort key per manage heading, in the order the server sorts (see sort_expression)
+SORT_KEYS = {
+    "ID": lambda row: 0,
+    "Task": lambda row: row[1].lower(),
+    "Date": lambda row: str(row[2]),
+    "Activity": lambda row: row[4].lower(),
+    "Priority": lambda row: PRIORITY_ORDER.get(row[5], 4),
+    "Status": lambda row: row[6],
+    "User": lambda row: f"{row[8]} {row[9]}".lower(),
+}
+
+
+def _words(row):
+    return set(search_terms(f"{row[1]} {row[12] or ''} {row[4]}"))
+
+
+class ScheduleListing:
+    """
+    Every manage row (task_id -> row) with per-filter indexes
+    
+    Rows are the columns of storage.repository.fetch_schedule_listing.
+    Not thread safe: build it on a worker, then use it on the Tk thread.
+    """
+    
+    def __init__(self, rows):
+        self.rows = {}
+        self.by_value = {key: {} for key in ENUM_COLUMNS}
+        self.by_user = {}        # user_id -> task ids
+        self.by_activity = {}    # activity_id -> task ids
+        self.user_names = {}     # user_id -> lowercase "first last"
+        self.date_keys = []      # sorted ISO dates ...
+        self.date_ids = []       # ... and the task_id at the same position
+        self.date_of = {}        # task_id -> ISO date
+        self.words = {}          # word -> task ids
+        self.vocabulary = []     # sorted words
+        self._orders = {}        # sort column -> sorted (sort key, task_id)
+        
+        for row in rows:
+            self._add(row)
+        by_date = sorted((day, task_id) for task_id, day in self.date_of.items())
+        self.date_keys = [day for day, _ in by_date]
+        self.date_ids = [task_id for _, task_id in by_date]
+        self.vocabulary = sorted(self.words)
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def _add(self, row):
+        """Index a row (the caller adds it to the date lists and vocabulary)"""
+        task_id = row[0]
+        self.rows[task_id] = row
+        for key, column in ENUM_COLUMNS.items():
+            self.by_value[key].setdefault(row[column], set()).add(task_id)
+        self.by_activity.setdefault(row[10], set()).add(task_id)
+        self.by_user.setdefault(row[11], set()).add(task_id)
+        self.user_names[row[11]] = f"{row[8]} {row[9]}".lower()
+        self.date_of[task_id] = str(row[2])
+        for word in _words(row):
+            self.words.setdefault(word, set()).add(task_id)
+    
+    def _remove(self, task_id):
+        row = self.rows.pop(task_id)
+        for key, column in ENUM_COLUMNS.items():
+            _discard(self.by_value[key], row[column], task_id)
+        _discard(self.by_activity, row[10], task_id)
+        _discard(self.by_user, row[11], task_id)
+        if row[11] not in self.by_user:
+            self.user_names.pop(row[11], None)
+        for word in _words(row):
+            if _discard(self.words, word, task_id):
+                self.vocabulary.pop(bisect_left(self.vocabulary, word))
+        day = self.date_of.pop(task_id)
+        first = bisect_left(self.date_keys, day)
+        position = self.date_ids.index(task_id, first, bisect_right(self.date_keys, day))
+        del self.date_keys[position]
+        del self.date_ids[position]
+    
+    def patch(self, scope, rows):
+        """
+        Replace the rows within scope with freshly read ones
+        
+        Args:
+            scope: dict of task_ids, activity_ids and/or user_ids that changed
+            rows: Every current row within scope (missing ones were deleted)
+        """
+        affected = {task_id for task_id in scope.get("task_ids", ()) if task_id in self.rows}
+        for index, key in ((self.by_activity, "activity_ids"), (self.by_user, "user_ids")):
+            for value in scope.get(key, ()):
+                affected.update(index.get(value, ()))
+        
+        removed = {task_id: self.rows[task_id]
+                   for task_id in affected | {row[0] for row in rows if row[0] in self.rows}}
+        for task_id in removed:
+            self._remove(task_id)
+        for row in rows:
+            new_words = [word for word in _words(row) if word not in self.words]
+            self._add(row)
+            position = bisect_right(self.date_keys, self.date_of[row[0]])
+            self.date_keys.insert(position, self.date_of[row[0]])
+            self.date_ids.insert(position, row[0])
+            for word in new_words:
+                insort(self.vocabulary, word)
+        
+        # Repair the cached sort orders instead of sorting everything again
+        for sort_column, keyed in self._orders.items():
+            sort_key = SORT_KEYS[sort_column]
+            for task_id, row in removed.items():
+                del keyed[bisect_left(keyed, (sort_key(row), task_id))]
+            for row in rows:
+                insort(keyed, (sort_key(row), row[0]))
+    
+    def _matching(self, filters):
+        """Task ids passing every active filter (None when no filter is active)"""
+        sets = []
+        for key in ENUM_COLUMNS:
+            value = filters.get(key)
+            if value and value != "All":
+                sets.append(self.by_value[key].get(value, set()))
+        
+        date_filter = filters.get("Date")
+        if date_filter in ("Today", "Upcoming", "Past"):
+            today = date.today().isoformat()
+            # Past excludes today; Today and Upcoming include it
+            first = 0 if date_filter == "Past" else bisect_left(self.date_keys, today)
+            if date_filter == "Upcoming":
+                last = len(self.date_keys)
+            elif date_filter == "Past":
+                last = bisect_left(self.date_keys, today)
+            else:
+                last = bisect_right(self.date_keys, today)
+            sets.append(set(self.date_ids[first:last]))
+        
+        user = filters.get("User", "").strip().lower()
+        if user:
+            sets.append(set().union(*(self.by_user[user_id] for user_id, name in self.user_names.items()
+                                      if user in name)))
+        
+        for term in search_terms(filters.get("Search", "")):
+            first = bisect_left(self.vocabulary, term)
+            last = bisect_left(self.vocabulary, term + "\uffff")
+            sets.append(set().union(*(self.words[word] for word in self.vocabulary[first:last])))
+        
+        if not sets:
+            return None
+        # Intersecting from the narrowest set keeps every step small
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+    
+    def _order(self, sort_column):
+        """Every (sort key, task_id) in ascending order, kept until the rows change"""
+        keyed = self._orders.get(sort_column)
+        if keyed is None:
+            sort_key = SORT_KEYS[sort_column]
+            keyed = sorted((sort_key(row), task_id) for task_id, row in self.rows.items())
+            self._orders[sort_column] = keyed
+        return keyed
+    
+    def select(self, filters, sort_column, descending):
+        """Return the task ids passing the manage filters, in display order"""
+        matches = self._matching(filters)
+        if matches is None:
+            order = [task_id for _, task_id in self._order(sort_column)]
+        elif len(matches) * 8 < len(self.rows):
+            # Few matches: sorting them beats walking the full order
+            sort_key = SORT_KEYS[sort_column]
+            order = sorted(matches, key=lambda task_id: (sort_key(self.rows[task_id]), task_id))
+        else:
+            order = [task_id for _, task_id in self._order(sort_column) if task_id in matches]
+        if descending:
+            order.reverse()
+        return order
+    
+    def page(self, task_ids):
+        """Manage table rows for task ids (the columns of build_schedule_query, minus the sort key)"""
+        return [self.rows[task_id][:12] for task_id in task_ids]
+
+
+def _discard(index, key, task_id):
+    """Remove task_id from index[key]; returns True when that empties the key"""
+    ids = index.get(key)
+    if ids is None:
+        return False
+    ids.discard(task_id)
+    if not ids:
+        del index[key]
+        return True
+    return False
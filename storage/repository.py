@@ -0,0 +1,621 @@
+"""
+Data access for the views
+
+Every query the UI runs lives here. Functions take the cursor of a
+background job (see config.executor) and stay portable across backends:
+the few engine-specific fragments come from Database.backend().
+"""
+import re
+from collections import Counter
+from datetime import date
+from config.database import Database
+from config.stats import adjust_counters, adjust_task_dates, fetch_dashboard_stats
+from storage.cache import TABLES, query_cache
+from storage.changes import record_change
+from storage.conflicts import fetch_conflicts
+from storage.rollups import DIMENSIONS, activity_deltas, activity_rollup, adjust_rollups
+
+
+def _priority_rank(column):
+    # Priority sort order, written as CASE so it runs on every backend
+    return f"CASE {column} WHEN 'High' THEN 1 WHEN 'Medium' THEN 2 WHEN 'Low' THEN 3 ELSE 4 END"
+
+
+PRIORITY_RANK = _priority_rank("a.priority")
+
+REPORT_TYPES = ["Tasks by Status", "Tasks by Priority", "Tasks by Category",
+                "User Activity Summary", "Upcoming Deadlines", "Schedule Conflicts"]
+
+# Tables each report reads (cache entries are invalidated by writes to these)
+REPORT_TABLES = {
+    "Tasks by Status": ("activities", "tasks"),
+    "Tasks by Priority": ("activities", "tasks"),
+    "Tasks by Category": ("activities", "tasks"),
+    "User Activity Summary": TABLES,
+    "Upcoming Deadlines": ("activities", "tasks"),
+    "Schedule Conflicts": ("users", "tasks")
+}
+
+# Manage view columns the server can sort by
+SORT_COLUMNS = ("ID", "Task", "Date", "Activity", "Priority", "Status", "User")
+
+# Most matches a search ranks by relevance; broader searches list newest first.
+# Ranking scores and sorts every match (about 4 µs each on SQLite at 1M
+# tasks), so this keeps a ranked page near 20 ms
+SEARCH_RANK_LIMIT = 5000
+
+
+def _user_name():
+    return Database.backend().concat("u.first_name", "' '", "u.last_name")
+
+
+def sort_expression(column):
+    """SQL expression the manage view orders by for a column heading"""
+    return {
+        "ID": "t.task_id",
+        "Task": "t.task_title",
+        "Date": "t.date",
+        "Activity": "a.activity_name",
+        "Priority": PRIORITY_RANK,
+        "Status": "a.status",
+        "User": _user_name()
+    }[column]
+
+
+def _fetch_all(cursor, query, params=()):
+    cursor.execute(query, params)
+    return cursor.fetchall()
+
+
+def fetch_stats(cursor):
+    """Return the dashboard stat counts (cached until tasks change or the day rolls over)"""
+    # Counters only move when tasks are created or deleted
+    return query_cache.fetch(("dashboard_stats", date.today()), ("tasks",),
+                             lambda: fetch_dashboard_stats(cursor))
+
+
+def fetch_recent_tasks(cursor, limit=10):
+    """Return the newest tasks with their activity and user"""
+    return query_cache.fetch(("recent_tasks", limit), TABLES,
+                             lambda: fetch_recent_task_rows(cursor, limit))
+
+
+def fetch_recent_task_rows(cursor, limit, scope=None, before=None):
+    """
+    Fetch recent task rows, newest first, without the cache
+    
+    Rows are the 9 columns a dashboard card shows, then activity_id and
+    user_id. The dashboard patches its cards with these after changes:
+    scope limits them to tasks with any of the given ids (see
+    build_schedule_query), before to tasks older than a task_id.
+    """
+    where, params = [], []
+    if scope is not None:
+        condition, params = _scope_condition(scope)
+        where.append(condition)
+    if before is not None:
+        where.append("t.task_id < %s")
+        params.append(int(before))
+    # Only fetch existing tasks (deleted tasks won't appear)
+    cursor.execute(f"""
+        SELECT t.task_id, t.task_title, t.date, t.time,
+               a.activity_name, a.priority, a.status,
+               u.first_name, u.last_name,
+               t.activity_id, t.user_id
+        FROM tasks t
+        JOIN activities a ON t.activity_id = a.activity_id
+        JOIN users u ON t.user_id = u.user_id
+        {"WHERE " + " AND ".join(where) if where else ""}
+        ORDER BY t.task_id DESC
+        LIMIT {int(limit)}
+    """, tuple(params))
+    return cursor.fetchall()
+
+
+def fetch_dashboard(cursor, recent_limit=10):
+    """Return (stats, recent tasks) for the dashboard"""
+    return fetch_stats(cursor), fetch_recent_tasks(cursor, recent_limit)
+
+
+def report_query(report_type):
+    """Return the SQL behind a report (None for an unknown report)"""
+    # The grouped reports read the rollup tables kept by storage.rollups
+    queries = {
+        "Tasks by Status": """
+            SELECT value, task_count FROM planner_report_rollups
+            WHERE dimension = 'status'
+        """,
+        "Tasks by Priority": f"""
+            SELECT value, task_count FROM planner_report_rollups
+            WHERE dimension = 'priority'
+            ORDER BY {_priority_rank("value")}
+        """,
+        "Tasks by Category": """
+            SELECT value, task_count FROM planner_report_rollups
+            WHERE dimension = 'category'
+        """,
+        "User Activity Summary": """
+            SELECT u.first_name, u.last_name,
+                   COALESCE(r.activity_count, 0) as activities,
+                   COALESCE(r.task_count, 0) as tasks
+            FROM users u
+            LEFT JOIN planner_user_rollups r ON u.user_id = r.user_id
+            ORDER BY u.user_id
+        """,
+        "Upcoming Deadlines": f"""
+            SELECT t.task_title, t.date, t.time, a.activity_name, a.priority, a.status
+            FROM tasks t
+            JOIN activities a ON t.activity_id = a.activity_id
+            WHERE t.date >= {Database.backend().today}
+            ORDER BY t.date ASC, t.time ASC
+            LIMIT 15
+        """
+    }
+    return queries.get(report_type)
+
+
+def fetch_report(cursor, report_type):
+    """Run the query behind a report (cached per report and day)"""
+    if report_type == "Schedule Conflicts":
+        # Overlaps are found by a sweep in Python rather than one query
+        return query_cache.fetch(("report", report_type, date.today()), REPORT_TABLES[report_type],
+                                 lambda: fetch_conflicts(cursor))
+    query = report_query(report_type)
+    if not query:
+        return []
+    return query_cache.fetch(("report", report_type, date.today()), REPORT_TABLES[report_type],
+                             lambda: _fetch_all(cursor, query))
+
+
+def _filter_conditions(filters):
+    """Return (conditions, params) for the manage view's filter bar values"""
+    backend = Database.backend()
+    where = []
+    params = []
+    
+    date_filter = filters.get("Date")
+    if date_filter == "Today":
+        where.append(f"t.date = {backend.today}")
+    elif date_filter == "Upcoming":
+        where.append(f"t.date >= {backend.today}")
+    elif date_filter == "Past":
+        where.append(f"t.date < {backend.today}")
+    
+    for key, column in (("Priority", "a.priority"), ("Status", "a.status"),
+                        ("Category", "a.category")):
+        value = filters.get(key)
+        if value and value != "All":
+            where.append(f"{column} = %s")
+            params.append(value)
+    
+    user = filters.get("User", "").strip()
+    if user:
+        where.append(f"{_user_name()} LIKE %s")
+        params.append(f"%{user}%")
+    return where, params
+
+
+def _scope_condition(scope):
+    """Return (condition, params) matching tasks with any of the ids in scope"""
+    either = []
+    params = []
+    for key, column in (("task_ids", "t.task_id"), ("activity_ids", "t.activity_id"),
+                        ("user_ids", "t.user_id")):
+        ids = [int(value) for value in scope.get(key, ())]
+        if ids:
+            either.append(f"{column} IN ({', '.join(['%s'] * len(ids))})")
+            params.extend(ids)
+    return (f"({' OR '.join(either)})" if either else "1 = 0"), params
+
+
+# Manage table row: 10 display columns, then activity_id and user_id (the sort key follows)
+SCHEDULE_COLUMNS = """
+    t.task_id, t.task_title, t.date, t.time,
+    a.activity_name, a.priority, a.status, a.category,
+    u.first_name, u.last_name,
+    t.activity_id, t.user_id"""
+
+
+def build_schedule_query(filters, sort_column, descending, after_key, page_size, scope=None):
+    """
+    Return (sql, params) for one keyset page of the manage table
+    
+    Rows are the 10 display columns, then activity_id, user_id and the
+    sort key (last), so the caller can continue after the final row.
+    scope limits the rows to those with any of the given ids, as a dict
+    with task_ids, activity_ids and/or user_ids lists. A search text in
+    filters keeps only matching rows, in this query's order (searches are
+    paged by build_search_query).
+    """
+    sort_expr = sort_expression(sort_column)
+    where, params = _filter_conditions(filters)
+    
+    if scope is not None:
+        condition, scope_params = _scope_condition(scope)
+        where.append(condition)
+        params.extend(scope_params)
+    
+    terms = search_terms(filters.get("Search", ""))
+    if terms:
+        # Correlated, so the full-text index is probed per row instead of listing every match
+        matches, match_params = Database.backend().search_matches(terms, ranked=False)
+        where.append(f"EXISTS (SELECT 1 FROM ({matches}) m WHERE m.task_id = t.task_id)")
+        params.extend(match_params)
+    
+    # Keyset condition: continue strictly after the last row of the previous page
+    op = "<" if descending else ">"
+    if after_key is not None:
+        sort_value, task_id = after_key
+        if sort_expr == "t.task_id":
+            where.append(f"t.task_id {op} %s")
+            params.append(task_id)
+        else:
+            where.append(f"({sort_expr} {op} %s OR ({sort_expr} = %s AND t.task_id {op} %s))")
+            params.extend([sort_value, sort_value, task_id])
+    
+    direction = "DESC" if descending else "ASC"
+    order = f"t.task_id {direction}"
+    if sort_expr != "t.task_id":
+        order = f"{sort_expr} {direction}, " + order
+    
+    query = f"""
+    SELECT {SCHEDULE_COLUMNS},
+           {sort_expr} AS sort_key
+    FROM tasks t
+    JOIN activities a ON t.activity_id = a.activity_id
+    JOIN users u ON t.user_id = u.user_id
+    {"WHERE " + " AND ".join(where) if where else ""}
+    ORDER BY {order}
+    LIMIT {int(page_size)}
+    """
+    return query, tuple(params)
+
+
+def search_terms(text):
+    """Split a search box entry into lowercase words"""
+    return re.findall(r"[^\W_]+", text.lower())
+
+
+def build_search_query(filters, text, offset, page_size, ranked=True):
+    """
+    Return (sql, params) for one page of manage table rows matching a search
+    
+    Every word of text must match the start of a word in the task title,
+    description or activity name (see the backends' search_matches).
+    Rows have the same columns as build_schedule_query, with the
+    relevance as sort key. Ranked rows come best match first across all
+    matches (the database keeps only the top offset + page_size while
+    sorting); unranked rows come newest first with a NULL sort key, in
+    the full-text index's own order, so no page sorts the matches.
+    """
+    matches, params = Database.backend().search_matches(search_terms(text), ranked)
+    where, filter_params = _filter_conditions(filters)
+    
+    query = f"""
+    SELECT {SCHEDULE_COLUMNS},
+           s.relevance AS sort_key
+    FROM ({matches}) s
+    JOIN tasks t ON t.task_id = s.task_id
+    JOIN activities a ON t.activity_id = a.activity_id
+    JOIN users u ON t.user_id = u.user_id
+    {"WHERE " + " AND ".join(where) if where else ""}
+    ORDER BY {"s.relevance DESC, " if ranked else ""}s.task_id DESC
+    LIMIT {int(page_size)} OFFSET {int(offset)}
+    """
+    return query, tuple(params) + tuple(filter_params)
+
+
+def count_search_matches(cursor, text, limit=SEARCH_RANK_LIMIT):
+    """
+    Number of tasks matching a search, counting no further than limit + 1
+    
+    The scan stops after limit + 1 matches, and the count is cached until
+    the tables change, so later pages of the same search skip it.
+    """
+    terms = search_terms(text)
+    if not terms:
+        return 0
+    matches, params = Database.backend().search_matches(terms, ranked=False)
+    query = f"SELECT COUNT(*) FROM (SELECT task_id FROM ({matches}) m LIMIT {int(limit) + 1}) c"
+    return query_cache.fetch(("search_count", tuple(terms), limit), TABLES,
+                             lambda: _fetch_all(cursor, query, params)[0][0])
+
+
+def fetch_schedule_page(cursor, filters, sort_column, descending, after_key, page_size):
+    """Fetch one keyset page of the manage table"""
+    query, params = build_schedule_query(filters, sort_column, descending, after_key, page_size)
+    # Date filters are relative to today, so the day is part of the key
+    key = ("schedule_page", tuple(sorted(filters.items())), sort_column, descending,
+           after_key, page_size, date.today())
+    return query_cache.fetch(key, TABLES, lambda: _fetch_all(cursor, query, params))
+
+
+def search_schedule_page(cursor, filters, text, offset, page_size):
+    """
+    Fetch one page of search results for the manage table (empty if text has no words)
+    
+    Searches matching up to SEARCH_RANK_LIMIT tasks are ranked by
+    relevance over every match; broader ones come newest first in the
+    full-text index's order, where ranking would score and sort them all
+    for each page. Either way paging reaches every match.
+    """
+    if not search_terms(text):
+        return []
+    ranked = count_search_matches(cursor, text) <= SEARCH_RANK_LIMIT
+    query, params = build_search_query(filters, text, offset, page_size, ranked)
+    key = ("schedule_search", tuple(sorted(filters.items())), text, ranked, offset, page_size, date.today())
+    return query_cache.fetch(key, TABLES, lambda: _fetch_all(cursor, query, params))
+
+
+def fetch_schedule_rows(cursor, filters, sort_column, scope):
+    """
+    Fetch the manage table rows for a set of tasks, activities or users
+    
+    Used to patch the loaded table after other clients' changes; rows
+    that no longer exist or no longer match the filters are not returned.
+    """
+    query, params = build_schedule_query(filters, sort_column, False, None, 100000, scope)
+    return _fetch_all(cursor, query, params)
+
+
+def fetch_schedule_listing(cursor, max_rows=None, scope=None):
+    """
+    Fetch manage table rows followed by the task description, for storage.listing
+    
+    Args:
+        max_rows: Return None instead when there are more tasks than this
+        scope: Only the tasks with any of these ids (see build_schedule_query)
+    """
+    if max_rows is not None and fetch_stats(cursor)[2] > max_rows:
+        return None
+    where, params = ("", []) if scope is None else _scope_condition(scope)
+    return _fetch_all(cursor, f"""
+        SELECT {SCHEDULE_COLUMNS},
+               t.description
+        FROM tasks t
+        JOIN activities a ON t.activity_id = a.activity_id
+        JOIN users u ON t.user_id = u.user_id
+        {"WHERE " + where if where else ""}
+        ORDER BY t.task_id
+    """, params)
+
+
+def fetch_task(cursor, task_id):
+    """Return one task with its user and activity, as the update form needs it"""
+    return query_cache.fetch(("task", int(task_id)), TABLES,
+                             lambda: _query_task(cursor, task_id))
+
+
+def _query_task(cursor, task_id):
+    cursor.execute("""
+        SELECT
+            u.user_id, u.first_name, u.last_name,
+            a.activity_id, a.activity_name, a.category, a.priority, a.status,
+            t.task_id, t.task_title, t.description, t.date, t.time, t.duration
+        FROM tasks t
+        JOIN activities a ON t.activity_id = a.activity_id
+        JOIN users u ON t.user_id = u.user_id
+        WHERE t.task_id = %s
+    """, (task_id,))
+    return cursor.fetchone()
+
+
+def set_activity_status(cursor, activity_id, status):
+    """Change an activity's status (shared by all of its tasks)"""
+    query_cache.invalidate("activities")
+    old, task_count = activity_rollup(cursor, activity_id)
+    cursor.execute("UPDATE activities SET status = %s WHERE activity_id = %s",
+                  (status, activity_id))
+    if old:
+        _move_activity_rollups(cursor, old, dict(old, status=status), task_count)
+    record_change(cursor, "status", activity_ids=[activity_id])
+
+
+def _move_activity_rollups(cursor, old, new, task_count):
+    """Move an activity's tasks between rollup groups after its attributes changed"""
+    if old != new:
+        deltas = activity_deltas(old, -task_count)
+        deltas.update(activity_deltas(new, task_count))
+        adjust_rollups(cursor, deltas)
+
+
+def insert_schedule(cursor, user_values, schedule):
+    """
+    Insert a user with all activities and tasks using batched writes
+    
+    Args:
+        cursor: Cursor of the transaction to write in (caller commits)
+        user_values: (first_name, last_name, created_at)
+        schedule: List of (activity_values, task_values) where activity_values is
+                  (name, category, priority, status) and task_values is a list of
+                  (title, description, date, time, duration)
+    
+    Returns:
+        (user_id, activity_ids) of the new user and activities, in schedule order
+    """
+    query_cache.invalidate("users", "activities", "tasks")
+    cursor.execute("INSERT INTO users (first_name, last_name, created_at) VALUES (%s, %s, %s)",
+                  user_values)
+    user_id = cursor.lastrowid
+    activity_ids = []
+    
+    for activity_values, task_values in schedule:
+        # Activities go one by one because their tasks need the generated id
+        cursor.execute("INSERT INTO activities (activity_name, category, priority, status, user_id) VALUES (%s,%s,%s,%s,%s)",
+                      activity_values + (user_id,))
+        activity_id = cursor.lastrowid
+        activity_ids.append(activity_id)
+        
+        # All tasks of the activity in one multi-row INSERT
+        cursor.executemany("INSERT INTO tasks (task_title, description, date, time, duration, user_id, activity_id) VALUES (%s,%s,%s,%s,%s,%s,%s)",
+                          [task + (user_id, activity_id) for task in task_values])
+    
+    # Keep dashboard counters and report rollups current in the same transaction
+    all_tasks = [task for _, task_values in schedule for task in task_values]
+    adjust_counters(cursor, users=1, activities=len(schedule), tasks=len(all_tasks))
+    adjust_task_dates(cursor, Counter(task[2] for task in all_tasks))
+    deltas = Counter()
+    for (name, category, priority, status), task_values in schedule:
+        deltas.update(activity_deltas({"status": status, "priority": priority, "category": category},
+                                      len(task_values)))
+    adjust_rollups(cursor, deltas, {user_id: (len(schedule), len(all_tasks))})
+    # New task ids are not read back; their activities identify them
+    record_change(cursor, "create", activity_ids=activity_ids, user_ids=[user_id])
+    
+    return user_id, activity_ids
+
+
+def update_task(cursor, user_values, activity_values, task_values):
+    """
+    Save the update form
+    
+    Args:
+        user_values: (first_name, last_name, user_id)
+        activity_values: (name, category, priority, status, activity_id)
+        task_values: (title, description, 'YYYY-MM-DD', time, duration, task_id)
+    """
+    query_cache.invalidate("users", "activities", "tasks")
+    cursor.execute("SELECT date FROM tasks WHERE task_id = %s", (task_values[-1],))
+    row = cursor.fetchone()
+    if row is None:
+        # Another client deleted it while the form was open
+        raise LookupError(f"Task {task_values[-1]} no longer exists; it may have been deleted by another user")
+    old_date = str(row[0])
+    old_activity, task_count = activity_rollup(cursor, activity_values[-1])
+    
+    # Update user
+    cursor.execute("UPDATE users SET first_name = %s, last_name = %s WHERE user_id = %s",
+                  user_values)
+    
+    # Update activity
+    cursor.execute("UPDATE activities SET activity_name = %s, category = %s, priority = %s, status = %s WHERE activity_id = %s",
+                  activity_values)
+    
+    # Update task
+    cursor.execute("UPDATE tasks SET task_title = %s, description = %s, date = %s, time = %s, duration = %s WHERE task_id = %s",
+                  task_values)
+    
+    # Move the task between date counters if its date changed
+    new_date = task_values[2]
+    if old_date != new_date:
+        adjust_task_dates(cursor, {old_date: -1, new_date: 1})
+    
+    # ...and the activity's tasks between report groups if its attributes changed
+    if old_activity:
+        name, category, priority, status, activity_id = activity_values
+        _move_activity_rollups(cursor, old_activity,
+                               {"status": status, "priority": priority, "category": category},
+                               task_count)
+    
+    record_change(cursor, "update", task_ids=[task_values[-1]], activity_ids=[activity_values[-1]],
+                  user_ids=[user_values[-1]])
+
+
+def delete_tasks_with_cleanup(cursor, task_ids):
+    """
+    Delete any number of tasks and clean up orphaned users/activities
+    This permanently removes data from the database
+    
+    Uses a fixed number of set-based statements regardless of how many
+    tasks are deleted. Runs inside a background job; the executor commits
+    on success and rolls back if anything raises.
+    
+    Returns:
+        dict with the task_ids that existed and were deleted, the user and
+        activity ids they belonged to, how many users/activities were
+        removed as orphans, and "counts", the change in the dashboard's
+        (users, activities, tasks, upcoming) stats
+    """
+    task_ids = [int(task_id) for task_id in task_ids]
+    result = {"task_ids": [], "activity_ids": [], "user_ids": [],
+              "users_deleted": 0, "activities_deleted": 0, "counts": (0, 0, 0, 0)}
+    if not task_ids:
+        return result
+    
+    try:
+        id_list = ", ".join(["%s"] * len(task_ids))
+        
+        # Get user_id, activity_id, date and report groups BEFORE deleting the tasks
+        cursor.execute(f"""
+            SELECT t.task_id, t.user_id, t.activity_id, t.date,
+                   a.status, a.priority, a.category
+            FROM tasks t
+            LEFT JOIN activities a ON t.activity_id = a.activity_id
+            WHERE t.task_id IN ({id_list})
+        """, task_ids)
+        rows = cursor.fetchall()
+        if not rows:
+            return result
+        
+        found_ids = [row[0] for row in rows]
+        user_ids = sorted({row[1] for row in rows})
+        activity_ids = sorted({row[2] for row in rows})
+        
+        query_cache.invalidate("tasks")
+        
+        # Step 1: Delete the tasks from database
+        cursor.execute(f"DELETE FROM tasks WHERE task_id IN ({id_list})", task_ids)
+        print(f"[DELETE] Deleted {len(found_ids)} task(s) from tasks table")
+        
+        # Step 2: Delete affected users that have no tasks left
+        cursor.execute(f"""
+            DELETE FROM users
+            WHERE user_id IN ({", ".join(["%s"] * len(user_ids))})
+              AND NOT EXISTS (SELECT 1 FROM tasks t WHERE t.user_id = users.user_id)
+        """, user_ids)
+        users_deleted = cursor.rowcount
+        if users_deleted:
+            query_cache.invalidate("users")
+            print(f"[DELETE] Deleted {users_deleted} orphaned user(s) from users table")
+        
+        # Step 3: Delete affected activities that have no tasks left
+        cursor.execute(f"""
+            DELETE FROM activities
+            WHERE activity_id IN ({", ".join(["%s"] * len(activity_ids))})
+              AND NOT EXISTS (SELECT 1 FROM tasks t WHERE t.activity_id = activities.activity_id)
+        """, activity_ids)
+        activities_deleted = cursor.rowcount
+        remaining_activities = set(activity_ids)
+        if activities_deleted:
+            query_cache.invalidate("activities")
+            print(f"[DELETE] Deleted {activities_deleted} orphaned activity(ies) from activities table")
+            cursor.execute(f"""
+                SELECT activity_id FROM activities
+                WHERE activity_id IN ({", ".join(["%s"] * len(activity_ids))})
+            """, activity_ids)
+            remaining_activities = {row[0] for row in cursor.fetchall()}
+        
+        # Step 4: Keep dashboard counters in step with the delete
+        adjust_counters(cursor, users=-users_deleted, activities=-activities_deleted,
+                        tasks=-len(found_ids))
+        date_deltas = {}
+        for row in rows:
+            date_deltas[row[3]] = date_deltas.get(row[3], 0) - 1
+        adjust_task_dates(cursor, date_deltas)
+        
+        deltas = Counter()
+        user_deltas = {}
+        activity_users = {}
+        for row in rows:
+            if row[4] is not None:
+                deltas.update(activity_deltas(dict(zip(DIMENSIONS, row[4:7])), -1))
+            activities, tasks = user_deltas.get(row[1], (0, 0))
+            user_deltas[row[1]] = (activities, tasks - 1)
+            activity_users[row[2]] = row[1]
+        for activity_id, user_id in activity_users.items():
+            if activity_id not in remaining_activities:
+                activities, tasks = user_deltas[user_id]
+                user_deltas[user_id] = (activities - 1, tasks)
+        adjust_rollups(cursor, deltas, user_deltas)
+        record_change(cursor, "delete", found_ids, activity_ids, user_ids)
+        
+        # Both backends compare dates as 'YYYY-MM-DD'
+        upcoming = sum(1 for row in rows if str(row[3]) >= date.today().isoformat())
+        result.update(task_ids=found_ids, activity_ids=activity_ids, user_ids=user_ids,
+                      users_deleted=users_deleted, activities_deleted=activities_deleted,
+                      counts=(-users_deleted, -activities_deleted, -len(found_ids), -upcoming))
+        return result
+    
+    except Exception as e:
+        print(f"[ERROR] Delete failed: {e}")
+        raise e
@@ -0,0 +1,187 @@
+"""
+Report rollups
+
+Usage:
+    python -m storage.rollups             # compare the rollups with the base tables
+    python -m storage.rollups --rebuild   # recompute them from scratch
+
+The built-in reports read two small tables (created by schema migration
+v4) instead of grouping the activities/tasks join on every Generate:
+    planner_report_rollups  (dimension, value) -> tasks, for the status,
+                            priority and category of their activity
+    planner_user_rollups    user_id -> activities and tasks of that user
+
+Every write path in storage.repository applies its deltas inside its own
+transaction, the same way config.stats keeps the dashboard counters.
+"""
+import argparse
+from collections import Counter
+from config.database import Database
+from config.stats import ensure_stats_tables
+
+
+# Activity columns the task counts are rolled up by
+DIMENSIONS = ("status", "priority", "category")
+
+# (user_id, activities, tasks) for every user, counted per user before the
+# join; joining both tables to users directly multiplies every activity by
+# every task
+USER_COUNTS_QUERY = """
+    SELECT u.user_id, COALESCE(a.activities, 0) as activities, COALESCE(t.tasks, 0) as tasks
+    FROM users u
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) as activities FROM activities GROUP BY user_id
+    ) a ON u.user_id = a.user_id
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) as tasks FROM tasks GROUP BY user_id
+    ) t ON u.user_id = t.user_id
+"""
+
+
+def rebuild_rollups(cursor):
+    """Recompute every rollup from the base tables"""
+    cursor.execute("DELETE FROM planner_report_rollups")
+    for dimension in DIMENSIONS:
+        cursor.execute(f"""
+            INSERT INTO planner_report_rollups (dimension, value, task_count)
+            SELECT '{dimension}', a.{dimension}, COUNT(*)
+            FROM tasks t
+            JOIN activities a ON t.activity_id = a.activity_id
+            GROUP BY a.{dimension}
+        """)
+    
+    cursor.execute("DELETE FROM planner_user_rollups")
+    cursor.execute(f"""
+        INSERT INTO planner_user_rollups (user_id, activity_count, task_count)
+        SELECT user_id, activities, tasks
+        FROM ({USER_COUNTS_QUERY}) c
+        WHERE activities > 0 OR tasks > 0
+    """)
+    print("[ROLLUP] Rebuilt report rollups")
+
+
+def activity_deltas(activity, tasks):
+    """
+    Rollup deltas for tasks joining (tasks > 0) or leaving (tasks < 0) an activity
+    
+    Args:
+        activity: dict with status, priority and category
+    """
+    return Counter({(dimension, activity[dimension]): tasks for dimension in DIMENSIONS})
+
+
+def adjust_rollups(cursor, deltas=None, users=None):
+    """
+    Apply rollup deltas (call inside the write's transaction)
+    
+    Args:
+        deltas: Counter of (dimension, value) -> change in task count
+        users: dict of user_id -> (change in activities, change in tasks)
+    """
+    ensure_stats_tables(cursor)
+    backend = Database.backend()
+    
+    if deltas:
+        upsert = backend.upsert_increment("planner_report_rollups", ("dimension", "value"), "task_count")
+        for (dimension, value), delta in deltas.items():
+            if not delta:
+                continue
+            cursor.execute(upsert, (dimension, value, delta))
+            if delta < 0:
+                cursor.execute("""
+                    DELETE FROM planner_report_rollups
+                    WHERE dimension = %s AND value = %s AND task_count <= 0
+                """, (dimension, value))
+    
+    if users:
+        upsert = backend.upsert_increment("planner_user_rollups", "user_id",
+                                          ("activity_count", "task_count"))
+        for user_id, (activities, tasks) in users.items():
+            if not activities and not tasks:
+                continue
+            cursor.execute(upsert, (user_id, activities, tasks))
+            if activities < 0 or tasks < 0:
+                cursor.execute("""
+                    DELETE FROM planner_user_rollups
+                    WHERE user_id = %s AND activity_count <= 0 AND task_count <= 0
+                """, (user_id,))
+
+
+def activity_rollup(cursor, activity_id):
+    """Return ({status, priority, category}, task count) of one activity (None, 0 if missing)"""
+    cursor.execute("""
+        SELECT a.status, a.priority, a.category, COUNT(t.task_id)
+        FROM activities a
+        LEFT JOIN tasks t ON t.activity_id = a.activity_id
+        WHERE a.activity_id = %s
+        GROUP BY a.status, a.priority, a.category
+    """, (activity_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None, 0
+    return dict(zip(DIMENSIONS, row[:3])), row[3]
+
+
+def verify_rollups(cursor):
+    """
+    Compare the stored rollups with a fresh computation
+    
+    Returns:
+        List of (table, key, stored, expected) for every row that differs
+    """
+    cursor.execute("SELECT dimension, value, task_count FROM planner_report_rollups")
+    stored = {(dimension, value): count for dimension, value, count in cursor.fetchall()}
+    expected = {}
+    for dimension in DIMENSIONS:
+        cursor.execute(f"""
+            SELECT a.{dimension}, COUNT(*)
+            FROM tasks t
+            JOIN activities a ON t.activity_id = a.activity_id
+            GROUP BY a.{dimension}
+        """)
+        expected.update(((dimension, value), count) for value, count in cursor.fetchall())
+    
+    drift = [("planner_report_rollups", key, stored.get(key), expected.get(key))
+             for key in sorted(set(stored) | set(expected), key=str)
+             if stored.get(key) != expected.get(key)]
+    
+    cursor.execute("SELECT user_id, activity_count, task_count FROM planner_user_rollups")
+    stored = {user_id: (activities, tasks) for user_id, activities, tasks in cursor.fetchall()}
+    cursor.execute("SELECT user_id FROM activities")
+    activities = Counter(row[0] for row in cursor.fetchall())
+    cursor.execute("SELECT user_id FROM tasks")
+    tasks = Counter(row[0] for row in cursor.fetchall())
+    expected = {user_id: (activities[user_id], tasks[user_id])
+                for user_id in set(activities) | set(tasks)}
+    
+    drift += [("planner_user_rollups", user_id, stored.get(user_id), expected.get(user_id))
+              for user_id in sorted(set(stored) | set(expected))
+              if stored.get(user_id) != expected.get(user_id)]
+    return drift
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify or rebuild the planner_db report rollups")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Recompute the rollups (otherwise only report drift)")
+    args = parser.parse_args()
+    
+    conn = Database.pool().acquire()
+    try:
+        cursor = conn.cursor()
+        ensure_stats_tables(cursor)
+        if args.rebuild:
+            rebuild_rollups(cursor)
+            conn.commit()
+        drift = verify_rollups(cursor)
+    finally:
+        conn.close()
+        Database.close_pool()
+    
+    for table, key, stored, expected in drift:
+        print(f"{table:<24}{str(key):<32} stored {stored}, expected {expected}")
+    print(f"[ROLLUP] {len(drift)} row(s) differ" if drift else "[ROLLUP] Rollups match the base tables")
+
+
+if __name__ == "__main__":
+    main()
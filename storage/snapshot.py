@@ -0,0 +1,75 @@
+import os
+import json
+import threading
+from datetime import datetime
+from config.database import Database
+
+
+# The last dashboard state is written here on exit and shown at the next
+# startup (marked stale) until the live query returns
+SNAPSHOT_PATH = os.environ.get("PLANNER_SNAPSHOT_PATH", "dashboard_snapshot.json")
+SNAPSHOT_FORMAT = 2  # 2: task rows end with activity_id and user_id
+
+_latest = None
+_lock = threading.Lock()
+
+
+def remember(stats, tasks):
+    """Keep the most recent live dashboard data for the next save"""
+    global _latest
+    with _lock:
+        _latest = {
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "stats": [int(value) for value in stats],
+            # Dates and times are only displayed, so their text form is enough
+            "tasks": [[value if value is None or isinstance(value, (int, str)) else str(value)
+                       for value in task] for task in tasks]
+        }
+
+
+def latest():
+    """Return the data remembered in this session (None before the first live load)"""
+    with _lock:
+        return _latest
+
+
+def save(path=SNAPSHOT_PATH):
+    """Write the remembered dashboard data to disk; returns True if written"""
+    data = latest()
+    if data is None:
+        return False
+    
+    payload = dict(data, format=SNAPSHOT_FORMAT, source=Database.backend().source)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    # Replace in one step so a crash never leaves half a file
+    os.replace(temp_path, path)
+    return True
+
+
+def load(path=SNAPSHOT_PATH):
+    """
+    Read the snapshot saved by a previous session
+    
+    Returns:
+        dict with saved_at, stats and tasks, or None if there is no usable
+        snapshot for the configured database
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if payload.get("format") != SNAPSHOT_FORMAT or payload.get("source") != Database.backend().source:
+        return None
+    
+    try:
+        return {
+            "saved_at": payload["saved_at"],
+            "stats": tuple(payload["stats"]),
+            "tasks": [tuple(task) for task in payload["tasks"]]
+        }
+    except (KeyError, TypeError):
+        return None
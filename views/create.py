@@ -4,14 +4,31 @@ from tkinter import ttk, messagebox
 from datetime import datetime
 from tkcalendar import DateEntry
 from config.styles import *
-from config.database import Database
+from config.events import TASK_CREATED, events
+from config.executor import submit_query
+from storage.conflicts import check_schedule
+from storage.repository import insert_schedule
 from components.buttons import ModernButton
 from components.cards import ModernCard
-from components.pickers import TimePicker
+from components.conflicts import ConflictNotice
+from components.pickers import DurationPicker, TimePicker
 
 
-def show_create(parent):
-    """Display the create schedule view"""
+TYPING_DEBOUNCE_MS = 200  # Pause in editing before task times are checked for overlaps
+
+
+def show_create(parent, on_created=None):
+    """
+    Display the create schedule view
+    
+    Args:
+        on_created: Called after a schedule is saved; the form is reset first.
+                    Views showing data learn about the save from the
+                    task_created event.
+    
+    Task times are checked for overlaps as the form is edited: with the
+    other tasks in the form and with tasks already saved under the name.
+    """
     # Header
     header = tk.Frame(parent, bg=BG_MAIN)
     header.pack(fill="x", pady=(0, 20))
@@ -53,6 +70,40 @@ def show_create(parent):
                                bd=0, highlightthickness=1, highlightbackground=BORDER_COLOR)
     last_name_entry.pack(fill="x", ipady=10)
     
+    pending_check = {"after": None}
+    
+    def check_conflicts(event=None):
+        """Re-check every task for overlaps once editing pauses"""
+        if pending_check["after"]:
+            parent.after_cancel(pending_check["after"])
+        pending_check["after"] = parent.after(TYPING_DEBOUNCE_MS, run_conflict_check)
+    
+    def run_conflict_check():
+        pending_check["after"] = None
+        if not first_name_entry.winfo_exists():
+            return
+        first_name, last_name = first_name_entry.get(), last_name_entry.get()
+        tasks = [(task, _read_slot(task, f"Activity #{a}, Task #{t}"))
+                 for a, activity in enumerate(activities_list, 1)
+                 for t, task in enumerate(activity['tasks'], 1)]
+        
+        def on_checked(overlaps):
+            for (task, _), found in zip(tasks, overlaps):
+                if task['conflicts'].winfo_exists():
+                    task['conflicts'].show(found)
+        
+        def on_error(e):
+            print(f"[ERROR] Conflict check failed: {e}")
+        
+        # Only the latest check matters; it supersedes one still running
+        submit_query(lambda cursor: check_schedule(cursor, first_name, last_name,
+                                                   [slot for _, slot in tasks]),
+                     on_checked, on_error, group="create-conflicts", owner=first_name_entry,
+                     label="check_schedule")
+    
+    for entry in (first_name_entry, last_name_entry):
+        entry.bind("<KeyRelease>", check_conflicts)
+    
     # Separator
     tk.Frame(scrollable, bg=BORDER_COLOR, height=1).pack(fill="x", padx=30, pady=20)
     
@@ -63,7 +114,7 @@ def show_create(parent):
     activities_list = []
     
     def create_activity_widget(number):
-        return _create_activity_widget(activities_container, number, activities_list)
+        return _create_activity_widget(activities_container, number, activities_list, check_conflicts)
     
     def remove_activity(widget):
         widget['frame'].destroy()
@@ -95,7 +146,7 @@ def show_create(parent):
     submit_frame.pack(fill="x", padx=30, pady=(0, 30))
     
     def submit_schedule():
-        _submit_schedule(first_name_entry, last_name_entry, activities_list, parent)
+        _submit_schedule(first_name_entry, last_name_entry, activities_list, parent, on_created)
     
     ModernButton(submit_frame, "Create Schedule", submit_schedule,
                 style="primary", icon="💾", width=20).pack()
@@ -104,8 +155,8 @@ def show_create(parent):
     scrollbar.pack(side="right", fill="y")
 
 
-def _create_activity_widget(parent, number, activities_list):
-    """Helper function to create activity widget"""
+def _create_activity_widget(parent, number, activities_list, on_change=None):
+    """Helper function to create activity widget (on_change: called when task times change)"""
     activity_frame = tk.Frame(parent, bg="#f8fafc", relief=tk.FLAT,
                              bd=0, highlightthickness=1, highlightbackground=BORDER_COLOR)
     activity_frame.pack(fill="x", pady=(0, 20))
@@ -120,7 +171,7 @@ def _create_activity_widget(parent, number, activities_list):
     if number > 1:
         remove_btn = tk.Button(act_header, text="✕ Remove", font=FONT_SMALL,
                               bg=DANGER, fg="white", relief=tk.FLAT, cursor="hand2",
-                              command=lambda: _remove_activity_widget(activity_widget, activities_list))
+                              command=lambda: _remove_activity_widget(activity_widget, activities_list, on_change))
         remove_btn.pack(side="right")
         
         remove_btn.bind("<Enter>", lambda e: remove_btn.config(bg="#dc2626"))
@@ -178,7 +229,7 @@ def _create_activity_widget(parent, number, activities_list):
     tasks_list = []
     
     def create_task_widget(task_num):
-        return _create_task_widget(tasks_container, task_num, tasks_list)
+        return _create_task_widget(tasks_container, task_num, tasks_list, on_change)
     
     def remove_task(widget):
         widget['frame'].destroy()
@@ -194,6 +245,8 @@ def _create_activity_widget(parent, number, activities_list):
     
     def add_task():
         create_task_widget(len(tasks_list) + 1)
+        if on_change:
+            on_change()
     
     # Initial task
     create_task_widget(1)
@@ -216,8 +269,8 @@ def _create_activity_widget(parent, number, activities_list):
     return activity_widget
 
 
-def _create_task_widget(parent, task_num, tasks_list):
-    """Helper function to create task widget"""
+def _create_task_widget(parent, task_num, tasks_list, on_change=None):
+    """Helper function to create task widget (on_change: called when its time changes)"""
     task_frame = tk.Frame(parent, bg="white", relief=tk.FLAT,
                          bd=0, highlightthickness=1, highlightbackground=BORDER_COLOR)
     task_frame.pack(fill="x", pady=(0, 10))
@@ -232,7 +285,7 @@ def _create_task_widget(parent, task_num, tasks_list):
     if task_num > 1:
         rm_task = tk.Button(task_hdr, text="✕", font=FONT_SMALL,
                            bg=DANGER, fg="white", relief=tk.FLAT, cursor="hand2",
-                           width=3, command=lambda: _remove_task_widget(task_widget, tasks_list))
+                           width=3, command=lambda: _remove_task_widget(task_widget, tasks_list, on_change))
         rm_task.pack(side="right")
         
         rm_task.bind("<Enter>", lambda e: rm_task.config(bg="#dc2626"))
@@ -257,7 +310,7 @@ def _create_task_widget(parent, task_num, tasks_list):
     # Date and Time with Pickers
     dt_frame = tk.Frame(task_content, bg="white")
     dt_frame.pack(fill="x")
-    dt_frame.grid_columnconfigure((0, 1), weight=1)
+    dt_frame.grid_columnconfigure((0, 1, 2), weight=1)
     
     # Date Picker
     tk.Label(dt_frame, text="Date *", font=FONT_BODY,
@@ -272,21 +325,41 @@ def _create_task_widget(parent, task_num, tasks_list):
     task_time_picker = TimePicker(dt_frame)
     task_time_picker.grid(row=1, column=1, sticky="w")
     
+    # Duration
+    tk.Label(dt_frame, text="Duration", font=FONT_BODY,
+            fg=TEXT_PRIMARY, bg="white").grid(row=0, column=2, sticky="w")
+    task_duration = DurationPicker(dt_frame)
+    task_duration.grid(row=1, column=2, sticky="w", ipady=4)
+    
+    # Overlaps found by the form's conflict check
+    task_conflicts = ConflictNotice(task_content, bg="white")
+    
+    if on_change:
+        task_title.bind("<KeyRelease>", lambda e: on_change())
+        task_date.bind("<<DateEntrySelected>>", lambda e: on_change())
+        task_date.bind("<KeyRelease>", lambda e: on_change())
+        task_time_picker.on_change(on_change)
+        task_duration.bind("<<ComboboxSelected>>", lambda e: on_change())
+    
     task_widget = {
         'frame': task_frame,
         'title': task_title,
         'desc': task_desc,
         'date': task_date,
-        'time': task_time_picker
+        'time': task_time_picker,
+        'duration': task_duration,
+        'conflicts': task_conflicts
     }
     tasks_list.append(task_widget)
     return task_widget
 
 
-def _remove_activity_widget(widget, activities_list):
+def _remove_activity_widget(widget, activities_list, on_change=None):
     """Helper to remove activity"""
     widget['frame'].destroy()
     activities_list.remove(widget)
+    if on_change:
+        on_change()
     # Renumber
     for idx, aw in enumerate(activities_list, 1):
         header_frame = aw['frame'].winfo_children()[0]
@@ -295,10 +368,12 @@ def _remove_activity_widget(widget, activities_list):
             labels[0].config(text=f"🎯 Activity #{idx}")
 
 
-def _remove_task_widget(widget, tasks_list):
+def _remove_task_widget(widget, tasks_list, on_change=None):
     """Helper to remove task"""
     widget['frame'].destroy()
     tasks_list.remove(widget)
+    if on_change:
+        on_change()
     # Renumber
     for idx, tw in enumerate(tasks_list, 1):
         header_frame = tw['frame'].winfo_children()[0]
@@ -307,7 +382,18 @@ def _remove_task_widget(widget, tasks_list):
             labels[0].config(text=f"Task #{idx}")
 
 
-def _submit_schedule(first_name_entry, last_name_entry, activities_list, parent):
+def _read_slot(task, label):
+    """(title, date, time, duration) of a task widget for storage.conflicts.check_schedule"""
+    try:
+        day = task['date'].get_date().strftime('%Y-%m-%d')
+    except ValueError:
+        # Half-typed date: nothing to check yet
+        return (label, None, None, None)
+    title = task['title'].get().strip() or label
+    return (title, day, task['time'].get_time(), task['duration'].get_minutes())
+
+
+def _submit_schedule(first_name_entry, last_name_entry, activities_list, parent, on_created=None):
     """Handle schedule submission"""
     # Validation
     if not first_name_entry.get().strip() or not last_name_entry.get().strip():
@@ -327,37 +413,48 @@ def _submit_schedule(first_name_entry, last_name_entry, activities_list, parent)
                 messagebox.showerror("Validation Error", f"Activity #{idx}, Task #{tidx}: Please enter task date")
                 return
     
-    # Save to database
-    try:
-        conn = Database.connect()
-        cursor = conn.cursor()
-        
-        cursor.execute("INSERT INTO users (first_name, last_name, created_at) VALUES (%s, %s, %s)",
-                      (first_name_entry.get().strip(), last_name_entry.get().strip(), 
-                       datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-        user_id = cursor.lastrowid
-        
-        for activity in activities_list:
-            cursor.execute("INSERT INTO activities (activity_name, category, priority, status, user_id) VALUES (%s,%s,%s,%s,%s)",
-                          (activity['name'].get(), activity['category'].get(), 
-                           activity['priority'].get(), activity['status'].get(), user_id))
-            activity_id = cursor.lastrowid
-            
-            for task in activity['tasks']:
-                cursor.execute("INSERT INTO tasks (task_title, description, date, time, user_id, activity_id) VALUES (%s,%s,%s,%s,%s,%s)",
-                              (task['title'].get(), task['desc'].get("1.0", tk.END).strip(),
-                               task['date'].get(), task['time'].get_time(), user_id, activity_id))
-        
-        conn.commit()
-        conn.close()
-        
-        messagebox.showinfo("Success", f"✅ Schedule created successfully!\n\n{len(activities_list)} activities created\nwith multiple tasks.")
+    # Double-booking is allowed, but only on purpose
+    flagged = sum(1 for activity in activities_list for task in activity['tasks']
+                  if task['conflicts'].overlaps)
+    if flagged and not messagebox.askyesno(
+            "Schedule Conflicts", f"{flagged} task(s) overlap other tasks at the same time.\n\nSave anyway?"):
+        return
+    
+    # Read the form here; the background job must not touch widgets
+    user_values = (first_name_entry.get().strip(), last_name_entry.get().strip(), 
+                   datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    schedule = []
+    for activity in activities_list:
+        activity_values = (activity['name'].get(), activity['category'].get(), 
+                           activity['priority'].get(), activity['status'].get())
+        task_values = [(task['title'].get(), task['desc'].get("1.0", tk.END).strip(),
+                        task['date'].get_date().strftime('%Y-%m-%d'), task['time'].get_time(),
+                        task['duration'].get_minutes())
+                       for task in activity['tasks']]
+        schedule.append((activity_values, task_values))
+    
+    # Save to database (the executor commits the whole schedule as one transaction)
+    def save_schedule(cursor):
+        return insert_schedule(cursor, user_values, schedule)
+    
+    def on_saved(saved):
+        user_id, activity_ids = saved
+        # The dashboard adds these to its counters instead of re-reading them
+        dates = [task[2] for _, task_values in schedule for task in task_values]
+        today = datetime.now().strftime('%Y-%m-%d')
+        counts = (1, len(schedule), len(dates), sum(1 for day in dates if day >= today))
+        events.publish(TASK_CREATED, user_ids=[user_id], activity_ids=activity_ids, counts=counts)
+        messagebox.showinfo("Success", f"✅ Schedule created successfully!\n\n{len(schedule)} activities created\nwith multiple tasks.")
         
-        # Refresh to dashboard
-        from views.dashboard import show_dashboard
-        for widget in parent.winfo_children():
-            widget.destroy()
-        show_dashboard(parent)
-    
-    except Exception as e:
-        messagebox.showerror("Database Error", f"Failed to save schedule:\n{e}")
\ No newline at end of file
+        # Start the next schedule from an empty form
+        if first_name_entry.winfo_exists():
+            for widget in parent.winfo_children():
+                widget.destroy()
+            show_create(parent, on_created)
+        if on_created:
+            on_created()
+    
+    def on_error(e):
+        messagebox.showerror("Database Error", f"Failed to save schedule:\n{e}")
+    
+    submit_query(save_schedule, on_saved, on_error)
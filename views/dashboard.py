@@ -2,13 +2,27 @@ import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
 from config.styles import *
-from config.database import Database
+from config import startup
+from config.events import (ACTIVITY_STATUS_CHANGED, ALL_EVENTS, DATA_RESET, TASK_CREATED,
+                           TASK_DELETED, TASK_UPDATED, events)
+from config.executor import submit_query
+from storage import snapshot
+from storage.repository import fetch_dashboard, fetch_recent_task_rows, fetch_stats
 from components.buttons import ModernButton
 from components.cards import ModernCard, StatCard
+from components.loading import LoadingIndicator
+
+
+RECENT_TASKS_LIMIT = 25  # Recent task cards shown (and kept in the pool)
 
 
 def show_dashboard(parent):
-    """Display the dashboard view"""
+    """
+    Display the dashboard view
+    
+    Returns:
+        Function that reloads the stats and recent tasks in place
+    """
     # Clear the parent frame first to ensure fresh data
     for widget in parent.winfo_children():
         widget.destroy()
@@ -24,50 +38,8 @@ def show_dashboard(parent):
             font=FONT_BODY, fg=TEXT_SECONDARY, bg=BG_MAIN).pack(side="right")
     
     # Stats Grid
-    try:
-        conn = Database.connect()
-        cursor = conn.cursor()
-        
-        # Count ONLY users who have at least one task
-        cursor.execute("""
-            SELECT COUNT(DISTINCT user_id) FROM tasks
-        """)
-        total_users = cursor.fetchone()[0]
-        
-        # Count ONLY activities that have at least one task
-        cursor.execute("""
-            SELECT COUNT(DISTINCT activity_id) FROM tasks
-        """)
-        total_activities = cursor.fetchone()[0]
-        
-        # Count total tasks
-        cursor.execute("SELECT COUNT(*) FROM tasks")
-        total_tasks = cursor.fetchone()[0]
-        
-        # Count upcoming tasks (today and future)
-        cursor.execute("SELECT COUNT(*) FROM tasks WHERE date >= CURDATE()")
-        upcoming_tasks = cursor.fetchone()[0]
-        
-        conn.close()
-        
-        stats_grid = tk.Frame(parent, bg=BG_MAIN)
-        stats_grid.pack(fill="x", pady=(0, 20))
-        
-        stats_data = [
-            ("Active Users", total_users, "👥", SUCCESS),
-            ("Active Activities", total_activities, "🎯", INFO),
-            ("Total Tasks", total_tasks, "📋", SECONDARY),
-            ("Upcoming", upcoming_tasks, "⏰", PRIMARY)
-        ]
-        
-        for idx, (title, value, icon, color) in enumerate(stats_data):
-            card = StatCard(stats_grid, title, value, icon, color)
-            card.grid(row=0, column=idx, padx=10, sticky="ew")
-            stats_grid.grid_columnconfigure(idx, weight=1)
-    
-    except Exception as e:
-        tk.Label(parent, text=f"Error loading stats: {e}",
-                fg=DANGER, bg=BG_MAIN).pack()
+    stats_grid = tk.Frame(parent, bg=BG_MAIN)
+    stats_grid.pack(fill="x", pady=(0, 20))
     
     # Recent Activity Section
     recent_frame = ModernCard(parent)
@@ -81,10 +53,15 @@ def show_dashboard(parent):
             fg=TEXT_PRIMARY, bg=BG_CARD).pack(side="left")
     
     refresh_btn = ModernButton(card_header, "Refresh", 
-                               lambda: show_dashboard(parent),
+                               lambda: load(),
                                style="outline", width=10)
     refresh_btn.pack(side="right")
     
+    # Shown while saved (possibly outdated) data is on screen
+    stale_label = tk.Label(card_header, text="", font=FONT_SMALL,
+                           fg=TEXT_SECONDARY, bg=BG_CARD)
+    stale_label.pack(side="right", padx=10)
+    
     # Scrollable task list
     canvas = tk.Canvas(recent_frame, bg=BG_CARD, highlightthickness=0)
     scrollbar = ttk.Scrollbar(recent_frame, orient="vertical", command=canvas.yview)
@@ -94,80 +71,288 @@ def show_dashboard(parent):
     canvas.create_window((0, 0), window=scrollable, anchor="nw")
     canvas.configure(yscrollcommand=scrollbar.set)
     
-    try:
-        conn = Database.connect()
-        cursor = conn.cursor()
-        
-        # Only fetch existing tasks (deleted tasks won't appear)
-        query = """
-        SELECT t.task_id, t.task_title, t.date, t.time,
-               a.activity_name, a.priority, a.status,
-               u.first_name, u.last_name
-        FROM tasks t
-        JOIN activities a ON t.activity_id = a.activity_id
-        JOIN users u ON t.user_id = u.user_id
-        ORDER BY t.task_id DESC
-        LIMIT 10
-        """
-        cursor.execute(query)
-        tasks = cursor.fetchall()
-        conn.close()
+    canvas.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+    
+    # Cards and stat tiles are built once and reconfigured on every load
+    cards = TaskCardPool(scrollable)
+    stat_cards = []
+    shown_stats = []
+    messages = []
+    
+    def clear_messages():
+        # Loading and error labels are the only widgets that get destroyed
+        while messages:
+            messages.pop().destroy()
+    
+    def render(stats, tasks):
+        clear_messages()
+        shown_stats[:] = stats
+        _render_stats(stats_grid, stat_cards, stats)
+        cards.show(tasks)
+    
+    def load(show_saved=False):
+        # Data already on screen stays there while the refresh runs
+        shown = cards.shown is not None
+        saved = None
+        if shown:
+            stale_label.config(text="⟳ Refreshing…", fg=TEXT_SECONDARY)
+        else:
+            # Paint the last known state right away instead of a blank card
+            saved = (snapshot.latest() or snapshot.load()) if show_saved else None
+            if saved:
+                render(saved["stats"], saved["tasks"])
+                saved_at = datetime.fromisoformat(saved["saved_at"]).strftime("%b %d, %H:%M")
+                stale_label.config(text=f"🕓 Saved {saved_at} · refreshing…", fg=TEXT_SECONDARY)
+                startup.mark("snapshot")
+            else:
+                clear_messages()
+                loading = LoadingIndicator(scrollable)
+                loading.pack(pady=50)
+                messages.append(loading)
         
-        if tasks:
-            for task in tasks:
-                task_card = create_task_card(scrollable, task)
-                task_card.pack(fill="x", padx=20, pady=5)
+        def on_loaded(data):
+            stats, tasks = data
+            stale_label.config(text="")
+            with startup.phase("render"):
+                render(stats, tasks)
+            snapshot.remember(stats, tasks)
+            startup.report()
+        
+        def on_error(e):
+            if shown or saved:
+                # Keep the data on screen, but say it could not be refreshed
+                note = "Showing saved data" if saved else "Showing previous data"
+                stale_label.config(text=f"⚠️ {note}, refresh failed: {e}", fg=DANGER)
+                return
+            clear_messages()
+            messages.append(tk.Label(stats_grid, text=f"Error loading stats: {e}",
+                                     fg=DANGER, bg=BG_MAIN))
+            messages.append(tk.Label(scrollable, text=f"Error loading tasks: {e}",
+                                     fg=DANGER, bg=BG_CARD))
+            messages[0].pack()
+            messages[1].pack(pady=20)
+        
+        # Query in the background so the window stays responsive
+        submit_query(startup.timed("query", _fetch_dashboard), on_loaded, on_error,
+                     group="dashboard", owner=scrollable)
+    
+    def patch(stats=None, tasks=None):
+        """Show changed stats and/or tasks in place and keep them for the snapshot"""
+        if stats is not None:
+            shown_stats[:] = stats
+            _render_stats(stats_grid, stat_cards, stats)
+        if tasks is not None:
+            cards.show(tasks)
+        snapshot.remember(shown_stats, cards.shown)
+    
+    def merge(rows):
+        """Put fetched rows in place of the cards they replace, newest first"""
+        tasks = {task[0]: task for task in cards.shown}
+        tasks.update((row[0], tuple(row)) for row in rows)
+        patch(tasks=sorted(tasks.values(), key=lambda task: task[0], reverse=True)[:RECENT_TASKS_LIMIT])
+    
+    def fetch(work, on_fetched):
+        # Patches must all arrive, so none supersedes another; a failed one falls back to a reload
+        submit_query(work, on_fetched, lambda e: load(), owner=scrollable, supersede=False)
+    
+    def patch_cards(event, shown):
+        name = event["name"]
+        if name == TASK_CREATED:
+            # New tasks are newer than every card, so only theirs are read
+            scope = {"activity_ids": event["activity_ids"], "user_ids": event["user_ids"]}
+            fetch(lambda cursor: fetch_recent_task_rows(cursor, RECENT_TASKS_LIMIT, scope), merge)
+        elif name == TASK_DELETED:
+            deleted = set(event["task_ids"])
+            kept = [task for task in shown if task[0] not in deleted]
+            if len(kept) == len(shown):
+                return
+            patch(tasks=kept)
+            if len(shown) == RECENT_TASKS_LIMIT:
+                # Refill the list from the tasks below the last card
+                missing = RECENT_TASKS_LIMIT - len(kept)
+                before = kept[-1][0] if kept else None
+                fetch(lambda cursor: fetch_recent_task_rows(cursor, missing, before=before), merge)
+        elif not event["remote"] and name == TASK_UPDATED and "values" in event:
+            patch(tasks=[_edited_task(task, event["values"]) for task in shown])
+        elif not event["remote"] and name == ACTIVITY_STATUS_CHANGED and "status" in event:
+            activity_ids = set(event["activity_ids"])
+            patch(tasks=[task[:6] + (event["status"],) + task[7:] if task[9] in activity_ids else task
+                         for task in shown])
         else:
-            tk.Label(scrollable, text="📭 No tasks yet\nCreate your first schedule to get started!",
-                    font=FONT_BODY, fg=TEXT_SECONDARY, bg=BG_CARD,
-                    justify="center").pack(pady=50)
+            # Other clients' edits carry only ids: re-read the cards they touch
+            ids = [set(event["task_ids"]), set(event["activity_ids"]), set(event["user_ids"])]
+            touched = [task[0] for task in shown
+                       if task[0] in ids[0] or task[9] in ids[1] or task[10] in ids[2]]
+            if touched:
+                fetch(lambda cursor: fetch_recent_task_rows(cursor, len(touched), {"task_ids": touched}),
+                      merge)
     
-    except Exception as e:
-        tk.Label(scrollable, text=f"Error loading tasks: {e}",
-                fg=DANGER, bg=BG_CARD).pack(pady=20)
+    def on_data_changed(event):
+        # Hidden, the dashboard refreshes when shown (the cache versions moved)
+        if not scrollable.winfo_ismapped():
+            return
+        shown = cards.shown
+        if event["name"] == DATA_RESET or not shown_stats or shown is None:
+            load()
+            return
+        
+        # Counters move by the deltas a local write reports; otherwise they
+        # are re-read (one statement over the counter tables)
+        if "counts" in event:
+            patch(stats=[value + delta for value, delta in zip(shown_stats, event["counts"])])
+        elif event["name"] != ACTIVITY_STATUS_CHANGED:
+            fetch(fetch_stats, lambda stats: patch(stats=stats))
+        patch_cards(event, shown)
     
-    canvas.pack(side="left", fill="both", expand=True)
-    scrollbar.pack(side="right", fill="y")
+    events.subscribe(ALL_EVENTS, on_data_changed, owner=scrollable)
+    load(show_saved=True)
+    return load
 
 
-def create_task_card(parent, task):
-    """Create a task card widget"""
-    task_id, title, date, time, activity, priority, status, fname, lname = task
+def _fetch_dashboard(cursor):
+    return fetch_dashboard(cursor, RECENT_TASKS_LIMIT)
+
+
+def _edited_task(task, values):
+    """A card row with the saved update form applied (activity and user fields are shared)"""
+    task_id, title, date, time, activity, priority, status, fname, lname, activity_id, user_id = task
+    if task_id == values["task_id"]:
+        title, date, time = values["title"], values["date"], values["time"]
+    if activity_id == values["activity_id"]:
+        activity, priority, status = values["activity_name"], values["priority"], values["status"]
+    if user_id == values["user_id"]:
+        fname, lname = values["first_name"], values["last_name"]
+    return task_id, title, date, time, activity, priority, status, fname, lname, activity_id, user_id
+
+
+def _render_stats(stats_grid, stat_cards, stats):
+    """Build the stat cards, or update the values of those already built"""
+    total_users, total_activities, total_tasks, upcoming_tasks = stats
     
-    card = tk.Frame(parent, bg="#f8fafc", relief=tk.FLAT, bd=0,
-                   highlightthickness=1, highlightbackground=BORDER_COLOR)
+    stats_data = [
+        ("Active Users", total_users, "👥", SUCCESS),
+        ("Active Activities", total_activities, "🎯", INFO),
+        ("Total Tasks", total_tasks, "📋", SECONDARY),
+        ("Upcoming", upcoming_tasks, "⏰", PRIMARY)
+    ]
     
-    # Priority indicator
-    priority_colors = {"High": DANGER, "Medium": WARNING, "Low": SUCCESS}
-    indicator = tk.Frame(card, bg=priority_colors.get(priority, INFO), width=5)
-    indicator.pack(side="left", fill="y")
+    if stat_cards:
+        for card, (title, value, icon, color) in zip(stat_cards, stats_data):
+            card.set_value(value)
+        return
     
-    # Content
-    content = tk.Frame(card, bg="#f8fafc")
-    content.pack(side="left", fill="both", expand=True, padx=15, pady=12)
+    for idx, (title, value, icon, color) in enumerate(stats_data):
+        card = StatCard(stats_grid, title, value, icon, color)
+        card.grid(row=0, column=idx, padx=10, sticky="ew")
+        stats_grid.grid_columnconfigure(idx, weight=1)
+        stat_cards.append(card)
+
+
+class TaskCardPool:
+    """
+    Recent task cards that are reused between loads
     
-    # Title and activity
-    tk.Label(content, text=title, font=FONT_BODY_BOLD,
-            fg=TEXT_PRIMARY, bg="#f8fafc", anchor="w").pack(fill="x")
+    Showing a new task list reconfigures the existing cards in place,
+    builds cards only when the list grows past the pool and hides
+    (pack_forget) the surplus when it shrinks, so a refresh costs a few
+    config() calls per card instead of rebuilding the widget tree.
+    """
     
-    info_text = f"🎯 {activity} • 📅 {date}"
-    if time:
-        info_text += f" • ⏰ {time}"
-    info_text += f" • 👤 {fname} {lname}"
+    def __init__(self, parent):
+        self.frame = tk.Frame(parent, bg=BG_CARD)
+        self.frame.pack(fill="x")
+        self.cards = []
+        self.shown = None  # Tasks currently on screen (None before the first show)
+        self.empty_label = tk.Label(self.frame,
+                                    text="📭 No tasks yet\nCreate your first schedule to get started!",
+                                    font=FONT_BODY, fg=TEXT_SECONDARY, bg=BG_CARD,
+                                    justify="center")
     
-    tk.Label(content, text=info_text, font=FONT_SMALL,
-            fg=TEXT_SECONDARY, bg="#f8fafc", anchor="w").pack(fill="x", pady=(3, 0))
+    def show(self, tasks):
+        tasks = list(tasks)
+        if tasks == self.shown:
+            return
+        
+        visible = 0 if self.shown is None else len(self.shown)
+        for idx, task in enumerate(tasks):
+            if idx < len(self.cards):
+                self.cards[idx].set_task(task)
+            else:
+                self.cards.append(create_task_card(self.frame, task))
+            if idx >= visible:
+                # Hidden cards always form the tail, so packing keeps the order
+                self.cards[idx].pack(fill="x", padx=20, pady=5)
+        
+        for card in self.cards[len(tasks):visible]:
+            card.pack_forget()
+        
+        if tasks:
+            self.empty_label.pack_forget()
+        else:
+            self.empty_label.pack(pady=50)
+        self.shown = tasks
+
+
+class TaskCard(tk.Frame):
+    """Recent task card whose contents can be swapped with set_task()"""
     
-    # Status badge
-    status_colors = {
+    PRIORITY_COLORS = {"High": DANGER, "Medium": WARNING, "Low": SUCCESS}
+    STATUS_COLORS = {
         "Pending": ("#fef3c7", "#92400e"),
         "In Progress": ("#dbeafe", "#1e40af"),
         "Done": ("#d1fae5", "#065f46")
     }
-    bg, fg = status_colors.get(status, ("#f3f4f6", TEXT_PRIMARY))
     
-    badge = tk.Label(card, text=status, font=FONT_SMALL,
-                    bg=bg, fg=fg, padx=12, pady=4)
-    badge.pack(side="right", padx=15)
+    def __init__(self, parent, task):
+        super().__init__(parent, bg="#f8fafc", relief=tk.FLAT, bd=0,
+                         highlightthickness=1, highlightbackground=BORDER_COLOR)
+        self.task = None
+        
+        # Priority indicator
+        self.indicator = tk.Frame(self, width=5)
+        self.indicator.pack(side="left", fill="y")
+        
+        # Content
+        content = tk.Frame(self, bg="#f8fafc")
+        content.pack(side="left", fill="both", expand=True, padx=15, pady=12)
+        
+        # Title and activity
+        self.title_label = tk.Label(content, font=FONT_BODY_BOLD,
+                                    fg=TEXT_PRIMARY, bg="#f8fafc", anchor="w")
+        self.title_label.pack(fill="x")
+        
+        self.info_label = tk.Label(content, font=FONT_SMALL,
+                                   fg=TEXT_SECONDARY, bg="#f8fafc", anchor="w")
+        self.info_label.pack(fill="x", pady=(3, 0))
+        
+        # Status badge
+        self.badge = tk.Label(self, font=FONT_SMALL, padx=12, pady=4)
+        self.badge.pack(side="right", padx=15)
+        
+        self.set_task(task)
     
-    return card
\ No newline at end of file
+    def set_task(self, task):
+        """Reconfigure the card for another task"""
+        task = tuple(task)
+        if task == self.task:
+            return
+        task_id, title, date, time, activity, priority, status, fname, lname = task[:9]
+        
+        info_text = f"🎯 {activity} • 📅 {date}"
+        if time:
+            info_text += f" • ⏰ {time}"
+        info_text += f" • 👤 {fname} {lname}"
+        
+        bg, fg = self.STATUS_COLORS.get(status, ("#f3f4f6", TEXT_PRIMARY))
+        
+        self.indicator.config(bg=self.PRIORITY_COLORS.get(priority, INFO))
+        self.title_label.config(text=title)
+        self.info_label.config(text=info_text)
+        self.badge.config(text=status, bg=bg, fg=fg)
+        self.task = task
+
+
+def create_task_card(parent, task):
+    """Create a task card widget"""
+    return TaskCard(parent, task)
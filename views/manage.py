@@ -1,19 +1,53 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
+from datetime import date, datetime
 from tkcalendar import DateEntry
 from config.styles import *
-from config.database import Database
+from config.events import (ACTIVITY_STATUS_CHANGED, ALL_EVENTS, DATA_RESET, TASK_CREATED,
+                           TASK_DELETED, TASK_UPDATED, events)
+from config.executor import submit_query
+from storage.conflicts import check_schedule
+from storage.listing import LISTING_MAX_ROWS, ScheduleListing
+from storage.repository import (SEARCH_RANK_LIMIT, SORT_COLUMNS, delete_tasks_with_cleanup,
+                                fetch_schedule_listing, fetch_schedule_page, fetch_schedule_rows,
+                                fetch_task, search_schedule_page, set_activity_status, update_task)
 from components.buttons import ModernButton
 from components.cards import ModernCard
-from components.pickers import TimePicker
+from components.conflicts import ConflictNotice
+from components.pickers import DurationPicker, TimePicker
+
+
+PAGE_SIZE = 200            # Rows fetched per keyset page
+TYPING_DEBOUNCE_MS = 200  # Pause in typing before the User/search boxes apply
+
+FILTER_CHOICES = {
+    "Date": ["Any Date", "Today", "Upcoming", "Past"],
+    "Priority": ["All", "High", "Medium", "Low"],
+    "Status": ["All", "Pending", "In Progress", "Done"],
+    "Category": ["All", "School", "Event", "Hangout", "Travel", "Other"]
+}
+
+# Filters and sort order survive switching between view/update/delete
+manage_filters = {"Date": "Any Date", "Priority": "All", "Status": "All",
+                  "Category": "All", "User": "", "Search": ""}
+manage_sort = {"column": "ID", "descending": True}
+
+# In-memory listing (storage.listing), shared by the view/update/delete tables
+listing_state = {"listing": None, "loading": False, "too_large": False, "pending": []}
 
 
 def show_manage(parent):
-    """Display the manage schedules view"""
+    """
+    Display the manage schedules view
+    
+    Returns:
+        Function that reloads the table (keeping mode, filters and sort)
+    """
     # Store reference to parent
     global manage_parent
     manage_parent = parent
+    # A rebuilt tab starts from fresh data
+    listing_state.update(listing=None, loading=False, too_large=False, pending=[])
     
     header = tk.Frame(parent, bg=BG_MAIN)
     header.pack(fill="x", pady=(0, 20))
@@ -39,77 +73,76 @@ def show_manage(parent):
     
     # Default view
     load_manage_view("view")
+    return lambda: manage_reload()
 
 
-def delete_task_with_cleanup(task_id, task_title):
+class SchedulePager:
     """
-    Delete a task and clean up orphaned users/activities
-    This permanently removes data from the MySQL database
+    Builds paginated schedule queries and tracks the scroll position
+    
+    Pages continue after the last row's sort key, except for searches,
+    which are ranked by relevance on the server (newest first when they
+    match too many tasks to rank) and paged by offset.
+    With a listing, pages are slices of the task ids it selected.
     """
-    conn = None
-    try:
-        conn = Database.connect()
-        cursor = conn.cursor()
-        
-        # Get user_id and activity_id BEFORE deleting the task
-        cursor.execute("""
-            SELECT user_id, activity_id 
-            FROM tasks 
-            WHERE task_id = %s
-        """, (task_id,))
-        
-        result = cursor.fetchone()
-        if not result:
-            messagebox.showwarning("Warning", "Task not found!")
-            if conn:
-                conn.close()
-            return False
-        
-        user_id, activity_id = result
-        
-        # Step 1: Delete the task from database
-        cursor.execute("DELETE FROM tasks WHERE task_id = %s", (task_id,))
-        print(f"[DELETE] Deleted task_id {task_id} from tasks table")
-        
-        # Step 2: Check if this user has any other tasks
-        cursor.execute("SELECT COUNT(*) FROM tasks WHERE user_id = %s", (user_id,))
-        user_task_count = cursor.fetchone()[0]
-        
-        # If user has no more tasks, delete the user
-        if user_task_count == 0:
-            cursor.execute("DELETE FROM users WHERE user_id = %s", (user_id,))
-            print(f"[DELETE] Deleted orphaned user_id {user_id} from users table")
-        
-        # Step 3: Check if this activity has any other tasks
-        cursor.execute("SELECT COUNT(*) FROM tasks WHERE activity_id = %s", (activity_id,))
-        activity_task_count = cursor.fetchone()[0]
-        
-        # If activity has no more tasks, delete the activity
-        if activity_task_count == 0:
-            cursor.execute("DELETE FROM activities WHERE activity_id = %s", (activity_id,))
-            print(f"[DELETE] Deleted orphaned activity_id {activity_id} from activities table")
-        
-        # CRITICAL: Commit changes to database
-        # Without this, changes won't be saved to MySQL!
-        conn.commit()
-        print("[COMMIT] Changes committed to MySQL database")
-        
-        # Close connection
-        conn.close()
-        
-        return True
-        
-    except Exception as e:
-        print(f"[ERROR] Delete failed: {e}")
-        if conn:
-            conn.rollback()  # Rollback if there's an error
-            conn.close()
-        raise e
+    
+    def __init__(self, filters, sort_column="ID", descending=True, page_size=PAGE_SIZE):
+        self.filters = dict(filters)
+        self.sort_column = sort_column
+        self.descending = descending
+        self.page_size = page_size
+        self.reset()
+    
+    def reset(self):
+        """Start again from the first page"""
+        self.last_key = None   # (sort value, task_id) of the last loaded row
+        self.listing = None    # ScheduleListing answering this pass, if any
+        self.matches = []      # Task ids it selected, in display order
+        self.loaded = 0
+        self.exhausted = False
+        self.loading = False
+        self.ranked = True     # False once a search comes back newest first
+    
+    def has_filters(self):
+        return any(value not in ("All", "Any Date", "") for value in self.filters.values())
+    
+    def searching(self):
+        return bool(self.filters.get("Search", "").strip())
+    
+    def use_listing(self, listing):
+        """Answer this pass from memory: filter and sort without a query"""
+        self.listing = listing
+        self.matches = listing.select(self.filters, self.sort_column, self.descending)
+    
+    def listing_page(self, count=None):
+        """The next count (default page_size) rows from the listing"""
+        start = self.loaded
+        return self.listing.page(self.matches[start:start + (count or self.page_size)])
+    
+    def fetch_page(self, cursor, after_key, offset):
+        """Fetch one page (runs on a worker thread, does not touch pager state)"""
+        if self.searching():
+            return search_schedule_page(cursor, self.filters, self.filters["Search"].strip(),
+                                        offset, self.page_size)
+        return fetch_schedule_page(cursor, self.filters, self.sort_column, self.descending,
+                                   after_key, self.page_size)
+    
+    def advance(self, rows):
+        """Record a delivered page; returns the display index of its first row"""
+        first_index = self.loaded + 1
+        self.loaded += len(rows)
+        if len(rows) < self.page_size or (self.listing and self.loaded >= len(self.matches)):
+            self.exhausted = True
+        if rows and self.listing is None:
+            self.last_key = (rows[-1][-1], rows[-1][0])
+            # Unranked search rows have no relevance
+            self.ranked = not self.searching() or rows[-1][-1] is not None
+        return first_index
 
 
 def load_manage_view(mode):
     """Load specific manage view mode"""
-    global manage_content_card
+    global manage_content_card, manage_reload
     
     # Clear the content card
     for widget in manage_content_card.winfo_children():
@@ -128,199 +161,728 @@ def load_manage_view(mode):
     tk.Label(card_header, text=mode_titles.get(mode, "Schedules"),
             font=FONT_HEADER, fg=TEXT_PRIMARY, bg=BG_CARD).pack(side="left")
     
+    # Filter bar, with a chip per active filter below it
+    filter_bar = tk.Frame(manage_content_card, bg=BG_CARD)
+    filter_bar.pack(fill="x", padx=20, pady=(0, 10))
+    chip_bar = tk.Frame(manage_content_card, bg=BG_CARD)
+    chip_bar.pack(fill="x", padx=20)
+    
     # Table frame
     table_frame = tk.Frame(manage_content_card, bg=BG_CARD)
     table_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
     
-    try:
-        conn = Database.connect()
-        cursor = conn.cursor()
-        
-        query = """
-        SELECT t.task_id, t.task_title, t.date, t.time,
-               a.activity_name, a.priority, a.status, a.category,
-               u.first_name, u.last_name
-        FROM tasks t
-        JOIN activities a ON t.activity_id = a.activity_id
-        JOIN users u ON t.user_id = u.user_id
-        ORDER BY t.task_id DESC
+    manage_reload = _render_manage_table(table_frame, mode)
+    _build_filter_bar(filter_bar, chip_bar, manage_reload)
+
+
+def _build_filter_bar(filter_bar, chip_bar, on_change):
+    """
+    Create filter controls; on_change is called after any filter changes
+    
+    The User and search boxes apply while typing, once the keystrokes
+    pause for TYPING_DEBOUNCE_MS.
+    """
+    combos = {}
+    pending = {"after": None}
+    
+    def apply_filters(event=None, typed=False):
+        if pending["after"]:
+            filter_bar.after_cancel(pending["after"])
+            pending["after"] = None
+        values = {key: combo.get() for key, combo in combos.items()}
+        values["User"] = user_entry.get().strip()
+        values["Search"] = search_entry.get().strip()
+        render_chips(values)
+        if typed and values == manage_filters:
+            return
+        manage_filters.update(values)
+        on_change()
+    
+    def on_typing(event):
+        if event.keysym in ("Return", "Tab", "Shift_L", "Shift_R", "Control_L", "Control_R"):
+            return
+        if pending["after"]:
+            filter_bar.after_cancel(pending["after"])
+        pending["after"] = filter_bar.after(TYPING_DEBOUNCE_MS, lambda: apply_filters(typed=True))
+    
+    def clear_filter(key):
+        if key in combos:
+            combos[key].set(FILTER_CHOICES[key][0])
+        else:
+            entry = user_entry if key == "User" else search_entry
+            entry.delete(0, tk.END)
+        apply_filters()
+    
+    def clear_filters():
+        for key, combo in combos.items():
+            combo.set(FILTER_CHOICES[key][0])
+        user_entry.delete(0, tk.END)
+        search_entry.delete(0, tk.END)
+        apply_filters()
+    
+    def render_chips(values):
+        for widget in chip_bar.winfo_children():
+            widget.destroy()
+        for key, value in values.items():
+            if value in ("All", "Any Date", ""):
+                continue
+            text = f"🔍 {value}" if key == "Search" else f"{key}: {value}"
+            chip = tk.Label(chip_bar, text=f"{text}  ✕", font=FONT_SMALL, fg=PRIMARY,
+                            bg=BG_MAIN, padx=10, pady=3, cursor="hand2")
+            chip.pack(side="left", padx=(0, 6), pady=(0, 8))
+            chip.bind("<Button-1>", lambda e, key=key: clear_filter(key))
+    
+    for key, values in FILTER_CHOICES.items():
+        tk.Label(filter_bar, text=f"{key}:", font=FONT_SMALL,
+                fg=TEXT_SECONDARY, bg=BG_CARD).pack(side="left", padx=(0, 5))
+        combo = ttk.Combobox(filter_bar, values=values, state="readonly",
+                             font=FONT_SMALL, width=11)
+        combo.set(manage_filters.get(key, values[0]))
+        combo.pack(side="left", padx=(0, 15))
+        combo.bind("<<ComboboxSelected>>", apply_filters)
+        combos[key] = combo
+    
+    tk.Label(filter_bar, text="User:", font=FONT_SMALL,
+            fg=TEXT_SECONDARY, bg=BG_CARD).pack(side="left", padx=(0, 5))
+    user_entry = tk.Entry(filter_bar, font=FONT_SMALL, relief=tk.FLAT, width=16,
+                          bd=0, highlightthickness=1, highlightbackground=BORDER_COLOR)
+    user_entry.insert(0, manage_filters.get("User", ""))
+    user_entry.pack(side="left", ipady=4)
+    user_entry.bind("<Return>", apply_filters)
+    user_entry.bind("<KeyRelease>", on_typing)
+    
+    tk.Label(filter_bar, text="🔍", font=FONT_SMALL,
+            fg=TEXT_SECONDARY, bg=BG_CARD).pack(side="left", padx=(15, 5))
+    search_entry = tk.Entry(filter_bar, font=FONT_SMALL, relief=tk.FLAT, width=20,
+                            bd=0, highlightthickness=1, highlightbackground=BORDER_COLOR)
+    search_entry.insert(0, manage_filters.get("Search", ""))
+    search_entry.pack(side="left", ipady=4)
+    search_entry.bind("<Return>", apply_filters)
+    search_entry.bind("<KeyRelease>", on_typing)
+    
+    ModernButton(filter_bar, "Clear", clear_filters, style="outline").pack(side="right")
+    ModernButton(filter_bar, "Apply", apply_filters, style="primary").pack(side="right", padx=5)
+    render_chips(manage_filters)
+
+
+def _render_manage_table(table_frame, mode):
+    """
+    Build the schedules table for a manage mode
+    
+    Rows are fetched a page at a time (keyset on the sort key + task_id)
+    as the user scrolls; filtering, sorting and search run on the server.
+    Once a schedule of up to LISTING_MAX_ROWS tasks has been loaded into
+    memory (storage.listing), filters and heading clicks are answered
+    from there without a query.
+    
+    Returns:
+        Function that reloads the table from the first page
+    """
+    # Create treeview
+    columns = ("ID", "Task", "Date", "Time", "Activity", "Priority", "Status", "User", "Actions")
+    tree = ttk.Treeview(table_frame, columns=columns, show='headings', height=20)
+    
+    # Style the treeview
+    style = ttk.Style()
+    style.configure("Treeview", rowheight=35, font=FONT_BODY)
+    style.configure("Treeview.Heading", font=FONT_BODY_BOLD)
+    
+    pager = SchedulePager(manage_filters, manage_sort["column"], manage_sort["descending"])
+    
+    def update_headings():
+        for col in columns:
+            text = col
+            # Server search results are in relevance order, whatever the sort column
+            if col == pager.sort_column and not (pager.searching() and pager.listing is None):
+                text += " ▼" if pager.descending else " ▲"
+            tree.heading(col, text=text)
+    
+    def sort_by(col):
+        # Clicking the active column flips the direction
+        if col == pager.sort_column:
+            pager.descending = not pager.descending
+        else:
+            pager.sort_column = col
+            pager.descending = col == "ID"
+        manage_sort["column"] = pager.sort_column
+        manage_sort["descending"] = pager.descending
+        update_headings()
+        reload()
+    
+    column_widths = [50, 180, 100, 80, 130, 80, 100, 130, 120]
+    for col, width in zip(columns, column_widths):
+        if col in SORT_COLUMNS:
+            tree.heading(col, text=col, anchor=tk.W, command=lambda c=col: sort_by(c))
+        else:
+            tree.heading(col, text=col, anchor=tk.W)
+        tree.column(col, width=width, anchor=tk.W)
+    update_headings()
+    
+    status_label = tk.Label(table_frame, text="", font=FONT_SMALL,
+                            fg=TEXT_SECONDARY, bg=BG_CARD)
+    status_label.pack(side="bottom", anchor="w", pady=(5, 0))
+    
+    empty_state = tk.Frame(table_frame, bg=BG_CARD)
+    
+    def show_empty(filtered):
+        tree.pack_forget()
+        scrollbar.pack_forget()
+        for widget in empty_state.winfo_children():
+            widget.destroy()
+        empty_state.pack(expand=True)
+        
+        tk.Label(empty_state, text="📭", font=("Segoe UI", 48),
+                fg=TEXT_SECONDARY, bg=BG_CARD).pack(pady=(50, 20))
+        if filtered:
+            tk.Label(empty_state, text="No schedules match the filters", font=FONT_HEADER,
+                    fg=TEXT_PRIMARY, bg=BG_CARD).pack()
+            tk.Label(empty_state, text="Try clearing some filters",
+                    font=FONT_BODY, fg=TEXT_SECONDARY, bg=BG_CARD).pack(pady=(5, 50))
+        else:
+            tk.Label(empty_state, text="No schedules found", font=FONT_HEADER,
+                    fg=TEXT_PRIMARY, bg=BG_CARD).pack()
+            tk.Label(empty_state, text="Create your first schedule to get started",
+                    font=FONT_BODY, fg=TEXT_SECONDARY, bg=BG_CARD).pack(pady=(5, 50))
+    
+    def show_table():
+        if empty_state.winfo_ismapped():
+            empty_state.pack_forget()
+        if not tree.winfo_ismapped():
+            scrollbar.pack(side="right", fill="y")
+            tree.pack(side="left", fill="both", expand=True)
+    
+    def show_page(rows):
+        first_index = pager.advance(rows)
+        
+        if pager.loaded == 0:
+            status_label.config(text="")
+            show_empty(pager.has_filters())
+            return
+        
+        show_table()
+        # Item iid is the real task_id; the ID column is a running display index
+        for idx, row in enumerate(rows, first_index):
+            insert_row(tk.END, idx, row)
+        
+        update_status_label()
+    
+    def load_page():
+        if pager.loading or pager.exhausted:
+            return
+        if pager.listing is not None:
+            show_page(pager.listing_page())
+            return
+        pager.loading = True
+        after_key, offset = pager.last_key, pager.loaded
+        status_label.config(text=f"⏳ Loading{' more' if pager.loaded else ''}...")
+        
+        def on_loaded(rows):
+            pager.loading = False
+            show_page(rows)
+        
+        def on_error(e):
+            pager.loading = False
+            status_label.config(text=f"❌ Error loading schedules: {e}", fg=DANGER)
+        
+        submit_query(lambda cursor: pager.fetch_page(cursor, after_key, offset), on_loaded, on_error,
+                     group="manage", owner=tree, label="manage_page")
+    
+    def clear_rows():
+        tree.delete(*tree.get_children())
+        row_meta.clear()
+        activity_rows.clear()
+        user_rows.clear()
+    
+    def reload():
+        pager.filters = dict(manage_filters)
+        pager.reset()
+        if listing_state["listing"] is not None:
+            pager.use_listing(listing_state["listing"])
+        update_headings()
+        clear_rows()
+        load_page()
+        load_listing()
+    
+    def redisplay():
+        """Show the listing's current rows again, keeping scroll position and selection"""
+        if not table_frame.winfo_ismapped():
+            # Hidden tabs reload when shown, since the cache versions moved
+            return
+        count, top, selection = max(pager.loaded, pager.page_size), tree.yview()[0], tree.selection()
+        pager.reset()
+        pager.use_listing(listing_state["listing"])
+        clear_rows()
+        show_page(pager.listing_page(count))
+        tree.yview_moveto(top)
+        tree.selection_set([iid for iid in selection if tree.exists(iid)])
+    
+    def load_listing():
+        """Load every row into memory once, if the schedule is small enough"""
+        if listing_state["listing"] is not None or listing_state["loading"] or listing_state["too_large"]:
+            return
+        listing_state["loading"] = True
+        
+        def build(cursor):
+            rows = fetch_schedule_listing(cursor, LISTING_MAX_ROWS)
+            return None if rows is None else ScheduleListing(rows)
+        
+        def on_loaded(listing):
+            listing_state["loading"] = False
+            if listing is None:
+                listing_state["too_large"] = True
+                return
+            pending, listing_state["pending"] = listing_state["pending"], []
+            if None in pending:
+                # Everything was reset while it loaded
+                load_listing()
+                return
+            listing_state["listing"] = listing
+            # Changes published while it loaded may be missing from it
+            for scope in pending:
+                patch_listing(scope)
+        
+        def on_error(e):
+            listing_state["loading"] = False
+            print(f"[ERROR] Could not load the schedule listing: {e}")
+        
+        # No owner: the listing outlives this table when the mode changes
+        submit_query(build, on_loaded, on_error, label="manage_listing")
+    
+    def patch_listing(scope):
+        """Re-read the listing rows within scope; the table follows if it shows the listing"""
+        listing = listing_state["listing"]
+        if listing is None:
+            if listing_state["loading"]:
+                listing_state["pending"].append(scope)
+            return
+        
+        def on_loaded(rows):
+            if listing_state["listing"] is not listing:
+                return
+            listing.patch(scope, rows)
+            if tree.winfo_exists() and pager.listing is listing:
+                redisplay()
+        
+        def on_error(e):
+            # Better no listing than a stale one
+            listing_state["listing"] = None
+            print(f"[ERROR] Could not update the schedule listing: {e}")
+        
+        submit_query(lambda cursor: fetch_schedule_listing(cursor, scope=scope),
+                     on_loaded, on_error, label="manage_listing_patch")
+    
+    # Row bookkeeping so edits can patch items in place instead of reloading
+    row_meta = {}       # iid -> {"activity_id", "user_id", "category"}
+    activity_rows = {}  # activity_id -> set of iids
+    user_rows = {}      # user_id -> set of iids
+    
+    def insert_row(index, display_index, row):
+        """Insert a fetched row at index (None rewrites the existing item in place)"""
+        task_id, title, date, time, activity, priority, status, category, fname, lname = row[:10]
+        activity_id, user_id = row[10], row[11]
+        display_row = (display_index, title, date, time or "-", activity, priority, status, f"{fname} {lname}", "Quick Actions")
+        if index is None:
+            tree.item(str(task_id), values=display_row, tags=(task_id, priority))
+        else:
+            tree.insert('', index, iid=str(task_id), values=display_row, tags=(task_id, priority))
+        track_row(str(task_id), activity_id, user_id, category)
+    
+    def track_row(iid, activity_id, user_id, category):
+        row_meta[iid] = {"activity_id": activity_id, "user_id": user_id, "category": category}
+        activity_rows.setdefault(activity_id, set()).add(iid)
+        user_rows.setdefault(user_id, set()).add(iid)
+    
+    def untrack_row(iid):
+        meta = row_meta.pop(iid, None)
+        if not meta:
+            return
+        for index, key in ((activity_rows, meta["activity_id"]), (user_rows, meta["user_id"])):
+            rows = index.get(key)
+            if rows is not None:
+                rows.discard(iid)
+                if not rows:
+                    del index[key]
+    
+    def update_status_label():
+        more = "" if pager.exhausted else " (scroll for more)"
+        if pager.listing is not None:
+            text = f"Showing {pager.loaded} of {len(pager.matches)} schedules{more}"
+        elif pager.searching():
+            search = pager.filters["Search"].strip()
+            if pager.ranked:
+                text = f"Showing {pager.loaded} best matches for \"{search}\"{more}"
+            else:
+                text = (f"Showing {pager.loaded} matches for \"{search}\", newest first{more}"
+                        f" · over {SEARCH_RANK_LIMIT:,} matches are not ranked, refine the search")
+        else:
+            text = f"Showing {pager.loaded} schedules{more}"
+        status_label.config(text=text, fg=TEXT_SECONDARY)
+    
+    def renumber(start):
+        """Rewrite the display index of every row from position start onward"""
+        children = tree.get_children()
+        for position in range(start, len(children)):
+            tree.set(children[position], "ID", position + 1)
+    
+    def remove_rows(iids):
+        """Drop rows without re-querying; later rows keep a contiguous index"""
+        iids = [iid for iid in iids if tree.exists(iid)]
+        if not iids:
+            return
+        first = min(tree.index(iid) for iid in iids)
+        tree.delete(*iids)
+        for iid in iids:
+            untrack_row(iid)
+        pager.loaded -= len(iids)
+        renumber(first)
+        
+        if pager.loaded == 0 and pager.exhausted:
+            status_label.config(text="")
+            show_empty(pager.has_filters())
+        else:
+            update_status_label()
+    
+    def matches_filters(iid):
         """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        conn.close()
-        
-        if rows:
-            # Create treeview
-            columns = ("ID", "Task", "Date", "Time", "Activity", "Priority", "Status", "User", "Actions")
-            tree = ttk.Treeview(table_frame, columns=columns, show='headings', height=20)
-            
-            # Style the treeview
-            style = ttk.Style()
-            style.configure("Treeview", rowheight=35, font=FONT_BODY)
-            style.configure("Treeview.Heading", font=FONT_BODY_BOLD)
-            
-            column_widths = [50, 180, 100, 80, 130, 80, 100, 130, 120]
-            for col, width in zip(columns, column_widths):
-                tree.heading(col, text=col, anchor=tk.W)
-                tree.column(col, width=width, anchor=tk.W)
-            
-            for idx, row in enumerate(rows, 1):
-                task_id, title, date, time, activity, priority, status, category, fname, lname = row
-                display_row = (idx, title, date, time or "-", activity, priority, status, f"{fname} {lname}", "Quick Actions")
-                tree.insert('', tk.END, values=display_row, tags=(task_id, priority))
-            
-            # Priority colors
-            tree.tag_configure("High", foreground=DANGER)
-            tree.tag_configure("Medium", foreground=WARNING)
-            tree.tag_configure("Low", foreground=SUCCESS)
-            
-            # Quick status change function
-            def quick_status_change(event):
-                region = tree.identify("region", event.x, event.y)
-                if region == "cell":
-                    column = tree.identify_column(event.x)
-                    item = tree.identify_row(event.y)
-                    
-                    if item and column == "#9":  # Actions column
-                        task_id = tree.item(item)['tags'][0]
-                        values = tree.item(item)['values']
-                        current_status = values[6]
-                        
-                        # Create popup menu
-                        menu = tk.Menu(tree, tearoff=0, font=FONT_BODY)
-                        menu.add_command(label="✏️ Edit Full Details", 
-                                       command=lambda: [menu.unpost(), open_update_form(task_id)])
-                        menu.add_separator()
-                        menu.add_command(label="📋 Change to: Pending", 
-                                       command=lambda: [menu.unpost(), change_status(task_id, "Pending")])
-                        menu.add_command(label="🔄 Change to: In Progress", 
-                                       command=lambda: [menu.unpost(), change_status(task_id, "In Progress")])
-                        menu.add_command(label="✅ Change to: Done", 
-                                       command=lambda: [menu.unpost(), change_status(task_id, "Done")])
-                        
-                        menu.post(event.x_root, event.y_root)
+        Check a patched row against the active filters
+        
+        Returns None when only the server can tell: the search text also
+        matches task descriptions, which the table does not hold.
+        """
+        values = tree.set(iid)
+        current = {"Priority": values["Priority"], "Status": values["Status"],
+                   "Category": row_meta[iid]["category"]}
+        for key, value in current.items():
+            wanted = pager.filters.get(key)
+            if wanted and wanted != "All" and wanted != value:
+                return False
+        
+        # Same windows as the server's date filter; dates compare as 'YYYY-MM-DD'
+        date_filter = pager.filters.get("Date")
+        day, today = str(values["Date"]), date.today().isoformat()
+        if ((date_filter == "Today" and day != today) or (date_filter == "Upcoming" and day < today)
+                or (date_filter == "Past" and day >= today)):
+            return False
+        
+        user = pager.filters.get("User", "").strip().lower()
+        if user and user not in str(values["User"]).lower():
+            return False
+        return None if pager.searching() else True
+    
+    def recheck_rows(iids):
+        """Drop patched rows that left the filters; those only the server can judge are re-read"""
+        iids = [iid for iid in iids if tree.exists(iid)]
+        checked = {iid: matches_filters(iid) for iid in iids}
+        remove_rows([iid for iid, match in checked.items() if match is False])
+        unknown = [int(iid) for iid, match in checked.items() if match is None]
+        if unknown:
+            queue_refetch({"name": TASK_UPDATED, "task_ids": unknown, "activity_ids": [], "user_ids": []})
+    
+    def patch_activity(activity_id, **changes):
+        """Update every loaded row that belongs to an activity; returns their iids"""
+        iids = list(activity_rows.get(activity_id, ()))
+        for iid in iids:
+            if "activity_name" in changes:
+                tree.set(iid, "Activity", changes["activity_name"])
+            if "status" in changes:
+                tree.set(iid, "Status", changes["status"])
+            if "priority" in changes:
+                tree.set(iid, "Priority", changes["priority"])
+                tree.item(iid, tags=(int(iid), changes["priority"]))
+            if "category" in changes:
+                row_meta[iid]["category"] = changes["category"]
+        return iids
+    
+    def patch_user(user_id, name):
+        """Update the user column of every loaded row for a user; returns their iids"""
+        iids = list(user_rows.get(user_id, ()))
+        for iid in iids:
+            tree.set(iid, "User", name)
+        return iids
+    
+    def apply_edit(saved):
+        """Patch the rows touched by the update form (sort position is left as is)"""
+        if not tree.winfo_exists():
+            return
+        iid = str(saved["task_id"])
+        if tree.exists(iid):
+            tree.set(iid, "Task", saved["title"])
+            tree.set(iid, "Date", saved["date"])
+            tree.set(iid, "Time", saved["time"] or "-")
+        touched = {iid}
+        touched.update(patch_user(saved["user_id"], f"{saved['first_name']} {saved['last_name']}"))
+        touched.update(patch_activity(saved["activity_id"], activity_name=saved["activity_name"],
+                                      category=saved["category"], priority=saved["priority"],
+                                      status=saved["status"]))
+        # Rows that no longer satisfy the filters leave the table
+        recheck_rows(touched)
+    
+    def refetch_rows(changes):
+        """
+        Patch the loaded rows touched by events that carry only ids
+        
+        Only the affected tasks, activities and users are re-read. Rows
+        that changed are rewritten in place, rows that were deleted or no
+        longer match the filters leave, and new rows are added at the top
+        when the table is sorted newest first (otherwise they are counted
+        in the status line until the next reload).
+        """
+        if not tree.winfo_ismapped():
+            # Hidden tabs reload when shown, since the cache versions moved
+            return
+        if any(change["name"] == DATA_RESET for change in changes):
+            reload()
+            return
+        
+        scope = {"task_ids": set(), "activity_ids": set(), "user_ids": set()}
+        created = {"activity_ids": set(), "user_ids": set()}  # Every task under these is new
+        for change in changes:
+            for key in scope:
+                scope[key].update(change[key])
+            if change["name"] == TASK_CREATED:
+                for key in created:
+                    created[key].update(change[key])
+        
+        affected = {str(task_id) for task_id in scope["task_ids"] if str(task_id) in row_meta}
+        for index, key in ((activity_rows, "activity_ids"), (user_rows, "user_ids")):
+            for value in scope[key]:
+                affected.update(index.get(value, ()))
+        
+        def on_loaded(rows):
+            if not tree.winfo_exists():
+                return
+            fresh = {str(row[0]): row for row in rows}
+            remove_rows([iid for iid in affected if iid not in fresh])
             
-            def change_status(task_id, new_status):
-                try:
-                    conn = Database.connect()
-                    cursor = conn.cursor()
-                    
-                    cursor.execute("SELECT activity_id FROM tasks WHERE task_id = %s", (task_id,))
-                    activity_id = cursor.fetchone()[0]
-                    
-                    cursor.execute("UPDATE activities SET status = %s WHERE activity_id = %s", 
-                                 (new_status, activity_id))
-                    
-                    conn.commit()
-                    conn.close()
-                    
-                    status_icons = {"Pending": "📋", "In Progress": "🔄", "Done": "✅"}
-                    messagebox.showinfo("Status Updated", 
-                                      f"{status_icons.get(new_status, '')} Status changed to: {new_status}")
-                    
-                    load_manage_view(mode)
-                    
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to update status:\n{e}")
+            new_rows = []
+            for iid, row in fresh.items():
+                if iid in row_meta:
+                    untrack_row(iid)
+                    insert_row(None, tree.set(iid, "ID"), row)
+                elif row[10] in created["activity_ids"] or row[11] in created["user_ids"]:
+                    new_rows.append(row)
             
-            tree.bind('<Button-1>', quick_status_change)
+            if not new_rows:
+                return
+            if pager.sort_column == "ID" and pager.descending and not pager.searching():
+                show_table()
+                for row in sorted(new_rows, key=lambda row: row[0]):
+                    insert_row(0, 1, row)
+                pager.loaded += len(new_rows)
+                renumber(0)
+                update_status_label()
+            else:
+                status_label.config(text=f"{status_label.cget('text')} · {len(new_rows)} new, reload to show",
+                                    fg=TEXT_SECONDARY)
+        
+        def on_error(e):
+            print(f"[ERROR] Could not apply data changes: {e}")
+        
+        # Not in the "manage" group, so a page that is loading is not cancelled
+        submit_query(lambda cursor: fetch_schedule_rows(cursor, pager.filters, pager.sort_column, scope),
+                     on_loaded, on_error, owner=tree, label="manage_changes")
+    
+    pending_changes = []
+    
+    def flush_changes():
+        changes = list(pending_changes)
+        pending_changes.clear()
+        if tree.winfo_exists():
+            refetch_rows(changes)
+    
+    def queue_refetch(event):
+        """Batch an event into the next re-read of the rows it touches"""
+        if not pending_changes:
+            tree.after_idle(flush_changes)
+        pending_changes.append(event)
+    
+    def on_data_changed(event):
+        """Apply a data change event to the listing and the loaded rows"""
+        if event["name"] == DATA_RESET:
+            listing_state.update(listing=None, too_large=False)
+            if listing_state["loading"]:
+                listing_state["pending"].append(None)
+        else:
+            patch_listing({key: event[key] for key in ("task_ids", "activity_ids", "user_ids")})
+        
+        if pager.listing is not None and event["name"] != DATA_RESET:
+            # The table is redrawn from the listing once it is patched
+            return
+        # Local edits carry what changed, so their rows are patched without a query
+        if not event["remote"] and event["name"] == TASK_UPDATED and "values" in event:
+            apply_edit(event["values"])
+        elif not event["remote"] and event["name"] == ACTIVITY_STATUS_CHANGED and "status" in event:
+            recheck_rows([iid for activity_id in event["activity_ids"]
+                          for iid in patch_activity(activity_id, status=event["status"])])
+        elif not event["remote"] and event["name"] == TASK_DELETED:
+            remove_rows([str(task_id) for task_id in event["task_ids"]])
+        else:
+            # Events that carry only ids are batched into one re-read
+            queue_refetch(event)
+    
+    events.subscribe(ALL_EVENTS, on_data_changed, owner=tree)
+    
+    def on_scroll(first, last):
+        scrollbar.set(first, last)
+        # Fetch the next page as the user nears the bottom
+        if float(last) >= 0.9:
+            load_page()
+    
+    # Priority colors
+    tree.tag_configure("High", foreground=DANGER)
+    tree.tag_configure("Medium", foreground=WARNING)
+    tree.tag_configure("Low", foreground=SUCCESS)
+    
+    # Quick status change function
+    def quick_status_change(event):
+        region = tree.identify("region", event.x, event.y)
+        if region == "cell":
+            column = tree.identify_column(event.x)
+            item = tree.identify_row(event.y)
             
-            # Mode-specific interactions
-            if mode == "update":
-                def on_double_click(event):
-                    selection = tree.selection()
-                    if selection:
-                        item = tree.item(selection[0])
-                        task_id = item['tags'][0]
-                        open_update_form(task_id)
+            if item and column == "#9":  # Actions column
+                task_id = tree.item(item)['tags'][0]
+                values = tree.item(item)['values']
+                current_status = values[6]
                 
-                tree.bind('<Double-1>', on_double_click)
+                # Create popup menu
+                menu = tk.Menu(tree, tearoff=0, font=FONT_BODY)
+                menu.add_command(label="✏️ Edit Full Details", 
+                               command=lambda: [menu.unpost(), open_update_form(task_id)])
+                menu.add_separator()
+                menu.add_command(label="📋 Change to: Pending", 
+                               command=lambda: [menu.unpost(), change_status(task_id, "Pending")])
+                menu.add_command(label="🔄 Change to: In Progress", 
+                               command=lambda: [menu.unpost(), change_status(task_id, "In Progress")])
+                menu.add_command(label="✅ Change to: Done", 
+                               command=lambda: [menu.unpost(), change_status(task_id, "Done")])
                 
-                info_label = tk.Label(table_frame, text="💡 Double-click row to edit full details | Click 'Quick Actions' to change status quickly",
-                                     font=FONT_SMALL, fg=TEXT_SECONDARY, bg=BG_CARD)
-                info_label.pack(pady=(10, 0))
+                menu.post(event.x_root, event.y_root)
+    
+    def change_status(task_id, new_status):
+        meta = row_meta.get(str(task_id))
+        if meta is None:
+            # The row left the table (another client's change) while the menu was open
+            return
+        activity_id = meta["activity_id"]
+        
+        def on_updated(_):
+            # Status lives on the activity, so every row sharing it changes
+            events.publish(ACTIVITY_STATUS_CHANGED, activity_ids=[activity_id], status=new_status)
             
-            elif mode == "delete":
-                def on_delete_click(event):
-                    selection = tree.selection()
-                    if selection:
-                        item = tree.item(selection[0])
-                        task_id = item['tags'][0]
-                        values = item['values']
-                        task_title = values[1]
-                        
-                        if messagebox.askyesno("Confirm Delete", 
-                                              f"Are you sure you want to delete this task?\n\n📋 {task_title}\n🆔 Task ID: {task_id}\n\n⚠️ This action cannot be undone."):
-                            try:
-                                # Use the new delete function with cleanup
-                                success = delete_task_with_cleanup(task_id, task_title)
-                                
-                                if success:
-                                    messagebox.showinfo("Success", 
-                                        f"✅ Task '{task_title}' deleted successfully!\n\n" +
-                                        "The data has been permanently removed from the database.")
-                                    
-                                    # Reset auto increment
-                                    Database.reset_auto_increment()
-                                    
-                                    # Refresh the view
-                                    load_manage_view("delete")
-                                
-                            except Exception as e:
-                                messagebox.showerror("Error", f"Failed to delete task:\n{e}")
+            status_icons = {"Pending": "📋", "In Progress": "🔄", "Done": "✅"}
+            messagebox.showinfo("Status Updated", 
+                              f"{status_icons.get(new_status, '')} Status changed to: {new_status}")
+        
+        def on_error(e):
+            messagebox.showerror("Error", f"Failed to update status:\n{e}")
+        
+        submit_query(lambda cursor: set_activity_status(cursor, activity_id, new_status),
+                     on_updated, on_error, label="set_activity_status")
+    
+    tree.bind('<Button-1>', quick_status_change)
+    
+    # Mode-specific interactions
+    if mode == "update":
+        def on_double_click(event):
+            selection = tree.selection()
+            if selection:
+                item = tree.item(selection[0])
+                task_id = item['tags'][0]
+                open_update_form(task_id)
+        
+        tree.bind('<Double-1>', on_double_click)
+        
+        info_label = tk.Label(table_frame, text="💡 Double-click row to edit full details | Click 'Quick Actions' to change status quickly",
+                             font=FONT_SMALL, fg=TEXT_SECONDARY, bg=BG_CARD)
+        info_label.pack(pady=(10, 0))
+    
+    elif mode == "delete":
+        # Ctrl/Shift-click selects several rows for one bulk delete
+        tree.configure(selectmode="extended")
+        
+        def on_delete_click(event=None):
+            selection = tree.selection()
+            if selection:
+                task_ids = [tree.item(iid)['tags'][0] for iid in selection]
                 
-                tree.bind('<Double-1>', on_delete_click)
+                if len(task_ids) == 1:
+                    task_title = tree.item(selection[0])['values'][1]
+                    prompt = f"Are you sure you want to delete this task?\n\n📋 {task_title}\n🆔 Task ID: {task_ids[0]}\n\n⚠️ This action cannot be undone."
+                else:
+                    prompt = f"Are you sure you want to delete {len(task_ids)} tasks?\n\n⚠️ This action cannot be undone."
                 
-                info_label = tk.Label(table_frame, text="⚠️ Double-click a row to delete",
-                                     font=FONT_SMALL, fg=DANGER, bg=BG_CARD)
-                info_label.pack(pady=(10, 0))
-            
-            scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=tree.yview)
-            tree.configure(yscrollcommand=scrollbar.set)
-            scrollbar.pack(side="right", fill="y")
-            tree.pack(side="left", fill="both", expand=True)
+                if messagebox.askyesno("Confirm Delete", prompt):
+                    def on_deleted(result):
+                        # Every view drops the rows in place; orphaned users/activities had no other rows
+                        events.publish(TASK_DELETED, task_ids=[int(task_id) for task_id in task_ids],
+                                       activity_ids=result["activity_ids"], user_ids=result["user_ids"],
+                                       counts=result["counts"])
+                        
+                        if not result["task_ids"]:
+                            messagebox.showwarning("Warning", "Task not found!")
+                            return
+                        
+                        if len(task_ids) == 1:
+                            message = f"✅ Task '{task_title}' deleted successfully!\n\n"
+                        else:
+                            message = f"✅ {len(result['task_ids'])} tasks deleted successfully!\n\n"
+                        messagebox.showinfo("Success", message +
+                            "The data has been permanently removed from the database.")
+                    
+                    def on_error(e):
+                        messagebox.showerror("Error", f"Failed to delete task:\n{e}")
+                    
+                    # One transaction with set-based orphan cleanup
+                    submit_query(lambda cursor: delete_tasks_with_cleanup(cursor, task_ids),
+                                 on_deleted, on_error, label="delete_tasks_with_cleanup")
         
-        else:
-            empty_state = tk.Frame(table_frame, bg=BG_CARD)
-            empty_state.pack(expand=True)
-            
-            tk.Label(empty_state, text="📭", font=("Segoe UI", 48),
-                    fg=TEXT_SECONDARY, bg=BG_CARD).pack(pady=(50, 20))
-            tk.Label(empty_state, text="No schedules found", font=FONT_HEADER,
-                    fg=TEXT_PRIMARY, bg=BG_CARD).pack()
-            tk.Label(empty_state, text="Create your first schedule to get started",
-                    font=FONT_BODY, fg=TEXT_SECONDARY, bg=BG_CARD).pack(pady=(5, 50))
+        tree.bind('<Double-1>', on_delete_click)
+        tree.bind('<Delete>', on_delete_click)
+        
+        action_row = tk.Frame(table_frame, bg=BG_CARD)
+        action_row.pack(fill="x", pady=(10, 0))
+        
+        info_label = tk.Label(action_row, text="⚠️ Double-click a row to delete | Ctrl/Shift-click to select several, then press Delete",
+                             font=FONT_SMALL, fg=DANGER, bg=BG_CARD)
+        info_label.pack(side="left")
+        
+        ModernButton(action_row, "Delete Selected", on_delete_click,
+                    style="danger", icon="🗑").pack(side="right")
     
-    except Exception as e:
-        tk.Label(table_frame, text=f"❌ Error loading schedules:\n{e}",
-                font=FONT_BODY, fg=DANGER, bg=BG_CARD).pack(expand=True)
+    scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=tree.yview)
+    tree.configure(yscrollcommand=on_scroll)
+    scrollbar.pack(side="right", fill="y")
+    tree.pack(side="left", fill="both", expand=True)
+    
+    reload()
+    return reload
 
 
 def open_update_form(task_id):
-    """Open update form in popup window"""
+    """
+    Open update form in popup window
+    
+    Saving publishes task_updated with the saved values, so every view
+    showing the task patches its rows. Edits to the name or task time are
+    checked for overlaps with the person's other tasks as they are made.
+    """
+    def on_error(e):
+        messagebox.showerror("Error", f"Failed to load task data:\n{e}")
+    
+    submit_query(lambda cursor: fetch_task(cursor, task_id),
+                 _show_update_form, on_error,
+                 group="update-form", label="fetch_task")
+
+
+def _show_update_form(data):
+    """Build the update popup for a loaded task row"""
     try:
-        conn = Database.connect()
-        cursor = conn.cursor()
-        
-        query = """
-        SELECT 
-            u.user_id, u.first_name, u.last_name,
-            a.activity_id, a.activity_name, a.category, a.priority, a.status,
-            t.task_id, t.task_title, t.description, t.date, t.time
-        FROM tasks t
-        JOIN activities a ON t.activity_id = a.activity_id
-        JOIN users u ON t.user_id = u.user_id
-        WHERE t.task_id = %s
-        """
-        cursor.execute(query, (task_id,))
-        data = cursor.fetchone()
-        conn.close()
-        
         if not data:
             messagebox.showerror("Error", "Task not found")
             return
         
-        user_id, fname, lname, activity_id, act_name, category, priority, status, task_id, title, desc, date, time = data
+        user_id, fname, lname, activity_id, act_name, category, priority, status, task_id, title, desc, date, time, duration = data
         
         # Create popup window
         popup = tk.Toplevel()
@@ -441,7 +1003,7 @@ def open_update_form(task_id):
         # Date and Time with Pickers
         dt_frame = tk.Frame(task_frame, bg=BG_CARD)
         dt_frame.pack(fill="x")
-        dt_frame.grid_columnconfigure((0, 1), weight=1)
+        dt_frame.grid_columnconfigure((0, 1, 2), weight=1)
         
         # Date Picker
         tk.Label(dt_frame, text="Date *", font=FONT_BODY,
@@ -465,6 +1027,47 @@ def open_update_form(task_id):
         if time:
             time_picker.set_time(str(time))
         
+        # Duration
+        tk.Label(dt_frame, text="Duration", font=FONT_BODY,
+                fg=TEXT_PRIMARY, bg=BG_CARD).grid(row=0, column=2, sticky="w")
+        duration_picker = DurationPicker(dt_frame)
+        duration_picker.grid(row=1, column=2, sticky="w", ipady=4)
+        duration_picker.set_minutes(duration)
+        
+        conflict_notice = ConflictNotice(task_frame)
+        pending_check = {"after": None}
+        
+        def check_conflicts(event=None):
+            """Re-check the task for overlaps once editing pauses"""
+            if pending_check["after"]:
+                popup.after_cancel(pending_check["after"])
+            pending_check["after"] = popup.after(TYPING_DEBOUNCE_MS, run_conflict_check)
+        
+        def run_conflict_check():
+            pending_check["after"] = None
+            try:
+                day = date_entry.get_date().strftime('%Y-%m-%d')
+            except ValueError:
+                return
+            first_name, last_name = fname_entry.get(), lname_entry.get()
+            slot = (title_entry.get().strip(), day, time_picker.get_time(), duration_picker.get_minutes())
+            
+            def on_error(e):
+                print(f"[ERROR] Conflict check failed: {e}")
+            
+            submit_query(lambda cursor: check_schedule(cursor, first_name, last_name, [slot],
+                                                       exclude=task_id),
+                         lambda overlaps: conflict_notice.show(overlaps[0]), on_error,
+                         group="update-conflicts", owner=conflict_notice, label="check_schedule")
+        
+        for entry in (fname_entry, lname_entry):
+            entry.bind("<KeyRelease>", check_conflicts)
+        date_entry.bind("<<DateEntrySelected>>", check_conflicts)
+        date_entry.bind("<KeyRelease>", check_conflicts)
+        time_picker.on_change(check_conflicts)
+        duration_picker.bind("<<ComboboxSelected>>", check_conflicts)
+        run_conflict_check()
+        
         # Buttons
         btn_frame = tk.Frame(scrollable, bg=BG_MAIN)
         btn_frame.pack(fill="x", padx=20, pady=20)
@@ -483,33 +1086,44 @@ def open_update_form(task_id):
                 messagebox.showerror("Validation Error", "Task title and date are required")
                 return
             
-            # Update database
-            try:
-                conn = Database.connect()
-                cursor = conn.cursor()
-                
-                # Update user
-                cursor.execute("UPDATE users SET first_name = %s, last_name = %s WHERE user_id = %s",
-                              (fname_entry.get().strip(), lname_entry.get().strip(), user_id))
-                
-                # Update activity
-                cursor.execute("UPDATE activities SET activity_name = %s, category = %s, priority = %s, status = %s WHERE activity_id = %s",
-                              (act_entry.get().strip(), cat_combo.get(), pri_combo.get(), stat_combo.get(), activity_id))
-                
-                # Update task
-                cursor.execute("UPDATE tasks SET task_title = %s, description = %s, date = %s, time = %s WHERE task_id = %s",
-                              (title_entry.get().strip(), desc_text.get("1.0", tk.END).strip(), 
-                               date_entry.get_date().strftime('%Y-%m-%d'), time_picker.get_time(), task_id))
-                
-                conn.commit()
-                conn.close()
-                
+            if conflict_notice.overlaps and not messagebox.askyesno(
+                    "Schedule Conflicts", "This task overlaps other tasks at the same time.\n\nSave anyway?",
+                    parent=popup):
+                return
+            
+            # Read the form here; the background job must not touch widgets
+            user_values = (fname_entry.get().strip(), lname_entry.get().strip(), user_id)
+            activity_values = (act_entry.get().strip(), cat_combo.get(), pri_combo.get(), stat_combo.get(), activity_id)
+            task_values = (title_entry.get().strip(), desc_text.get("1.0", tk.END).strip(), 
+                           date_entry.get_date().strftime('%Y-%m-%d'), time_picker.get_time(),
+                           duration_picker.get_minutes(), task_id)
+            
+            def on_updated(_):
                 messagebox.showinfo("Success", f"✅ Task updated successfully!")
                 popup.destroy()
-                load_manage_view("update")
-                
-            except Exception as e:
+                events.publish(TASK_UPDATED, task_ids=[task_id], activity_ids=[activity_id],
+                               user_ids=[user_id], values={
+                                   "task_id": task_id,
+                                   "user_id": user_id,
+                                   "activity_id": activity_id,
+                                   "first_name": user_values[0],
+                                   "last_name": user_values[1],
+                                   "activity_name": activity_values[0],
+                                   "category": activity_values[1],
+                                   "priority": activity_values[2],
+                                   "status": activity_values[3],
+                                   "title": task_values[0],
+                                   "date": task_values[2],
+                                   "time": task_values[3],
+                                   "duration": task_values[4]
+                               })
+            
+            def on_error(e):
                 messagebox.showerror("Database Error", f"Failed to update:\n{e}")
+            
+            # Update database
+            submit_query(lambda cursor: update_task(cursor, user_values, activity_values, task_values),
+                         on_updated, on_error, label="update_task")
         
         def cancel_update():
             popup.destroy()